@@ -0,0 +1,51 @@
+"""Benchmark locale activation with `activate` versus `activated` scopes.
+
+Compares the per-call cost of humanizing under a thread-wide `activate` with
+the same call inside a context-variable `activated` scope, both for a raw
+catalog lookup and for `time_delta`.
+
+Run with:
+
+    python benchmarks/bench_activation.py
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+import timeit
+from collections.abc import Callable
+
+import human_readable.i18n as i18n
+import human_readable.times as times
+
+
+NUMBER = 200_000
+DELTA = dt.timedelta(days=3)
+
+
+def _lookup() -> None:
+    i18n.gettext("today")
+
+
+def _time_delta() -> None:
+    times.time_delta(DELTA)
+
+
+def _per_call(func: Callable[[], None]) -> float:
+    return timeit.timeit(func, number=NUMBER) / NUMBER * 1e9
+
+
+def main() -> None:
+    """Print per-call cost in nanoseconds for both activation modes."""
+    print(f"{'function':<12}{'activate (ns)':>16}{'activated (ns)':>16}")
+    for name, func in (("gettext", _lookup), ("time_delta", _time_delta)):
+        i18n.activate("pt_BR")
+        thread_local = _per_call(func)
+        i18n.deactivate()
+        with i18n.activated("pt_BR"):
+            scoped = _per_call(func)
+        print(f"{name:<12}{thread_local:>16.1f}{scoped:>16.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Count clock reads of a batch with and without `frozen_now`.
+
+Renders a page of rows, each with a `date_time`, a `time_delta` of a
+negative timedelta, a `day` and a `year`, and reports how many times the
+system clock (`datetime.now` and `date.today`) was read and how long the
+page took, first reading the clock per call, then inside a single
+`frozen_now` block.
+
+Run with:
+
+    python benchmarks/bench_clock.py --rows 10000
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+import sys
+import time
+from collections.abc import Callable
+from types import FrameType
+from typing import Any
+
+import human_readable.times as times
+
+
+CLOCK_FUNCTIONS = {"now", "today"}
+
+
+def _page(rows: int) -> Callable[[], None]:
+    now = dt.datetime.now()
+    values = [now - dt.timedelta(minutes=7 * row) for row in range(rows)]
+
+    def render() -> None:
+        for value in values:
+            times.date_time(value)
+            times.time_delta(dt.timedelta(seconds=-7 * len(values)))
+            times.day(value.date())
+            times.year(value.date())
+
+    return render
+
+
+def _count_clock_reads(func: Callable[[], None]) -> int:
+    reads = 0
+
+    def profile(frame: FrameType, event: str, arg: Any) -> None:
+        nonlocal reads
+        if event == "c_call" and arg.__name__ in CLOCK_FUNCTIONS:
+            reads += 1
+
+    sys.setprofile(profile)
+    try:
+        func()
+    finally:
+        sys.setprofile(None)
+    return reads
+
+
+def _frozen(func: Callable[[], None]) -> Callable[[], None]:
+    def frozen() -> None:
+        with times.frozen_now():
+            func()
+
+    return frozen
+
+
+def main() -> None:
+    """Print clock reads and timings per page."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10_000)
+    args = parser.parse_args()
+
+    render = _page(args.rows)
+    print(f"{'mode':<12}{'clock reads':>14}{'page (ms)':>12}")
+    for mode, func in (("per call", render), ("frozen_now", _frozen(render))):
+        reads = _count_clock_reads(func)
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        print(f"{mode:<12}{reads:>14}{elapsed * 1e3:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Measure import time of `human_readable` with `python -X importtime`.
+
+Each statement runs in a fresh interpreter several times and the best
+cumulative import time of the modules it loads is reported. With
+`--budget`, the script exits with status 1 when importing the package
+alone takes longer than that many microseconds.
+
+Run with:
+
+    python benchmarks/bench_import.py --budget 5000
+"""
+
+from __future__ import annotations
+
+import argparse
+import subprocess
+import sys
+
+
+STATEMENTS = [
+    "import human_readable",
+    "from human_readable import file_size",
+    "from human_readable import int_comma",
+    "from human_readable import time_delta",
+    "from human_readable import Humanizer",
+]
+RUNS = 5
+
+
+def _import_time(statement: str) -> int:
+    """Return the cumulative import time, in microseconds, of `statement`."""
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    baseline = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", "pass"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # only top level imports (no leading spaces) add up to the total
+    already = {
+        line.split("|")[-1].strip() for line in baseline.stderr.splitlines()
+    }
+    total = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if name.startswith("  ") or name.strip() in already:
+            continue
+        if cumulative.strip().isdigit():
+            total += int(cumulative)
+    return total
+
+
+def main() -> int:
+    """Print import times and check the package budget."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--budget",
+        type=int,
+        help="maximum microseconds for 'import human_readable'",
+    )
+    args = parser.parse_args()
+
+    results = {}
+    for statement in STATEMENTS:
+        results[statement] = min(_import_time(statement) for _ in range(RUNS))
+        print(f"{statement:<45}{results[statement]:>10} us")
+
+    if args.budget is not None and results[STATEMENTS[0]] > args.budget:
+        print(f"'{STATEMENTS[0]}' exceeds the budget of {args.budget} us")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,110 @@
+"""Benchmark the parsers of human-readable text on many inputs.
+
+Generates `--inputs` strings written by the matching humanizing function,
+in all of its formats, then reports the time per input to parse them one
+call at a time and, for parsers with a batch variant, as a single batch.
+Parsers of localized texts run in every locale, or in `--locales`.
+
+Run with:
+
+    python benchmarks/bench_parsing.py --inputs 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+import os
+import random
+import time
+from collections.abc import Callable
+from typing import Any
+from typing import NamedTuple
+
+import human_readable.files as files
+import human_readable.i18n as i18n
+import human_readable.times as times
+
+
+class Parser(NamedTuple):
+    """Inputs of a parser and its variants."""
+
+    generate: Callable[[random.Random, int], list[str]]
+    parse: Callable[[str], Any]
+    parse_many: Callable[[list[str]], list[Any]] | None = None
+    localized: bool = False
+
+
+def _file_sizes(rng: random.Random, count: int) -> list[str]:
+    # binary and gnu flags of the decimal, binary and GNU formats
+    formats = [(False, False), (True, False), (False, True)]
+    return [
+        files.file_size(int(10 ** rng.uniform(0, 15)), *rng.choice(formats))
+        for _ in range(count)
+    ]
+
+
+def _deltas(rng: random.Random, count: int) -> list[str]:
+    # texts of precise_delta down to seconds or microseconds, and time_delta
+    formats: list[Callable[[dt.timedelta], str]] = [
+        times.precise_delta,
+        lambda delta: times.precise_delta(delta, "microseconds"),
+        times.time_delta,
+    ]
+    return [
+        rng.choice(formats)(dt.timedelta(seconds=10 ** rng.uniform(0, 9)))
+        for _ in range(count)
+    ]
+
+
+PARSERS = {
+    "parse_file_size": Parser(
+        _file_sizes, files.parse_file_size, files.parse_file_size_many
+    ),
+    "parse_delta": Parser(_deltas, times.parse_delta, localized=True),
+}
+
+
+def _locales() -> list[str]:
+    path = i18n._get_default_locale_path()
+    assert path is not None  # noqa: S101
+    return sorted(os.listdir(path))
+
+
+def main() -> None:
+    """Print the time per input of each parser, per call and in batch."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--inputs", type=int, default=1_000_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--locales",
+        nargs="+",
+        help="locales of the localized parsers, default all",
+    )
+    args = parser.parse_args()
+    locales = args.locales or ["", *_locales()]
+
+    print(f"{'parser':<30}{'per call (ns)':>16}{'batch (ns)':>14}")
+    for name, (generate, parse, parse_many, localized) in PARSERS.items():
+        for locale in locales if localized else [""]:
+            with i18n.activated(locale):
+                inputs = generate(random.Random(args.seed), args.inputs)
+
+                start = time.perf_counter()
+                for text in inputs:
+                    parse(text)
+                per_call = (time.perf_counter() - start) / args.inputs
+
+                batch = "-"
+                if parse_many is not None:
+                    start = time.perf_counter()
+                    parse_many(inputs)
+                    elapsed = time.perf_counter() - start
+                    batch = f"{elapsed / args.inputs * 1e9:.0f}"
+
+            label = f"{name}[{locale}]" if locale else name
+            print(f"{label:<30}{per_call * 1e9:>16.0f}{batch:>14}")
+
+
+if __name__ == "__main__":
+    main()
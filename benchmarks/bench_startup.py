@@ -0,0 +1,75 @@
+"""Compare the startup cost of loading every locale from files and bundle.
+
+Each mode runs in a fresh interpreter several times and the best time to
+load the catalogs of all bundled locales is reported, with the number of
+files opened to do so:
+
+- ``mo``: one ``.mo`` file per locale, parsed by ``gettext``;
+- ``mapped``: one memory-mapped ``.mo`` file per locale;
+- ``bundle``: the single generated bundle module.
+
+Like installed packages, the bundle is expected to be compiled to bytecode:
+run it without ``PYTHONDONTWRITEBYTECODE`` at least once.
+
+Run with:
+
+    python benchmarks/bench_startup.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import subprocess
+import sys
+
+
+MODES = {
+    "mo": "for locale in locales: i18n.load(locale)",
+    "mapped": (
+        "from human_readable.catalogs import MappedTranslations\n"
+        "for locale in locales: i18n.load(locale, class_=MappedTranslations)"
+    ),
+    "bundle": ("import human_readable.bundle as bundle\nbundle.install()"),
+}
+SCRIPT = """
+import json, os, sys, time
+opened = []
+sys.addaudithook(
+    lambda event, args: event == "open" and opened.append(args[0])
+)
+import human_readable.i18n as i18n
+locales = sorted(os.listdir(i18n._get_default_locale_path()))
+opened.clear()
+start = time.perf_counter()
+{code}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"elapsed": elapsed, "opened": len(opened)}}))
+"""
+
+
+def _run(code: str) -> dict[str, float]:
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", SCRIPT.format(code=code)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return dict(json.loads(result.stdout))
+
+
+def main() -> None:
+    """Print the time and files opened to load all locales in each mode."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    print(f"{'mode':<10}{'best (ms)':>12}{'files opened':>14}")
+    for mode, code in MODES.items():
+        runs = [_run(code) for _ in range(args.runs)]
+        best = min(run["elapsed"] for run in runs)
+        print(f"{mode:<10}{best * 1e3:>12.2f}{runs[0]['opened']:>14.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Benchmark `RelativeTimeTicker` against recomputing every label.
+
+Registers `--entries` datetimes spread over the last `--spread` seconds,
+then ticks once per second for `--ticks` seconds and reports, per tick, the
+time spent and the number of labels that changed. The same interval is
+compared with calling `date_time` on every entry, as a dashboard without the
+ticker would do on each refresh.
+
+Run with:
+
+    python benchmarks/bench_ticker.py --entries 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+import random
+import statistics
+import time
+
+from human_readable.ticker import RelativeTimeTicker
+from human_readable.times import date_time
+
+
+NOW = dt.datetime(2020, 2, 2, 12, 0, 0)
+# the full recomputation is timed on a sample and extrapolated
+SAMPLE = 10_000
+
+
+def main() -> None:
+    """Print registration, tick and full recomputation timings."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, default=1_000_000)
+    parser.add_argument(
+        "--spread",
+        type=int,
+        default=7 * 86_400,
+        help="seconds over which the datetimes are spread",
+    )
+    parser.add_argument("--ticks", type=int, default=60)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    values = [
+        NOW - dt.timedelta(microseconds=rng.randrange(args.spread * 1_000_000))
+        for _ in range(args.entries)
+    ]
+
+    ticker = RelativeTimeTicker()
+    start = time.perf_counter()
+    for key, value in enumerate(values):
+        ticker.add(key, value, now=NOW)
+    registration = time.perf_counter() - start
+    print(f"registration of {args.entries} entries: {registration:.2f} s")
+
+    durations = []
+    changes = []
+    for second in range(1, args.ticks + 1):
+        now = NOW + dt.timedelta(seconds=second)
+        start = time.perf_counter()
+        changed = ticker.tick(now)
+        durations.append(time.perf_counter() - start)
+        changes.append(len(changed))
+    print(
+        f"tick: {statistics.fmean(durations) * 1e3:.2f} ms mean, "
+        f"{max(durations) * 1e3:.2f} ms max, "
+        f"{statistics.fmean(changes):.0f} changed labels per tick"
+    )
+
+    sample = values[:SAMPLE]
+    start = time.perf_counter()
+    for value in sample:
+        date_time(value, when=NOW)
+    full = (time.perf_counter() - start) * len(values) / len(sample)
+    print(
+        f"recomputing all labels: {full * 1e3:.2f} ms per refresh "
+        f"({full / statistics.fmean(durations):.0f}x the mean tick)"
+    )
+
+
+if __name__ == "__main__":
+    main()
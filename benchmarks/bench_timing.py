@@ -0,0 +1,60 @@
+"""Benchmark `times.timing` with cold and warm clock-word tables.
+
+The cold column clears the clock-word cache before every call, which is what
+every call used to pay; the warm column is the steady state.
+
+Run with:
+
+    python benchmarks/bench_timing.py
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+import os
+import timeit
+
+import human_readable.i18n as i18n
+import human_readable.times as times
+
+
+TIMES = [dt.time(hour, minute) for hour in range(24) for minute in (0, 15, 42)]
+NUMBER = 20
+
+
+def _locales() -> list[str]:
+    path = i18n._get_default_locale_path()
+    assert path is not None  # noqa: S101
+    return sorted(os.listdir(path))
+
+
+def _cold() -> None:
+    for value in TIMES:
+        times._clock_words.cache_clear()
+        times.timing(value)
+
+
+def _warm() -> None:
+    for value in TIMES:
+        times.timing(value)
+
+
+def main() -> None:
+    """Print per-call cost of `timing` for every bundled locale."""
+    print(f"{'locale':<10}{'cold (us)':>12}{'warm (us)':>12}{'speedup':>10}")
+    calls = NUMBER * len(TIMES)
+    for locale in ["", *_locales()]:
+        if locale:
+            i18n.activate(locale)
+        else:
+            i18n.deactivate()
+        cold = timeit.timeit(_cold, number=NUMBER) / calls * 1e6
+        warm = timeit.timeit(_warm, number=NUMBER) / calls * 1e6
+        print(
+            f"{locale or '(none)':<10}{cold:>12.2f}{warm:>12.2f}{cold / warm:>9.1f}x"
+        )
+    i18n.deactivate()
+
+
+if __name__ == "__main__":
+    main()
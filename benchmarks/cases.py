@@ -0,0 +1,215 @@
+"""Benchmark cases for every function exported by `human_readable`."""
+
+from __future__ import annotations
+
+import array
+import datetime as dt
+import io
+from collections.abc import Callable
+from typing import Any
+from typing import NamedTuple
+
+import human_readable
+
+
+class Case(NamedTuple):
+    """One benchmarked call."""
+
+    name: str
+    func: Callable[..., Any]
+    args: tuple[Any, ...] = ()
+    kwargs: dict[str, Any] = {}
+    localized: bool = True
+
+
+# exports that are not humanizing functions
+NOT_BENCHMARKED = {
+    "Humanizer",
+    "RelativeTimeTicker",  # see bench_ticker.py
+    "activate",
+    "deactivate",
+}
+
+WHEN = dt.datetime(2020, 2, 2, 12, 0, 0)
+TODAY = dt.date.today()
+DELTA = dt.timedelta(days=2, seconds=3633, microseconds=123000)
+SIZES = [7**i for i in range(1, 23)] * 45
+DELTAS = [dt.timedelta(seconds=11**i) for i in range(10)] * 100
+HOSTS = [f"host-{i}.example.com" for i in range(1000)]
+
+
+def _write_listing(items: list[str], *args: Any, **kwargs: Any) -> None:
+    human_readable.write_listing(items, io.StringIO(), *args, **kwargs)
+
+
+_DELTA_TEXTS: dict[Any, str] = {}
+
+
+def _parse_delta(delta: dt.timedelta) -> dt.timedelta:
+    # parses the text of the active locale, written once per catalog
+    translation = human_readable.i18n.get_translation()
+    text = _DELTA_TEXTS.get(translation)
+    if text is None:
+        text = _DELTA_TEXTS[translation] = human_readable.precise_delta(delta)
+    return human_readable.parse_delta(text)
+
+
+CASES = [
+    Case("ap_number", human_readable.ap_number, (7,)),
+    Case("date/near", human_readable.date, (TODAY,)),
+    Case("date/far", human_readable.date, (TODAY - dt.timedelta(days=400),)),
+    Case("date_time/seconds", human_readable.date_time, (42,)),
+    Case(
+        "date_time/datetime",
+        human_readable.date_time,
+        (WHEN - dt.timedelta(days=3),),
+        {"when": WHEN},
+    ),
+    Case(
+        "date_time_and_next_change",
+        human_readable.date_time_and_next_change,
+        (WHEN - dt.timedelta(minutes=5, seconds=30),),
+        {"when": WHEN},
+    ),
+    Case("day/today", human_readable.day, (TODAY,)),
+    Case("day/other", human_readable.day, (TODAY - dt.timedelta(days=9),)),
+    Case("file_size", human_readable.file_size, (2900000,), localized=False),
+    Case(
+        "file_size/gnu",
+        human_readable.file_size,
+        (2900000,),
+        {"gnu": True},
+        localized=False,
+    ),
+    Case(
+        "file_size_many/list",
+        human_readable.file_size_many,
+        (SIZES,),
+        localized=False,
+    ),
+    Case(
+        "file_size_many/array",
+        human_readable.file_size_many,
+        (array.array("q", SIZES),),
+        localized=False,
+    ),
+    Case("fractional", human_readable.fractional, (1.3,), localized=False),
+    Case(
+        "fractional_many",
+        human_readable.fractional_many,
+        ([i / 7 for i in range(1000)],),
+        localized=False,
+    ),
+    Case("int_comma/int", human_readable.int_comma, (1234567890,)),
+    Case("int_comma/float", human_readable.int_comma, (1234567.25,)),
+    Case("int_comma/big", human_readable.int_comma, (7**200,)),
+    Case("int_comma_many", human_readable.int_comma_many, (SIZES,)),
+    Case(
+        "parse_file_size",
+        human_readable.parse_file_size,
+        ("2.8 MiB",),
+        localized=False,
+    ),
+    Case(
+        "parse_file_size_many",
+        human_readable.parse_file_size_many,
+        (human_readable.file_size_many(SIZES, gnu=True),),
+        localized=False,
+    ),
+    Case("int_word", human_readable.int_word, (123455913,)),
+    Case("int_word/exact", human_readable.int_word, (7**50, ".1f", True)),
+    Case("int_word_many", human_readable.int_word_many, (SIZES,)),
+    Case("listing", human_readable.listing, (HOSTS[:5], ",", "and")),
+    Case(
+        "listing/long",
+        human_readable.listing,
+        (HOSTS, ",", "and"),
+        localized=False,
+    ),
+    Case(
+        "listing/max_items",
+        human_readable.listing,
+        (HOSTS, ",", "and"),
+        {"max_items": 3},
+    ),
+    Case("ordinal", human_readable.ordinal, (113,)),
+    Case("ordinal_many", human_readable.ordinal_many, (range(1, 1001),)),
+    Case("parse_delta", _parse_delta, (DELTA,)),
+    Case(
+        "parse_delta/constant",
+        human_readable.parse_delta,
+        ("an hour",),
+        localized=False,
+    ),
+    Case("precise_delta", human_readable.precise_delta, (DELTA,)),
+    Case(
+        "precise_delta/suppress",
+        human_readable.precise_delta,
+        (DELTA,),
+        {"minimum_unit": "microseconds", "suppress": ["days"]},
+    ),
+    Case(
+        "scientific_notation",
+        human_readable.scientific_notation,
+        (-0.000123,),
+        localized=False,
+    ),
+    Case(
+        "scientific_notation/positive",
+        human_readable.scientific_notation,
+        (5781651000.5,),
+        localized=False,
+    ),
+    Case(
+        "scientific_notation_many",
+        human_readable.scientific_notation_many,
+        ([1.5**i for i in range(-500, 500)],),
+        localized=False,
+    ),
+    Case("time_delta/seconds", human_readable.time_delta, (42,)),
+    Case(
+        "time_delta/months",
+        human_readable.time_delta,
+        (dt.timedelta(days=95),),
+    ),
+    Case(
+        "time_delta/years", human_readable.time_delta, (dt.timedelta(days=900),)
+    ),
+    Case("time_delta_many", human_readable.time_delta_many, (DELTAS,)),
+    Case(
+        "time_delta_many/datetimes",
+        human_readable.time_delta_many,
+        ([WHEN - delta for delta in DELTAS],),
+        {"when": WHEN},
+    ),
+    Case("time_of_day", human_readable.time_of_day, (17,)),
+    Case("timing/formal", human_readable.timing, (dt.time(6, 59),)),
+    Case(
+        "timing/informal",
+        human_readable.timing,
+        (dt.time(21, 40),),
+        {"formal": False},
+    ),
+    Case(
+        "write_listing",
+        _write_listing,
+        (HOSTS, ",", "and"),
+        localized=False,
+    ),
+    Case("year", human_readable.year, (TODAY,)),
+]
+
+
+def check_coverage() -> None:
+    """Fail if an exported function has no benchmark case.
+
+    Raises:
+        RuntimeError: when a function exported by `human_readable` is missing.
+
+    """
+    benchmarked = {case.name.split("/")[0] for case in CASES}
+    missing = set(human_readable.__all__) - NOT_BENCHMARKED - benchmarked
+    if missing:
+        raise RuntimeError(
+            f"No benchmark cases for: {', '.join(sorted(missing))}"
+        )
@@ -0,0 +1,155 @@
+"""Run the benchmark suite and compare results.
+
+Every case in `cases.py` is timed in the style of pyperf: the number of
+loops is calibrated so that one sample lasts at least `--min-time`, then
+`--samples` samples are taken and their per-call mean, standard deviation
+and minimum are recorded. Localized cases run once per bundled locale, plus
+once without any locale.
+
+Run the suite and save the results:
+
+    python benchmarks/run.py run --output before.json
+
+Compare two runs, exiting with status 1 if a case got slower than the
+threshold (10% by default):
+
+    python benchmarks/run.py compare before.json after.json --threshold 0.1
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+import fnmatch
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import timeit
+from typing import Any
+
+import cases
+
+import human_readable.i18n as i18n
+
+
+def _locales() -> list[str]:
+    path = i18n._get_default_locale_path()
+    assert path is not None  # noqa: S101
+    return sorted(os.listdir(path))
+
+
+def _bench(case: cases.Case, samples: int, min_time: float) -> dict[str, Any]:
+    timer = timeit.Timer(lambda: case.func(*case.args, **case.kwargs))
+    loops = 1
+    while timer.timeit(loops) < min_time:
+        loops *= 2
+    per_call = [timer.timeit(loops) / loops for _ in range(samples)]
+    return {
+        "loops": loops,
+        "mean": statistics.fmean(per_call),
+        "stdev": statistics.stdev(per_call) if samples > 1 else 0.0,
+        "min": min(per_call),
+        "samples": per_call,
+    }
+
+
+def run(args: argparse.Namespace) -> int:
+    """Time every case and write the results to a JSON file."""
+    cases.check_coverage()
+    locales = args.locales or ["", *_locales()]
+    results: dict[str, Any] = {}
+    for case in cases.CASES:
+        if not any(
+            fnmatch.fnmatch(case.name, pattern) for pattern in args.cases
+        ):
+            continue
+        for locale in locales if case.localized else [""]:
+            name = f"{case.name}[{locale}]" if locale else case.name
+            with i18n.activated(locale):
+                results[name] = _bench(case, args.samples, args.min_time)
+            print(f"{name:<45}{results[name]['mean'] * 1e6:>12.3f} us")
+    report = {
+        "metadata": {
+            "date": dt.datetime.now().isoformat(timespec="seconds"),
+            "python": sys.version,
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "samples": args.samples,
+            "min_time": args.min_time,
+        },
+        "benchmarks": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as output:
+        json.dump(report, output, indent=2)
+    print(f"Results written to {args.output}")
+    return 0
+
+
+def compare(args: argparse.Namespace) -> int:
+    """Compare two result files and flag regressions beyond the threshold."""
+    with open(args.base, encoding="utf-8") as base_file:
+        base = json.load(base_file)["benchmarks"]
+    with open(args.new, encoding="utf-8") as new_file:
+        new = json.load(new_file)["benchmarks"]
+    regressions = 0
+    print(f"{'benchmark':<45}{'base (us)':>12}{'new (us)':>12}{'change':>10}")
+    for name in sorted(base.keys() & new.keys()):
+        ratio = new[name]["mean"] / base[name]["mean"]
+        flag = ""
+        if ratio > 1 + args.threshold:
+            regressions += 1
+            flag = "  REGRESSION"
+        print(
+            f"{name:<45}{base[name]['mean'] * 1e6:>12.3f}"
+            f"{new[name]['mean'] * 1e6:>12.3f}{ratio - 1:>+10.1%}{flag}"
+        )
+    for name in sorted(base.keys() ^ new.keys()):
+        print(f"{name:<45} only in {'base' if name in base else 'new'}")
+    print(f"{regressions} regression(s) beyond {args.threshold:.0%}")
+    return 1 if regressions else 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Parse command line arguments and run the chosen command."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="run the benchmark suite")
+    run_parser.add_argument(
+        "--output",
+        default=f"benchmarks-{time.strftime('%Y%m%d-%H%M%S')}.json",
+        help="JSON file to write results to",
+    )
+    run_parser.add_argument(
+        "--cases",
+        nargs="+",
+        default=["*"],
+        help="glob patterns of case names to run, e.g. 'time_delta/*'",
+    )
+    run_parser.add_argument(
+        "--locales", nargs="+", help="locales to run localized cases in"
+    )
+    run_parser.add_argument("--samples", type=int, default=5)
+    run_parser.add_argument("--min-time", type=float, default=0.01)
+    run_parser.set_defaults(handler=run)
+
+    compare_parser = commands.add_parser("compare", help="compare two runs")
+    compare_parser.add_argument("base", help="JSON file of the reference run")
+    compare_parser.add_argument("new", help="JSON file of the run to check")
+    compare_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="relative slowdown flagged as regression",
+    )
+    compare_parser.set_defaults(handler=compare)
+
+    args = parser.parse_args(argv)
+    return int(args.handler(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -128,7 +128,12 @@ def tests(session: nox.Session) -> None:
     """Run the test suite."""
     session.install(".")
     session.install(
-        "coverage[toml]", "pytest", "pytest_mock", "pygments", "freezegun"
+        "coverage[toml]",
+        "pytest",
+        "pytest_mock",
+        "pygments",
+        "freezegun",
+        "numpy",
     )
     try:
         session.run(
@@ -157,11 +162,19 @@ def typeguard(session: nox.Session) -> None:
     """Runtime type checking using Typeguard."""
     session.install(".")
     session.install(
-        "pytest", "pytest_mock", "freezegun", "typeguard", "pygments"
+        "pytest", "pytest_mock", "freezegun", "typeguard", "pygments", "numpy"
     )
     session.run("pytest", f"--typeguard-packages={package}", *session.posargs)
 
 
+@nox.session(python=python_versions[0])
+def benchmarks(session: nox.Session) -> None:
+    """Run the benchmark suite or compare two of its runs."""
+    args = session.posargs or ["run"]
+    session.install(".")
+    session.run("python", "benchmarks/run.py", *args)
+
+
 @nox.session(python=python_versions)
 def xdoctest(session: nox.Session) -> None:
     """Run examples with xdoctest."""
@@ -1,42 +1,152 @@
 """Human Readable."""
 
-from human_readable.files import file_size
-from human_readable.i18n import activate
-from human_readable.i18n import deactivate
-from human_readable.lists import listing
-from human_readable.numbers import ap_number
-from human_readable.numbers import fractional
-from human_readable.numbers import int_comma
-from human_readable.numbers import int_word
-from human_readable.numbers import ordinal
-from human_readable.numbers import scientific_notation
-from human_readable.times import date
-from human_readable.times import date_time
-from human_readable.times import day
-from human_readable.times import precise_delta
-from human_readable.times import time_delta
-from human_readable.times import time_of_day
-from human_readable.times import timing
-from human_readable.times import year
+from __future__ import annotations
+
+import importlib
+
+
+# `typing` itself is slow to import, so it is only imported by type checkers
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Any
+
+    from human_readable.files import file_size
+    from human_readable.files import file_size_many
+    from human_readable.files import parse_file_size
+    from human_readable.files import parse_file_size_many
+    from human_readable.humanizer import Humanizer
+    from human_readable.i18n import activate
+    from human_readable.i18n import deactivate
+    from human_readable.lists import listing
+    from human_readable.lists import write_listing
+    from human_readable.numbers import ap_number
+    from human_readable.numbers import fractional
+    from human_readable.numbers import fractional_many
+    from human_readable.numbers import int_comma
+    from human_readable.numbers import int_comma_many
+    from human_readable.numbers import int_word
+    from human_readable.numbers import int_word_many
+    from human_readable.numbers import ordinal
+    from human_readable.numbers import ordinal_many
+    from human_readable.numbers import scientific_notation
+    from human_readable.numbers import scientific_notation_many
+    from human_readable.ticker import RelativeTimeTicker
+    from human_readable.times import date
+    from human_readable.times import date_time
+    from human_readable.times import date_time_and_next_change
+    from human_readable.times import day
+    from human_readable.times import parse_delta
+    from human_readable.times import precise_delta
+    from human_readable.times import time_delta
+    from human_readable.times import time_delta_many
+    from human_readable.times import time_of_day
+    from human_readable.times import timing
+    from human_readable.times import year
 
 
 __all__ = [
+    "Humanizer",
+    "RelativeTimeTicker",
     "activate",
     "ap_number",
     "date",
     "date_time",
+    "date_time_and_next_change",
     "day",
     "deactivate",
     "file_size",
+    "file_size_many",
     "fractional",
+    "fractional_many",
     "int_comma",
+    "int_comma_many",
     "int_word",
+    "int_word_many",
     "listing",
     "ordinal",
+    "ordinal_many",
+    "parse_delta",
+    "parse_file_size",
+    "parse_file_size_many",
     "precise_delta",
     "scientific_notation",
+    "scientific_notation_many",
     "time_delta",
+    "time_delta_many",
     "time_of_day",
     "timing",
+    "write_listing",
     "year",
 ]
+
+# Submodules, and the module of every public name, are imported on first
+# attribute access (PEP 562) so that importing the package stays cheap.
+_SUBMODULES = {
+    "bundle",
+    "catalogs",
+    "files",
+    "humanizer",
+    "i18n",
+    "instrumentation",
+    "lists",
+    "numbers",
+    "ticker",
+    "times",
+}
+_LAZY_ATTRIBUTES = {
+    "file_size": "human_readable.files",
+    "file_size_many": "human_readable.files",
+    "Humanizer": "human_readable.humanizer",
+    "activate": "human_readable.i18n",
+    "deactivate": "human_readable.i18n",
+    "listing": "human_readable.lists",
+    "write_listing": "human_readable.lists",
+    "ap_number": "human_readable.numbers",
+    "fractional": "human_readable.numbers",
+    "fractional_many": "human_readable.numbers",
+    "int_comma": "human_readable.numbers",
+    "int_comma_many": "human_readable.numbers",
+    "int_word": "human_readable.numbers",
+    "int_word_many": "human_readable.numbers",
+    "ordinal": "human_readable.numbers",
+    "ordinal_many": "human_readable.numbers",
+    "parse_delta": "human_readable.times",
+    "parse_file_size": "human_readable.files",
+    "parse_file_size_many": "human_readable.files",
+    "scientific_notation": "human_readable.numbers",
+    "scientific_notation_many": "human_readable.numbers",
+    "RelativeTimeTicker": "human_readable.ticker",
+    "date": "human_readable.times",
+    "date_time": "human_readable.times",
+    "date_time_and_next_change": "human_readable.times",
+    "day": "human_readable.times",
+    "precise_delta": "human_readable.times",
+    "time_delta": "human_readable.times",
+    "time_delta_many": "human_readable.times",
+    "time_of_day": "human_readable.times",
+    "timing": "human_readable.times",
+    "year": "human_readable.times",
+}
+
+
+# defined for the interpreter only: type checkers read the public names from
+# the imports above, and report misspelled ones
+if not TYPE_CHECKING:
+
+    def __getattr__(name: str) -> Any:
+        """Import public names and submodules on first access."""
+        if name in _SUBMODULES:
+            return importlib.import_module(f"{__name__}.{name}")
+        try:
+            module = _LAZY_ATTRIBUTES[name]
+        except KeyError:
+            raise AttributeError(
+                f"module {__name__!r} has no attribute {name!r}"
+            ) from None
+        value = getattr(importlib.import_module(module), name)
+        globals()[name] = value
+        return value
+
+    def __dir__() -> list[str]:
+        """List public names, including the ones not imported yet."""
+        return sorted({*globals(), *__all__, *_SUBMODULES})
@@ -0,0 +1,2089 @@
+"""Catalogs of every bundled locale.
+
+Generated by ``python -m human_readable.bundle`` from the ``.mo`` files of
+the ``locale`` folder, do not edit.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+
+
+def _plural_0(n: int) -> int:
+    return int((n != 1))
+
+
+def _plural_1(n: int) -> int:
+    return int((n > 1))
+
+
+def _plural_2(n: int) -> int:
+    return int(0)
+
+
+def _plural_3(n: int) -> int:
+    return int((0 if (n == 1) else (1 if ((((n % 10) >= 2) and ((n % 10) <= 4)) and (((n % 100) < 10) or ((n % 100) >= 20))) else 2)))
+
+
+def _plural_4(n: int) -> int:
+    return int((0 if (((n % 10) == 1) and ((n % 100) != 11)) else (1 if ((((n % 10) >= 2) and ((n % 10) <= 4)) and (((n % 100) < 10) or ((n % 100) >= 20))) else 2)))
+
+
+def _plural_5(n: int) -> int:
+    return int((0 if (n == 1) else (1 if ((n >= 2) and (n <= 4)) else 2)))
+
+
+CATALOGS: dict[
+    str,
+    tuple[
+        Callable[[int], int],
+        dict[str, str],
+        dict[str | tuple[str, int], str],
+    ],
+] = {
+    'de_DE': (
+        _plural_0,
+        {
+            'content-transfer-encoding': '8bit',
+            'content-type': 'text/plain; charset=utf-8',
+            'generated-by': 'Christian Klein',
+            'language': 'de',
+            'language-team': 'German',
+            'last-translator': 'Christian Klein <chris@5711.org>',
+            'mime-version': '1.0',
+            'plural-forms': 'nplurals=2; plural=(n != 1);',
+            'po-revision-date': '2021-03-07 19:53+0100',
+            'project-id-version': 'humanize',
+            'report-msgid-bugs-to': '',
+            'x-generator': 'Poedit 2.4.1',
+        },
+        {
+            '': 'Project-Id-Version: humanize\nReport-Msgid-Bugs-To: \nPO-Revision-Date: 2021-03-07 19:53+0100\nLast-Translator: Christian Klein <chris@5711.org>\nLanguage-Team: German\nLanguage: de\nMIME-Version: 1.0\nContent-Type: text/plain; charset=utf-8\nContent-Transfer-Encoding: 8bit\nPlural-Forms: nplurals=2; plural=(n != 1);\nGenerated-By: Christian Klein\nX-Generator: Poedit 2.4.1\n',
+            '0\x04th': '.',
+            '1 year, 1 month': 'ein Jahr und ein Monat',
+            '1\x04st': '.',
+            '2\x04nd': '.',
+            '3\x04rd': '.',
+            '4\x04th': '.',
+            '5\x04th': '.',
+            '6\x04th': '.',
+            '7\x04th': '.',
+            '8\x04th': '.',
+            '9\x04th': '.',
+            'a day': 'ein Tag',
+            'a minute': 'eine Minute',
+            'a moment': 'ein Moment',
+            'a month': 'ein Monat',
+            'a second': 'eine Sekunde',
+            'a year': 'ein Jahr',
+            'afternoon': 'Nachmittag',
+            'an hour': 'eine Stunde',
+            'billion': 'Milliarde',
+            'decillion': 'Quintilliarde',
+            'eight': 'acht',
+            'evening': 'Abend',
+            'five': 'fünf',
+            'four': 'vier',
+            'googol': 'Googol',
+            'last year': 'letztes Jahr',
+            'midnight': 'Mitternacht',
+            'million': 'Million',
+            'morning': 'Morgen',
+            'next year': 'nächstes Jahr',
+            'nine': 'neun',
+            'nonillion': 'Quintillion',
+            'noon': 'Mittag',
+            'now': 'jetzt',
+            'octillion': 'Quadrillarde',
+            'one': 'eins',
+            'quadrillion': 'Billiarde',
+            'quintillion': 'Trillion',
+            'septillion': 'Quadrillion',
+            'seven': 'sieben',
+            'sextillion': 'Trilliarde',
+            'six': 'sechs',
+            'this year': 'dieses Jahr',
+            'three': 'drei',
+            'today': 'heute',
+            'tomorrow': 'morgen',
+            'trillion': 'Billion',
+            'two': 'zwei',
+            'yesterday': 'gestern',
+            'zero': 'null',
+            '{head} and {tail}': '{head} und {tail}',
+            '{time_difference} ago': 'vor {time_difference}',
+            '{time_difference} from now': '{time_difference} ab jetzt',
+            ("{hour_count} o'clock", 0): '{hour_count} Uhr',
+            ("{hour_count} o'clock", 1): '{hour_count} Uhr',
+            ('1 year, {amount} day', 0): 'ein Jahr und {amount} Tag',
+            ('1 year, {amount} day', 1): 'ein Jahr und {amount} Tage',
+            ('1 year, {amount} month', 0): 'ein Jahr und {amount} Monat',
+            ('1 year, {amount} month', 1): 'ein Jahr und {amount} Monate',
+            ('{amount} day', 0): '{amount} Tag',
+            ('{amount} day', 1): '{amount} Tage',
+            ('{amount} hour', 0): '{amount} Stunde',
+            ('{amount} hour', 1): '{amount} Stunden',
+            ('{amount} microsecond', 0): '{amount} Mikrosekunde',
+            ('{amount} microsecond', 1): '{amount} Mikrosekunden',
+            ('{amount} millisecond', 0): '{amount} Millisekunde',
+            ('{amount} millisecond', 1): '{amount} Millisekunden',
+            ('{amount} minute', 0): '{amount} Minute',
+            ('{amount} minute', 1): '{amount} Minuten',
+            ('{amount} month', 0): '{amount} Monat',
+            ('{amount} month', 1): '{amount} Monate',
+            ('{amount} more', 0): '{amount} weitere',
+            ('{amount} more', 1): '{amount} weitere',
+            ('{amount} second', 0): '{amount} Sekunde',
+            ('{amount} second', 1): '{amount} Sekunden',
+            ('{amount} year', 0): '{amount} Jahr',
+            ('{amount} year', 1): '{amount} Jahre',
+        },
+    ),
+    'en_ABBR': (
+        _plural_0,
+        {
+            'content-transfer-encoding': '8bit',
+            'content-type': 'text/plain; charset=utf-8',
+            'generated-by': 'Allen Luce',
+            'language': 'en',
+            'language-team': 'English',
+            'last-translator': 'Allen Luce <allen@github.con.com>',
+            'mime-version': '1.0',
+            'plural-forms': 'nplurals=2; plural=(n != 1);',
+            'po-revision-date': '2021-03-07 18:34+0100',
+            'project-id-version': 'humanize',
+            'report-msgid-bugs-to': '',
+            'x-generator': 'Poedit 2.4.1',
+        },
+        {
+            '': 'Project-Id-Version: humanize\nReport-Msgid-Bugs-To: \nPO-Revision-Date: 2021-03-07 18:34+0100\nLast-Translator: Allen Luce <allen@github.con.com>\nLanguage-Team: English\nLanguage: en\nMIME-Version: 1.0\nContent-Type: text/plain; charset=utf-8\nContent-Transfer-Encoding: 8bit\nPlural-Forms: nplurals=2; plural=(n != 1);\nGenerated-By: Allen Luce\nX-Generator: Poedit 2.4.1\n',
+            '1 year, 1 month': '1y 1M',
+            'a day': '1d',
+            'a minute': '1m',
+            'a month': '1M',
+            'a second': '1s',
+            'a year': '1y',
+            'an hour': '1h',
+            'billion': 'B',
+            'decillion': 'Dc',
+            'googol': 'Go',
+            'million': 'M',
+            'nonillion': 'No',
+            'octillion': 'Oc',
+            'quadrillion': 'Q',
+            'quintillion': 'Qt',
+            'septillion': 'Sp',
+            'sextillion': 'Sx',
+            'trillion': 'T',
+            '{time_difference} ago': '{time_difference}',
+            '{time_difference} from now': '{time_difference}',
+            ('1 year, {amount} day', 0): '1y {amount}d',
+            ('1 year, {amount} day', 1): '1y {amount}d',
+            ('1 year, {amount} month', 0): '1y {amount}M',
+            ('1 year, {amount} month', 1): '1y {amount}M',
+            ('{amount} day', 0): '{amount}d',
+            ('{amount} day', 1): '{amount}d',
+            ('{amount} hour', 0): '{amount}h',
+            ('{amount} hour', 1): '{amount}h',
+            ('{amount} microsecond', 0): '{amount}s',
+            ('{amount} microsecond', 1): '{amount}s',
+            ('{amount} millisecond', 0): '{amount}s',
+            ('{amount} millisecond', 1): '{amount}s',
+            ('{amount} minute', 0): '{amount}m',
+            ('{amount} minute', 1): '{amount}m',
+            ('{amount} month', 0): '{amount}M',
+            ('{amount} month', 1): '{amount}M',
+            ('{amount} more', 0): '+{amount}',
+            ('{amount} more', 1): '+{amount}',
+            ('{amount} second', 0): '{amount}s',
+            ('{amount} second', 1): '{amount}s',
+            ('{amount} year', 0): '{amount}y',
+            ('{amount} year', 1): '{amount}y',
+        },
+    ),
+    'es_ES': (
+        _plural_0,
+        {
+            'content-transfer-encoding': '8bit',
+            'content-type': 'text/plain; charset=UTF-8',
+            'language': 'es_ES',
+            'language-team': '',
+            'last-translator': 'Álvaro Mondéjar <mondejar1994@gmail.com>',
+            'mime-version': '1.0',
+            'plural-forms': 'nplurals=2; plural=(n != 1);',
+            'po-revision-date': '2021-03-07 19:50+0100',
+            'project-id-version': '',
+            'report-msgid-bugs-to': '',
+            'x-generator': 'Poedit 2.4.1',
+        },
+        {
+            '': 'Project-Id-Version: \nReport-Msgid-Bugs-To: \nPO-Revision-Date: 2021-03-07 19:50+0100\nLast-Translator: Álvaro Mondéjar <mondejar1994@gmail.com>\nLanguage-Team: \nLanguage: es_ES\nMIME-Version: 1.0\nContent-Type: text/plain; charset=UTF-8\nContent-Transfer-Encoding: 8bit\nPlural-Forms: nplurals=2; plural=(n != 1);\nX-Generator: Poedit 2.4.1\n',
+            '0\x04th': 'º',
+            '1 year, 1 month': '1 año y 1 mes',
+            '1\x04st': 'º',
+            '2\x04nd': 'º',
+            '3\x04rd': 'º',
+            '4\x04th': 'º',
+            '5\x04th': 'º',
+            '6\x04th': 'º',
+            '7\x04th': 'º',
+            '8\x04th': 'º',
+            '9\x04th': 'º',
+            'a day': 'un día',
+            'a minute': 'un minuto',
+            'a moment': 'un momento',
+            'a month': 'un mes',
+            'a second': 'un segundo',
+            'a year': 'un año',
+            'afternoon': 'tarde',
+            'an hour': 'una hora',
+            'billion': 'billón',
+            'decillion': 'decillón',
+            'eight': 'ocho',
+            'evening': 'noche',
+            'five': 'cinco',
+            'four': 'cuatro',
+            'googol': 'gúgol',
+            'last year': 'el año passado',
+            'midnight': 'medianoche',
+            'million': 'millón',
+            'morning': 'mañana',
+            'next year': 'el próximo año',
+            'nine': 'nueve',
+            'nonillion': 'nonillón',
+            'noon': 'mediodía',
+            'now': 'ahora',
+            'octillion': 'octillón',
+            'one': 'uno',
+            'quadrillion': 'quatrillón',
+            'quintillion': 'quintillón',
+            'septillion': 'septillón',
+            'seven': 'siete',
+            'sextillion': 'sextillón',
+            'six': 'seis',
+            'this year': 'este año',
+            'three': 'tres',
+            'today': 'hoy',
+            'tomorrow': 'mañana',
+            'trillion': 'trillón',
+            'two': 'dos',
+            'yesterday': 'ayer',
+            'zero': 'cero',
+            '{head} and {tail}': '{head} y {tail}',
+            '{time_difference} ago': 'hace {time_difference}',
+            '{time_difference} from now': 'en {time_difference}',
+            ("{hour_count} o'clock", 0): '{hour_count} en punto',
+            ("{hour_count} o'clock", 1): '{hour_count} en punto',
+            ('1 year, {amount} day', 0): '1 año y {amount} día',
+            ('1 year, {amount} day', 1): '1 año y {amount} días',
+            ('1 year, {amount} month', 0): '1 año y {amount} mes',
+            ('1 year, {amount} month', 1): '1 año y {amount} meses',
+            ('{amount} day', 0): '{amount} dia',
+            ('{amount} day', 1): '{amount} dias',
+            ('{amount} hour', 0): '{amount} hora',
+            ('{amount} hour', 1): '{amount} horas',
+            ('{amount} microsecond', 0): '{amount} microsegundo',
+            ('{amount} microsecond', 1): '{amount} microsegundos',
+            ('{amount} millisecond', 0): '{amount} milisegundo',
+            ('{amount} millisecond', 1): '{amount} milisegundos',
+            ('{amount} minute', 0): '{amount} minuto',
+            ('{amount} minute', 1): '{amount} minutos',
+            ('{amount} month', 0): '{amount} mes',
+            ('{amount} month', 1): '{amount} meses',
+            ('{amount} more', 0): '{amount} más',
+            ('{amount} more', 1): '{amount} más',
+            ('{amount} second', 0): '{amount} segundo',
+            ('{amount} second', 1): '{amount} segundos',
+            ('{amount} year', 0): '{amount} año',
+            ('{amount} year', 1): '{amount} años',
+        },
+    ),
+    'fa_IR': (
+        _plural_0,
+        {
+            'content-transfer-encoding': '8bit',
+            'content-type': 'text/plain; charset=utf-8',
+            'generated-by': 'Christian Klein',
+            'language': 'de',
+            'language-team': 'German',
+            'last-translator': 'Christian Klein <chris@5711.org>',
+            'mime-version': '1.0',
+            'plural-forms': 'nplurals=2; plural=(n != 1);',
+            'po-revision-date': '2021-03-07 19:48+0100',
+            'project-id-version': 'humanize',
+            'report-msgid-bugs-to': '',
+            'x-generator': 'Poedit 2.4.1',
+        },
+        {
+            '': 'Project-Id-Version: humanize\nReport-Msgid-Bugs-To: \nPO-Revision-Date: 2021-03-07 19:48+0100\nLast-Translator: Christian Klein <chris@5711.org>\nLanguage-Team: German\nLanguage: de\nMIME-Version: 1.0\nContent-Type: text/plain; charset=utf-8\nContent-Transfer-Encoding: 8bit\nPlural-Forms: nplurals=2; plural=(n != 1);\nGenerated-By: Christian Klein\nX-Generator: Poedit 2.4.1\n',
+            '0\x04th': '.',
+            '1 year, 1 month': '۱ سال و ۱ ماه',
+            '1\x04st': 'اولین',
+            '2\x04nd': 'دومین',
+            '3\x04rd': 'سومین',
+            '4\x04th': 'چهارمین',
+            '5\x04th': 'پنجمین',
+            '6\x04th': 'ششمین',
+            '7\x04th': 'هفتمین',
+            '8\x04th': 'هشتمین',
+            '9\x04th': 'نهمین',
+            'a day': 'یک روز',
+            'a minute': 'یک دقیقه',
+            'a moment': 'یک لحظه',
+            'a month': 'یک ماه',
+            'a second': 'یک ثانیه',
+            'a year': 'یک سال',
+            'an hour': 'یک ساعت',
+            'billion': 'میلیارد',
+            'decillion': 'دسیلیون',
+            'eight': 'هشت',
+            'five': 'پنج',
+            'four': 'چهار',
+            'googol': 'گوگول',
+            'million': 'میلیون',
+            'nine': 'نه',
+            'nonillion': 'نونیلیون',
+            'now': 'اکنون',
+            'octillion': 'اوکتیلیون',
+            'one': 'یک',
+            'quadrillion': 'کوادریلیون',
+            'quintillion': 'کوانتیلیون',
+            'septillion': 'سپتیلیون',
+            'seven': 'هفت',
+            'sextillion': 'سکستیلیون',
+            'six': 'شش',
+            'three': 'سه',
+            'today': 'امروز',
+            'tomorrow': 'فردا',
+            'trillion': 'ترلیون',
+            'two': 'دو',
+            'yesterday': 'دیروز',
+            '{time_difference} ago': '{time_difference} پیش',
+            '{time_difference} from now': '{time_difference} تا به اکنون',
+            ('1 year, {amount} day', 0): '۱ سال و {amount} روز',
+            ('1 year, {amount} day', 1): '۱ سال و {amount} روز',
+            ('1 year, {amount} month', 0): '۱ سال و {amount} ماه',
+            ('1 year, {amount} month', 1): '۱ سال و {amount} ماه',
+            ('{amount} day', 0): '{amount} روز',
+            ('{amount} day', 1): '{amount} روز',
+            ('{amount} hour', 0): '{amount} ساعت',
+            ('{amount} hour', 1): '{amount} ساعت',
+            ('{amount} minute', 0): '{amount} دقیقه',
+            ('{amount} minute', 1): '{amount} دقیقه',
+            ('{amount} month', 0): 'ماه {amount}',
+            ('{amount} month', 1): 'ماه {amount}',
+            ('{amount} more', 0): '{amount} مورد دیگر',
+            ('{amount} more', 1): '{amount} مورد دیگر',
+            ('{amount} second', 0): '{amount} ثانیه',
+            ('{amount} second', 1): '{amount} ثانیه',
+            ('{amount} year', 0): '{amount} سال',
+            ('{amount} year', 1): '{amount} سال',
+        },
+    ),
+    'fi_FI': (
+        _plural_0,
+        {
+            'content-transfer-encoding': '8bit',
+            'content-type': 'text/plain; charset=UTF-8',
+            'language': 'fi',
+            'language-team': 'Finnish',
+            'last-translator': 'Ville Skyttä <ville.skytta@iki.fi>',
+            'mime-version': '1.0',
+            'plural-forms': 'nplurals=2; plural=(n != 1);',
+            'po-revision-date': '2021-03-07 20:06+0100',
+            'project-id-version': 'humanize',
+            'report-msgid-bugs-to': '',
+            'x-generator': 'Poedit 2.4.1',
+        },
+        {
+            '': 'Project-Id-Version: humanize\nReport-Msgid-Bugs-To: \nPO-Revision-Date: 2021-03-07 20:06+0100\nLast-Translator: Ville Skyttä <ville.skytta@iki.fi>\nLanguage-Team: Finnish\nLanguage: fi\nMIME-Version: 1.0\nContent-Type: text/plain; charset=UTF-8\nContent-Transfer-Encoding: 8bit\nPlural-Forms: nplurals=2; plural=(n != 1);\nX-Generator: Poedit 2.4.1\n',
+            '0\x04th': '.',
+            '1 year, 1 month': '1 vuosi, 1 kuukausi',
+            '1\x04st': '.',
+            '2\x04nd': '.',
+            '3\x04rd': '.',
+            '4\x04th': '.',
+            '5\x04th': '.',
+            '6\x04th': '.',
+            '7\x04th': '.',
+            '8\x04th': '.',
+            '9\x04th': '.',
+            'a day': 'päivä',
+            'a minute': 'minuutti',
+            'a moment': 'hetki',
+            'a month': 'kuukausi',
+            'a second': 'sekunti',
+            'a year': 'vuosi',
+            'an hour': 'tunti',
+            'billion': 'miljardia',
+            'decillion': 'dekiljoonaa',
+            'eight': 'kahdeksan',
+            'five': 'viisi',
+            'four': 'neljä',
+            'googol': 'googol',
+            'million': 'miljoonaa',
+            'nine': 'yhdeksän',
+            'nonillion': 'noniljoonaa',
+            'now': 'nyt',
+            'octillion': 'oktiljoonaa',
+            'one': 'yksi',
+            'quadrillion': 'kvadriljoonaa',
+            'quintillion': 'kvintiljoonaa',
+            'septillion': 'septiljoonaa',
+            'seven': 'seitsemän',
+            'sextillion': 'sekstiljoonaa',
+            'six': 'kuusi',
+            'three': 'kolme',
+            'today': 'tänään',
+            'tomorrow': 'huomenna',
+            'trillion': 'biljoonaa',
+            'two': 'kaksi',
+            'yesterday': 'eilen',
+            'zero': 'nolla',
+            '{head} and {tail}': '{head} ja {tail}',
+            '{time_difference} ago': '{time_difference} sitten',
+            '{time_difference} from now': '{time_difference} tästä',
+            ('1 year, {amount} day', 0): '1 vuosi, {amount} päivä',
+            ('1 year, {amount} day', 1): '1 vuosi, {amount} päivää',
+            ('1 year, {amount} month', 0): '1 vuosi, {amount} kuukausi',
+            ('1 year, {amount} month', 1): '1 vuosi, {amount} kuukautta',
+            ('{amount} day', 0): '{amount} päivä',
+            ('{amount} day', 1): '{amount} päivää',
+            ('{amount} hour', 0): '{amount} tunti',
+            ('{amount} hour', 1): '{amount} tuntia',
+            ('{amount} microsecond', 0): '{amount} mikrosekunti',
+            ('{amount} microsecond', 1): '{amount} mikrosekuntia',
+            ('{amount} millisecond', 0): '{amount} millisekunti',
+            ('{amount} millisecond', 1): '{amount} millisekuntia',
+            ('{amount} minute', 0): '{amount} minuutti',
+            ('{amount} minute', 1): '{amount} minuuttia',
+            ('{amount} month', 0): '{amount} kuukausi',
+            ('{amount} month', 1): '{amount} kuukautta',
+            ('{amount} more', 0): '{amount} muu',
+            ('{amount} more', 1): '{amount} muuta',
+            ('{amount} second', 0): '{amount} sekunti',
+            ('{amount} second', 1): '{amount} sekuntia',
+            ('{amount} year', 0): '{amount} vuosi',
+            ('{amount} year', 1): '{amount} vuotta',
+        },
+    ),
+    'fr_FR': (
+        _plural_1,
+        {
+            'content-transfer-encoding': '8bit',
+            'content-type': 'text/plain; charset=utf-8',
+            'generated-by': 'Babel 0.9.6',
+            'language': 'fr',
+            'language-team': 'fr_FR <LL@li.org>',
+            'last-translator': 'Olivier Cortès <oc@1flow.io>',
+            'mime-version': '1.0',
+            'plural-forms': 'nplurals=2; plural=(n > 1);',
+            'po-revision-date': '2021-03-08 10:02+0100',
+            'project-id-version': 'PROJECT VERSION',
+            'report-msgid-bugs-to': '',
+            'x-generator': 'Poedit 2.4.1',
+        },
+        {
+            '': 'Project-Id-Version: PROJECT VERSION\nReport-Msgid-Bugs-To: \nPO-Revision-Date: 2021-03-08 10:02+0100\nLast-Translator: Olivier Cortès <oc@1flow.io>\nLanguage-Team: fr_FR <LL@li.org>\nLanguage: fr\nMIME-Version: 1.0\nContent-Type: text/plain; charset=utf-8\nContent-Transfer-Encoding: 8bit\nPlural-Forms: nplurals=2; plural=(n > 1);\nGenerated-By: Babel 0.9.6\nX-Generator: Poedit 2.4.1\n',
+            '1 year, 1 month': 'un an et un mois',
+            'a day': 'un jour',
+            'a minute': 'une minute',
+            'a moment': 'un moment',
+            'a month': 'un mois',
+            'a second': 'une seconde',
+            'a year': 'un an',
+            'afternoon': 'après-midi',
+            'an hour': 'une heure',
+            'billion': 'milliard',
+            'eight': 'huit',
+            'evening': 'soir',
+            'five': 'cinq',
+            'four': 'quatre',
+            'last year': "l'année dernière",
+            'midnight': 'minuit',
+            'morning': 'matin',
+            'next year': "l'année prochaine",
+            'nine': 'neuf',
+            'noon': 'le midi',
+            'now': 'maintenant',
+            'one': 'un',
+            'seven': 'sept',
+            'six': 'six',
+            'this year': 'cette année',
+            'three': 'trois',
+            'today': "aujourd'hui",
+            'tomorrow': 'demain',
+            'two': 'deux',
+            'yesterday': 'hier',
+            'zero': 'zéro',
+            '{head} and {tail}': '{head} et {tail}',
+            '{time_difference} ago': 'il y a {time_difference}',
+            '{time_difference} from now': 'dans {time_difference}',
+            ('1 year, {amount} day', 0): 'un an et {amount} jour',
+            ('1 year, {amount} day', 1): 'un an et {amount} jours',
+            ('1 year, {amount} month', 0): 'un an et {amount} mois',
+            ('1 year, {amount} month', 1): 'un an et {amount} mois',
+            ('{amount} day', 0): '{amount} jour',
+            ('{amount} day', 1): '{amount} jours',
+            ('{amount} hour', 0): '{amount} heure',
+            ('{amount} hour', 1): '{amount} heures',
+            ('{amount} microsecond', 0): '{amount} microseconde',
+            ('{amount} microsecond', 1): '{amount} microsecondes',
+            ('{amount} millisecond', 0): '{amount} milliseconde',
+            ('{amount} millisecond', 1): '{amount} millisecondes',
+            ('{amount} month', 0): '{amount} mois',
+            ('{amount} month', 1): '{amount} mois',
+            ('{amount} more', 0): '{amount} autre',
+            ('{amount} more', 1): '{amount} autres',
+            ('{amount} second', 0): '{amount} seconde',
+            ('{amount} second', 1): '{amount} secondes',
+            ('{amount} year', 0): '{amount} an',
+            ('{amount} year', 1): '{amount} ans',
+        },
+    ),
+    'id_ID': (
+        _plural_2,
+        {
+            'content-transfer-encoding': '8bit',
+            'content-type': 'text/plain; charset=ASCII',
+            'language': 'id',
+            'language-team': 'Indonesian',
+            'last-translator': 'adie.rebel@gmail.com',
+            'mime-version': '1.0',
+            'plural-forms': 'nplurals=1; plural=0;',
+            'po-revision-date': '2021-03-08 12:57+0100',
+            'project-id-version': '',
+            'report-msgid-bugs-to': '',
+            'x-generator': 'Poedit 2.4.1',
+        },
+        {
+            '': 'Project-Id-Version: \nReport-Msgid-Bugs-To: \nPO-Revision-Date: 2021-03-08 12:57+0100\nLast-Translator: adie.rebel@gmail.com\nLanguage-Team: Indonesian\nLanguage: id\nMIME-Version: 1.0\nContent-Type: text/plain; charset=ASCII\nContent-Transfer-Encoding: 8bit\nPlural-Forms: nplurals=1; plural=0;\nX-Generator: Poedit 2.4.1\n',
+            '0\x04th': '.',
+            '1 year, 1 month': '1 tahun, 1 bulan',
+            '1\x04st': '.',
+            '2\x04nd': '.',
+            '3\x04rd': '.',
+            '4\x04th': '.',
+            '5\x04th': '.',
+            '6\x04th': '.',
+            '7\x04th': '.',
+            '8\x04th': '.',
+            '9\x04th': '.',
+            'a day': 'sehari',
+            'a minute': 'semenit',
+            'a moment': 'beberapa saat',
+            'a month': 'sebulan',
+            'a second': 'sedetik',
+            'a year': 'setahun',
+            'afternoon': 'sore',
+            'an hour': 'sejam',
+            'billion': 'miliar',
+            'decillion': 'decillion',
+            'eight': 'delapan',
+            'evening': 'malam',
+            'five': 'lima',
+            'four': 'empat',
+            'googol': 'googol',
+            'last year': 'tahun lalu',
+            'midnight': 'tengah malam',
+            'million': 'juta',
+            'morning': 'pagi',
+            'next year': 'tahun depan',
+            'nine': 'sembilan',
+            'nonillion': 'nonillion',
+            'noon': 'tengah hari',
+            'now': 'sekarang',
+            'octillion': 'octillion',
+            'one': 'satu',
+            'quadrillion': 'kuadriliun',
+            'quintillion': 'quintillion',
+            'septillion': 'septillion',
+            'seven': 'tujuh',
+            'sextillion': 'sextillion',
+            'six': 'enam',
+            'this year': 'tahun ini',
+            'three': 'tiga',
+            'today': 'hari ini',
+            'tomorrow': 'besok',
+            'trillion': 'triliun',
+            'two': 'dua',
+            'yesterday': 'kemarin',
+            'zero': 'nol',
+            '{head} and {tail}': '{head} dan {tail}',
+            '{time_difference} ago': '{time_difference} yang lalu',
+            '{time_difference} from now': '{time_difference} dari sekarang',
+            ('1 year, {amount} day', 0): '1 tahun, {amount} hari',
+            ('1 year, {amount} month', 0): '1 tahun, {amount} bulan',
+            ('{amount} day', 0): '{amount} hari',
+            ('{amount} hour', 0): '{amount} jam',
+            ('{amount} microsecond', 0): '{amount} mikrodetik',
+            ('{amount} millisecond', 0): '{amount} milidetik',
+            ('{amount} minute', 0): '{amount} menit',
+            ('{amount} month', 0): '{amount} bulan',
+            ('{amount} more', 0): '{amount} lainnya',
+            ('{amount} second', 0): '{amount} detik',
+            ('{amount} year', 0): '{amount} tahun',
+        },
+    ),
+    'it_IT': (
+        _plural_0,
+        {
+            'content-transfer-encoding': '8bit',
+            'content-type': 'text/plain; charset=UTF-8',
+            'language': 'it',
+            'language-team': 'Italian',
+            'last-translator': 'derfel <code@derfel.net>',
+            'mime-version': '1.0',
+            'plural-forms': 'nplurals=2; plural=(n != 1);',
+            'po-revision-date': '2021-03-09 10:29+0100',
+            'project-id-version': '',
+            'report-msgid-bugs-to': '',
+            'x-generator': 'Poedit 2.4.1',
+        },
+        {
+            '': 'Project-Id-Version: \nReport-Msgid-Bugs-To: \nPO-Revision-Date: 2021-03-09 10:29+0100\nLast-Translator: derfel <code@derfel.net>\nLanguage-Team: Italian\nLanguage: it\nMIME-Version: 1.0\nContent-Type: text/plain; charset=UTF-8\nContent-Transfer-Encoding: 8bit\nPlural-Forms: nplurals=2; plural=(n != 1);\nX-Generator: Poedit 2.4.1\n',
+            '0\x04th': 'º',
+            '1 year, 1 month': 'un anno ed un mese',
+            '1\x04st': 'º',
+            '2\x04nd': 'º',
+            '3\x04rd': 'º',
+            '4\x04th': 'º',
+            '5\x04th': 'º',
+            '6\x04th': 'º',
+            '7\x04th': 'º',
+            '8\x04th': 'º',
+            '9\x04th': 'º',
+            'a day': 'un giorno',
+            'a minute': 'un minuto',
+            'a moment': 'un momento',
+            'a month': 'un mese',
+            'a second': 'un secondo',
+            'a year': 'un anno',
+            'afternoon': 'pomeriggio',
+            'an hour': "un'ora",
+            'billion': 'miliardi',
+            'decillion': 'quintiliardi',
+            'eight': 'otto',
+            'evening': 'sera',
+            'five': 'cinque',
+            'four': 'quattro',
+            'googol': 'googol',
+            'last year': "l'anno scorso",
+            'midnight': 'mezzanotte',
+            'million': 'milioni',
+            'morning': 'mattina',
+            'next year': "l'anno prossimo",
+            'nine': 'nove',
+            'nonillion': 'quintilioni',
+            'noon': 'mezzogiorno',
+            'now': 'adesso',
+            'octillion': 'quadriliardi',
+            'one': 'uno',
+            'quadrillion': 'biliardi',
+            'quintillion': 'trilioni',
+            'septillion': 'quadrilioni',
+            'seven': 'sette',
+            'sextillion': 'triliardi',
+            'six': 'sei',
+            'this year': "quest'anno",
+            'three': 'tre',
+            'today': 'oggi',
+            'tomorrow': 'domani',
+            'trillion': 'bilioni',
+            'two': 'due',
+            'yesterday': 'ieri',
+            'zero': 'zero',
+            '{head} and {tail}': '{head} e {tail}',
+            '{time_difference} ago': '{time_difference} fa',
+            '{time_difference} from now': '{time_difference} da adesso',
+            ('1 year, {amount} day', 0): 'un anno e {amount} giorno',
+            ('1 year, {amount} day', 1): 'un anno e {amount} giorni',
+            ('1 year, {amount} month', 0): 'un anno e {amount} mese',
+            ('1 year, {amount} month', 1): 'un anno e {amount} mesi',
+            ('{amount} day', 0): '{amount} giorno',
+            ('{amount} day', 1): '{amount} giorni',
+            ('{amount} hour', 0): '{amount} ora',
+            ('{amount} hour', 1): '{amount} ore',
+            ('{amount} microsecond', 0): '{amount} microsecondo',
+            ('{amount} microsecond', 1): '{amount} microsecondi',
+            ('{amount} millisecond', 0): '{amount} millisecondo',
+            ('{amount} millisecond', 1): '{amount} millisecondi',
+            ('{amount} minute', 0): '{amount} minuto',
+            ('{amount} minute', 1): '{amount} minuti',
+            ('{amount} month', 0): '{amount} mese',
+            ('{amount} month', 1): '{amount} mesi',
+            ('{amount} more', 0): '{amount} altro',
+            ('{amount} more', 1): '{amount} altri',
+            ('{amount} second', 0): '{amount} secondo',
+            ('{amount} second', 1): '{amount} secondi',
+            ('{amount} year', 0): '{amount} anno',
+            ('{amount} year', 1): '{amount} anni',
+        },
+    ),
+    'ja_JP': (
+        _plural_2,
+        {
+            'content-transfer-encoding': '8bit',
+            'content-type': 'text/plain; charset=utf-8',
+            'generated-by': 'Babel 0.9.6',
+            'language': 'ja',
+            'language-team': 'Japanese',
+            'last-translator': 'Kan Torii <oss@qoolloop.com>',
+            'mime-version': '1.0',
+            'plural-forms': 'nplurals=1; plural=0;',
+            'po-revision-date': '2021-03-09 10:42+0100',
+            'project-id-version': 'humanize',
+            'report-msgid-bugs-to': '',
+            'x-generator': 'Poedit 2.4.1',
+        },
+        {
+            '': 'Project-Id-Version: humanize\nReport-Msgid-Bugs-To: \nPO-Revision-Date: 2021-03-09 10:42+0100\nLast-Translator: Kan Torii <oss@qoolloop.com>\nLanguage-Team: Japanese\nLanguage: ja\nMIME-Version: 1.0\nContent-Type: text/plain; charset=utf-8\nContent-Transfer-Encoding: 8bit\nPlural-Forms: nplurals=1; plural=0;\nGenerated-By: Babel 0.9.6\nX-Generator: Poedit 2.4.1\n',
+            '0\x04th': '番目',
+            '1 year, 1 month': '1年 1ヶ月',
+            '1\x04st': '番目',
+            '2\x04nd': '番目',
+            '3\x04rd': '番目',
+            '4\x04th': '番目',
+            '5\x04th': '番目',
+            '6\x04th': '番目',
+            '7\x04th': '番目',
+            '8\x04th': '番目',
+            '9\x04th': '番目',
+            'a day': '1日',
+            'a minute': '1分',
+            'a month': '1ヶ月',
+            'a second': '1秒',
+            'a year': '1年',
+            'afternoon': '午後',
+            'an hour': '1時間',
+            'billion': '十億',
+            'decillion': '那由他',
+            'eight': '八',
+            'evening': 'イブニング',
+            'five': '五',
+            'four': '四',
+            'googol': 'グーゴル',
+            'last year': '昨年',
+            'midnight': '真夜中',
+            'million': '百万',
+            'morning': '朝',
+            'next year': '来年',
+            'nine': '九',
+            'nonillion': 'ノンリオン',
+            'noon': '正午',
+            'now': '今',
+            'octillion': 'オクティリオン',
+            'one': '一',
+            'quadrillion': '四兆',
+            'quintillion': '千兆',
+            'septillion': 'し',
+            'seven': '七',
+            'sextillion': 'セクスティリオン',
+            'six': '六',
+            'this year': '今年',
+            'three': '三',
+            'today': '本日',
+            'tomorrow': '明日',
+            'trillion': '兆',
+            'two': '二',
+            'yesterday': '昨日',
+            '{head} and {tail}': '{head}{tail}',
+            '{time_difference} ago': '{time_difference}前',
+            '{time_difference} from now': '今から{time_difference}',
+            ('1 year, {amount} day', 0): '1年 {amount}日',
+            ('1 year, {amount} month', 0): '1年 {amount}ヶ月',
+            ('{amount} day', 0): '{amount}日',
+            ('{amount} hour', 0): '{amount}時間',
+            ('{amount} microsecond', 0): '{amount}マイクロ秒',
+            ('{amount} millisecond', 0): '{amount}ミリ秒',
+            ('{amount} minute', 0): '{amount}分',
+            ('{amount} month', 0): '{amount}ヶ月',
+            ('{amount} more', 0): '他{amount}件',
+            ('{amount} second', 0): '{amount}秒',
+            ('{amount} year', 0): '{amount}年',
+        },
+    ),
+    'ko_KR': (
+        _plural_1,
+        {
+            'content-transfer-encoding': '8bit',
+            'content-type': 'text/plain; charset=utf-8',
+            'generated-by': 'Babel 0.9.6',
+            'language': 'ko',
+            'language-team': 'ko_KR <LL@li.org>',
+            'last-translator': '@youngrok',
+            'mime-version': '1.0',
+            'plural-forms': 'nplurals=2; plural=(n > 1);',
+            'po-revision-date': '2021-03-09 10:54+0100',
+            'project-id-version': 'PROJECT VERSION',
+            'report-msgid-bugs-to': '',
+            'x-generator': 'Poedit 2.4.1',
+        },
+        {
+            '': 'Project-Id-Version: PROJECT VERSION\nReport-Msgid-Bugs-To: \nPO-Revision-Date: 2021-03-09 10:54+0100\nLast-Translator: @youngrok\nLanguage-Team: ko_KR <LL@li.org>\nLanguage: ko\nMIME-Version: 1.0\nContent-Type: text/plain; charset=utf-8\nContent-Transfer-Encoding: 8bit\nPlural-Forms: nplurals=2; plural=(n > 1);\nGenerated-By: Babel 0.9.6\nX-Generator: Poedit 2.4.1\n',
+            '1 year, 1 month': '1년, 1개월',
+            'a day': '하루',
+            'a minute': '1분',
+            'a moment': '잠깐',
+            'a month': '한달',
+            'a second': '1초',
+            'a year': '1년',
+            'afternoon': '대낮',
+            'an hour': '1시간',
+            'billion': '십억',
+            'decillion': '데 실리온',
+            'eight': '여덟',
+            'evening': '저녁',
+            'five': '다섯',
+            'four': '넷',
+            'googol': '구골',
+            'last year': '작년',
+            'midnight': '한밤중',
+            'million': '백만',
+            'morning': '아침',
+            'next year': '내년',
+            'nine': '아홉',
+            'nonillion': '무 백만',
+            'noon': '정오',
+            'now': '방금',
+            'octillion': '팔경',
+            'one': '하나',
+            'quadrillion': '천조',
+            'quintillion': '오경',
+            'septillion': '중격',
+            'seven': '일곱',
+            'sextillion': '섹스 틸리 온',
+            'six': '여섯',
+            'this year': '올해',
+            'three': '셋',
+            'today': '오늘',
+            'tomorrow': '내일',
+            'trillion': '일조',
+            'two': '둘',
+            'yesterday': '어제',
+            '{head} and {tail}': '{head} {tail}',
+            '{time_difference} ago': '{time_difference} 전',
+            '{time_difference} from now': '지금부터 {time_difference}',
+            ('1 year, {amount} day', 0): '1년 {amount}일',
+            ('1 year, {amount} day', 1): '1년 {amount}일',
+            ('1 year, {amount} month', 0): '1년, {amount}개월',
+            ('1 year, {amount} month', 1): '1년, {amount}개월',
+            ('{amount} day', 0): '{amount} 일',
+            ('{amount} day', 1): '{amount} 일',
+            ('{amount} hour', 0): '{amount} 시간',
+            ('{amount} hour', 1): '{amount} 시간',
+            ('{amount} microsecond', 0): '{amount} 마이크로 초',
+            ('{amount} microsecond', 1): '{amount} 마이크로 초',
+            ('{amount} millisecond', 0): '{amount} 밀리 초',
+            ('{amount} millisecond', 1): '{amount} 밀리 초',
+            ('{amount} minute', 0): '{amount} 분',
+            ('{amount} minute', 1): '{amount} 분',
+            ('{amount} month', 0): '{amount} 개월',
+            ('{amount} month', 1): '{amount} 개월',
+            ('{amount} more', 0): '외 {amount}개',
+            ('{amount} more', 1): '외 {amount}개',
+            ('{amount} second', 0): '{amount} 초',
+            ('{amount} second', 1): '{amount} 초',
+            ('{amount} year', 0): '{amount} 년',
+            ('{amount} year', 1): '{amount} 년',
+        },
+    ),
+    'nl_NL': (
+        _plural_0,
+        {
+            'content-transfer-encoding': '8bit',
+            'content-type': 'text/plain; charset=UTF-8',
+            'generated-by': 'Babel 0.9.6',
+            'language': 'nl_NL',
+            'language-team': 'nl_NL',
+            'last-translator': 'Martin van Wingerden',
+            'mime-version': '1.0',
+            'plural-forms': 'nplurals=2; plural=(n != 1);',
+            'po-revision-date': '2021-03-09 11:03+0100',
+            'project-id-version': 'PROJECT VERSION',
+            'report-msgid-bugs-to': '',
+            'x-generator': 'Poedit 2.4.1',
+        },
+        {
+            '': 'Project-Id-Version: PROJECT VERSION\nReport-Msgid-Bugs-To: \nPO-Revision-Date: 2021-03-09 11:03+0100\nLast-Translator: Martin van Wingerden\nLanguage-Team: nl_NL\nLanguage: nl_NL\nMIME-Version: 1.0\nContent-Type: text/plain; charset=UTF-8\nContent-Transfer-Encoding: 8bit\nPlural-Forms: nplurals=2; plural=(n != 1);\nGenerated-By: Babel 0.9.6\nX-Generator: Poedit 2.4.1\n',
+            '0\x04th': 'de',
+            '1 year, 1 month': '1 jaar, 1 maand',
+            '1\x04st': 'ste',
+            '2\x04nd': 'de',
+            '3\x04rd': 'de',
+            '4\x04th': 'de',
+            '5\x04th': 'de',
+            '6\x04th': 'de',
+            '7\x04th': 'de',
+            '8\x04th': 'de',
+            '9\x04th': 'de',
+            'a day': 'een dag',
+            'a minute': 'een minuut',
+            'a moment': 'een moment',
+            'a month': 'een maand',
+            'a second': 'een seconde',
+            'a year': 'een jaar',
+            'afternoon': 'middag',
+            'an hour': 'een uur',
+            'billion': 'miljard',
+            'decillion': 'quintiljard',
+            'eight': 'acht',
+            'evening': 'avond',
+            'five': 'vijf',
+            'four': 'vier',
+            'googol': 'googol',
+            'last year': 'afgelopen jaar',
+            'midnight': 'middernacht',
+            'million': 'miljoen',
+            'morning': 'morgen',
+            'next year': 'volgend jaar',
+            'nine': 'negen',
+            'nonillion': 'quintiljoen',
+            'noon': 'middag',
+            'now': 'nu',
+            'octillion': 'quadriljard',
+            'one': 'één',
+            'quadrillion': 'biljard',
+            'quintillion': 'triljoen',
+            'septillion': 'quadriljoen',
+            'seven': 'zeven',
+            'sextillion': 'triljard',
+            'six': 'zes',
+            'this year': 'dit jaar',
+            'three': 'drie',
+            'today': 'vandaag',
+            'tomorrow': 'morgen',
+            'trillion': 'biljoen',
+            'two': 'twee',
+            'yesterday': 'gisteren',
+            'zero': 'nul',
+            '{head} and {tail}': '{head} en {tail}',
+            '{time_difference} ago': '{time_difference} geleden',
+            '{time_difference} from now': '{time_difference} vanaf nu',
+            ('1 year, {amount} day', 0): '1 jaar, {amount} dag',
+            ('1 year, {amount} day', 1): '1 jaar, {amount} dagen',
+            ('1 year, {amount} month', 0): '1 jaar, {amount} maand',
+            ('1 year, {amount} month', 1): '1 jaar, {amount} maanden',
+            ('{amount} day', 0): '{amount} dag',
+            ('{amount} day', 1): '{amount} dagen',
+            ('{amount} hour', 0): '{amount} uur',
+            ('{amount} hour', 1): '{amount} uur',
+            ('{amount} microsecond', 0): '{amount} microseconde',
+            ('{amount} microsecond', 1): '{amount} microseconden',
+            ('{amount} millisecond', 0): '{amount} milliseconde',
+            ('{amount} millisecond', 1): '{amount} milliseconden',
+            ('{amount} minute', 0): '{amount} minuut',
+            ('{amount} minute', 1): '{amount} minuten',
+            ('{amount} month', 0): '{amount} maand',
+            ('{amount} month', 1): '{amount} maanden',
+            ('{amount} more', 0): '{amount} meer',
+            ('{amount} more', 1): '{amount} meer',
+            ('{amount} second', 0): '{amount} seconde',
+            ('{amount} second', 1): '{amount} seconden',
+            ('{amount} year', 0): '{amount} jaar',
+            ('{amount} year', 1): '{amount} jaar',
+        },
+    ),
+    'pl_PL': (
+        _plural_3,
+        {
+            'content-transfer-encoding': '8bit',
+            'content-type': 'text/plain; charset=UTF-8',
+            'language': 'pl',
+            'language-team': 'Polish',
+            'last-translator': 'Bartosz Bubak <bartosz.bubak gmail com>',
+            'mime-version': '1.0',
+            'plural-forms': 'nplurals=3; plural=(n==1 ? 0 : n%10>=2 && n%10<=4 && (n%100<10 || n%100>=20) ? 1 : 2);',
+            'po-revision-date': '2021-03-09 11:31+0100',
+            'project-id-version': '0.0.1',
+            'report-msgid-bugs-to': '',
+            'x-generator': 'Poedit 2.4.1',
+        },
+        {
+            '': 'Project-Id-Version: 0.0.1\nReport-Msgid-Bugs-To: \nPO-Revision-Date: 2021-03-09 11:31+0100\nLast-Translator: Bartosz Bubak <bartosz.bubak gmail com>\nLanguage-Team: Polish\nLanguage: pl\nMIME-Version: 1.0\nContent-Type: text/plain; charset=UTF-8\nContent-Transfer-Encoding: 8bit\nPlural-Forms: nplurals=3; plural=(n==1 ? 0 : n%10>=2 && n%10<=4 && (n%100<10 || n%100>=20) ? 1 : 2);\nX-Generator: Poedit 2.4.1\n',
+            '0\x04th': '.',
+            '1 year, 1 month': '1 rok, 1 miesiąc',
+            '1\x04st': '.',
+            '2\x04nd': '.',
+            '3\x04rd': '.',
+            '4\x04th': '.',
+            '5\x04th': '.',
+            '6\x04th': '.',
+            '7\x04th': '.',
+            '8\x04th': '.',
+            '9\x04th': '.',
+            'a day': 'dzień',
+            'a minute': 'minuta',
+            'a moment': 'chwila',
+            'a month': 'miesiąc',
+            'a second': 'sekunda',
+            'a year': 'rok',
+            'afternoon': 'popołudnie',
+            'an hour': 'godzina',
+            'billion': 'bilion',
+            'decillion': 'decylion',
+            'eight': 'osiem',
+            'evening': 'wieczór',
+            'five': 'pięć',
+            'four': 'cztery',
+            'googol': 'googol',
+            'last year': 'ostatni rok',
+            'midnight': 'północ',
+            'million': 'milion',
+            'morning': 'ranek',
+            'next year': 'Następny rok',
+            'nine': 'dziewięć',
+            'nonillion': 'nonilion',
+            'noon': 'południe',
+            'now': 'teraz',
+            'octillion': 'oktylion',
+            'one': 'jeden',
+            'quadrillion': 'kwadrylion',
+            'quintillion': 'kwintylion',
+            'septillion': 'septylion',
+            'seven': 'siedem',
+            'sextillion': 'sekstylion',
+            'six': 'sześć',
+            'this year': 'W tym roku',
+            'three': 'trzy',
+            'today': 'dziś',
+            'tomorrow': 'jutro',
+            'trillion': 'trylion',
+            'two': 'dwa',
+            'yesterday': 'wczoraj',
+            'zero': 'zero',
+            '{head} and {tail}': '{head} i {tail}',
+            '{time_difference} ago': '{time_difference} temu',
+            '{time_difference} from now': '{time_difference} od teraz',
+            ("{hour_count} o'clock", 0): '{hour_count}',
+            ("{hour_count} o'clock", 1): '{hour_count}',
+            ("{hour_count} o'clock", 2): '{hour_count}',
+            ('1 year, {amount} day', 0): '1 rok, {amount} dzień',
+            ('1 year, {amount} day', 1): '1 rok, {amount} dni',
+            ('1 year, {amount} day', 2): '1 rok, {amount} dni',
+            ('1 year, {amount} month', 0): '1 rok, {amount} miesiąc',
+            ('1 year, {amount} month', 1): '1 rok, {amount} miesiące',
+            ('1 year, {amount} month', 2): '1 rok, {amount} miesięcy',
+            ('{amount} day', 0): '{amount} dzień',
+            ('{amount} day', 1): '{amount} dni',
+            ('{amount} day', 2): '{amount} dni',
+            ('{amount} hour', 0): '{amount} godzina',
+            ('{amount} hour', 1): '{amount} godziny',
+            ('{amount} hour', 2): '{amount} godzin',
+            ('{amount} microsecond', 0): '{amount} mikrosekunda',
+            ('{amount} microsecond', 1): '{amount} mikrosekundy',
+            ('{amount} microsecond', 2): '{amount} mikrosekund',
+            ('{amount} millisecond', 0): '{amount} milisekunda',
+            ('{amount} millisecond', 1): '{amount} milisekundy',
+            ('{amount} millisecond', 2): '{amount} milisekund',
+            ('{amount} minute', 0): '{amount} minuta',
+            ('{amount} minute', 1): '{amount} minuty',
+            ('{amount} minute', 2): '{amount} minut',
+            ('{amount} month', 0): '{amount} miesiąc',
+            ('{amount} month', 1): '{amount} miesiące',
+            ('{amount} month', 2): '{amount} miesięcy',
+            ('{amount} more', 0): '{amount} więcej',
+            ('{amount} more', 1): '{amount} więcej',
+            ('{amount} more', 2): '{amount} więcej',
+            ('{amount} second', 0): '{amount} sekunda',
+            ('{amount} second', 1): '{amount} sekundy',
+            ('{amount} second', 2): '{amount} sekund',
+            ('{amount} year', 0): '{amount} rok',
+            ('{amount} year', 1): '{amount} lata',
+            ('{amount} year', 2): '{amount} lat',
+        },
+    ),
+    'pt_BR': (
+        _plural_1,
+        {
+            'content-transfer-encoding': '8bit',
+            'content-type': 'text/plain; charset=UTF-8',
+            'language': 'pt_BR',
+            'language-team': '',
+            'last-translator': '',
+            'mime-version': '1.0',
+            'plural-forms': 'nplurals=2; plural=(n > 1);',
+            'po-revision-date': '2021-03-05 18:44+0100',
+            'project-id-version': '',
+            'report-msgid-bugs-to': '',
+            'x-generator': 'Poedit 2.4.1',
+        },
+        {
+            '': 'Project-Id-Version: \nReport-Msgid-Bugs-To: \nPO-Revision-Date: 2021-03-05 18:44+0100\nLast-Translator: \nLanguage-Team: \nLanguage: pt_BR\nMIME-Version: 1.0\nContent-Type: text/plain; charset=UTF-8\nContent-Transfer-Encoding: 8bit\nPlural-Forms: nplurals=2; plural=(n > 1);\nX-Generator: Poedit 2.4.1\n',
+            '0\x04th': 'º',
+            '1 year, 1 month': '1 ano e 1 mês',
+            '1\x04st': 'º',
+            '2\x04nd': 'º',
+            '3\x04rd': 'º',
+            '4\x04th': 'º',
+            '5\x04th': 'º',
+            '6\x04th': 'º',
+            '7\x04th': 'º',
+            '8\x04th': 'º',
+            '9\x04th': 'º',
+            'a day': 'um dia',
+            'a minute': 'um minuto',
+            'a moment': 'um momento',
+            'a month': 'um mês',
+            'a quarter past {hour_count}': '{hour_count} e quinze',
+            'a quarter': 'quinze',
+            'a second': 'um segundo',
+            'a year': 'um ano',
+            'afternoon': 'tarde',
+            'an hour': 'uma hora',
+            'billion': 'bilhão',
+            'decillion': 'decilhão',
+            'eight': 'oito',
+            'evening': 'noite',
+            'five': 'cinco',
+            'four': 'quatro',
+            'googol': 'undecilhão',
+            'half past {hour_count}': '{hour_count} e meia',
+            'hour 0\x04zero': 'zero',
+            'hour 10\x04ten': 'dez',
+            'hour 11\x04eleven': 'onze',
+            'hour 12\x04twelve': 'doze',
+            'hour 13\x04one': 'treze',
+            'hour 14\x04two': 'quatorze',
+            'hour 15\x04three': 'quinze',
+            'hour 16\x04four': 'dezesseis',
+            'hour 17\x04five': 'dezessete',
+            'hour 18\x04six': 'dezoito',
+            'hour 19\x04seven': 'dezenove',
+            'hour 1\x04one': 'uma',
+            'hour 20\x04eight': 'vinte',
+            'hour 21\x04nine': 'vinte e uma',
+            'hour 22\x04ten': 'vinte e duas',
+            'hour 23\x04eleven': 'vinte e três',
+            'hour 2\x04two': 'duas',
+            'hour 3\x04three': 'três',
+            'hour 4\x04four': 'quatro',
+            'hour 5\x04five': 'cinco',
+            'hour 6\x04six': 'seis',
+            'hour 7\x04seven': 'sete',
+            'hour 8\x04eight': 'oito',
+            'hour 9\x04nine': 'nove',
+            'last year': 'ano passado',
+            'midnight': 'meia-noite',
+            'million': 'milhão',
+            'minute 0\x04zero': 'zero',
+            'minute 10\x04ten': 'dez',
+            'minute 11\x04eleven': 'onze',
+            'minute 12\x04twelve': 'doze',
+            'minute 13\x04thirteen': 'treze',
+            'minute 14\x04fourteen': 'quatorze',
+            'minute 15\x04fifteen': 'quinze',
+            'minute 16\x04sixteen': 'dezesseis',
+            'minute 17\x04seventeen': 'dezessete',
+            'minute 18\x04eighteen': 'dezoito',
+            'minute 19\x04nineteen': 'dezenove',
+            'minute 1\x04one': 'um',
+            'minute 20\x04twenty': 'vinte',
+            'minute 21\x04twenty one': 'vinte e um',
+            'minute 22\x04twenty two': 'vinte e dois',
+            'minute 23\x04twenty three': 'vinte e três',
+            'minute 24\x04twenty four': 'vinte e quatro',
+            'minute 25\x04twenty five': 'vinte e cinco',
+            'minute 26\x04twenty six': 'vinte e seis',
+            'minute 27\x04twenty seven': 'vinte e sete',
+            'minute 28\x04twenty eight': 'vinte e oito',
+            'minute 29\x04twenty nine': 'vinte e nove',
+            'minute 2\x04two': 'dois',
+            'minute 30\x04thirty': 'trinta',
+            'minute 31\x04thirty one': 'trinta e um',
+            'minute 32\x04thirty two': 'trinta e dois',
+            'minute 33\x04thirty three': 'trinta e três',
+            'minute 34\x04thirty four': 'trinta e quatro',
+            'minute 35\x04thirty five': 'trinta e cinco',
+            'minute 36\x04thirty six': 'trinta e seis',
+            'minute 37\x04thirty seven': 'trinta e sete',
+            'minute 38\x04thirty eight': 'trinta e oito',
+            'minute 39\x04thirty nine': 'trinta e nove',
+            'minute 3\x04three': 'três',
+            'minute 40\x04forty': 'quarenta',
+            'minute 41\x04forty one': 'quarenta e um',
+            'minute 42\x04forty two': 'quarenta e dois',
+            'minute 43\x04forty three': 'quarenta e três',
+            'minute 44\x04forty four': 'quarenta e quatro',
+            'minute 45\x04forty five': 'quarenta e cinco',
+            'minute 46\x04forty six': 'quarenta e seis',
+            'minute 47\x04forty seven': 'quarenta e sete',
+            'minute 48\x04forty eight': 'quarenta e oito',
+            'minute 49\x04forty nine': 'quarenta e nove',
+            'minute 4\x04four': 'quatro',
+            'minute 50\x04fifty': 'cinquenta',
+            'minute 51\x04fifty one': 'cinquenta e um',
+            'minute 52\x04fifty two': 'cinquenta e dois',
+            'minute 53\x04fifty three': 'cinquenta e três',
+            'minute 54\x04fifty four': 'cinquenta e quatro',
+            'minute 55\x04fifty five': 'cinquenta e cinco',
+            'minute 56\x04fifty six': 'cinquenta e seis',
+            'minute 57\x04fifty seven': 'cinquenta e sete',
+            'minute 58\x04fifty eight': 'cinquenta e oito',
+            'minute 59\x04fifty nine': 'cinquenta e nove',
+            'minute 5\x04five': 'cinco',
+            'minute 6\x04six': 'seis',
+            'minute 7\x04seven': 'sete',
+            'minute 8\x04eight': 'oito',
+            'minute 9\x04nine': 'nove',
+            'morning': 'manhã',
+            'next year': 'ano que vem',
+            'nine': 'nove',
+            'nonillion': 'nonilhão',
+            'noon': 'meio-dia',
+            'now': 'agora',
+            'octillion': 'octilhão',
+            'one': 'um',
+            'quadrillion': 'quatrilhão',
+            'quintillion': 'quintilhão',
+            'septillion': 'septilhão',
+            'seven': 'sete',
+            'sextillion': 'sextilhão',
+            'six': 'seis',
+            'this year': 'este ano',
+            'three': 'três',
+            'today': 'hoje',
+            'tomorrow': 'amanhã',
+            'trillion': 'trilhão',
+            'two': 'dois',
+            'yesterday': 'ontem',
+            'zero': 'zero',
+            '{clock} in the {period}': '{clock} da {period}',
+            '{head} and {tail}': '{head} e {tail}',
+            '{hour_count} and {minute_count}': '{hour_count} e {minute_count}',
+            '{reversed_minute_count} to midnight': '{reversed_minute_count} para a meia-noite',
+            '{reversed_minute_count} to noon': '{reversed_minute_count} para o meio-dia',
+            '{time_difference} ago': 'há {time_difference}',
+            '{time_difference} from now': 'em {time_difference}',
+            ("{hour_count} o'clock", 0): '{hour_count} hora',
+            ("{hour_count} o'clock", 1): '{hour_count} horas',
+            ('1 year, {amount} day', 0): '1 ano e {amount} dia',
+            ('1 year, {amount} day', 1): '1 ano e {amount} dias',
+            ('1 year, {amount} month', 0): '1 ano e {amount} mês',
+            ('1 year, {amount} month', 1): '1 ano e {amount} meses',
+            ('{amount} day', 0): '{amount} dia',
+            ('{amount} day', 1): '{amount} dias',
+            ('{amount} hour', 0): '{amount} hora',
+            ('{amount} hour', 1): '{amount} horas',
+            ('{amount} microsecond', 0): '{amount} microssegundo',
+            ('{amount} microsecond', 1): '{amount} microssegundos',
+            ('{amount} millisecond', 0): '{amount} milissegundo',
+            ('{amount} millisecond', 1): '{amount} milissegundos',
+            ('{amount} minute', 0): '{amount} minuto',
+            ('{amount} minute', 1): '{amount} minutos',
+            ('{amount} month', 0): '{amount} mês',
+            ('{amount} month', 1): '{amount} meses',
+            ('{amount} more', 0): 'mais {amount}',
+            ('{amount} more', 1): 'mais {amount}',
+            ('{amount} second', 0): '{amount} segundo',
+            ('{amount} second', 1): '{amount} segundos',
+            ('{amount} year', 0): '{amount} ano',
+            ('{amount} year', 1): '{amount} anos',
+            ('{minute_translation} past {hour_count}', 0): '{hour_count} hora e {minute_translation}',
+            ('{minute_translation} past {hour_count}', 1): '{hour_count} horas e {minute_translation}',
+            ('{minute_translation} to {hour_count} hour', 0): '{minute_translation} para a {hour_count} hora',
+            ('{minute_translation} to {hour_count} hour', 1): '{minute_translation} para as {hour_count} horas',
+            ('{reversed_minute_count} to {hour_count}', 0): '{reversed_minute_count} para a {hour_count}',
+            ('{reversed_minute_count} to {hour_count}', 1): '{reversed_minute_count} para as {hour_count}',
+        },
+    ),
+    'pt_PT': (
+        _plural_1,
+        {
+            'content-transfer-encoding': '8bit',
+            'content-type': 'text/plain; charset=UTF-8',
+            'language': 'pt_PT',
+            'language-team': '',
+            'last-translator': '',
+            'mime-version': '1.0',
+            'plural-forms': 'nplurals=2; plural=(n > 1);',
+            'po-revision-date': '2021-03-09 11:37+0100',
+            'project-id-version': '',
+            'report-msgid-bugs-to': '',
+            'x-generator': 'Poedit 2.4.1',
+        },
+        {
+            '': 'Project-Id-Version: \nReport-Msgid-Bugs-To: \nPO-Revision-Date: 2021-03-09 11:37+0100\nLast-Translator: \nLanguage-Team: \nLanguage: pt_PT\nMIME-Version: 1.0\nContent-Type: text/plain; charset=UTF-8\nContent-Transfer-Encoding: 8bit\nPlural-Forms: nplurals=2; plural=(n > 1);\nX-Generator: Poedit 2.4.1\n',
+            '0\x04th': 'º',
+            '1 year, 1 month': '1 ano e 1 mês',
+            '1\x04st': 'º',
+            '2\x04nd': 'º',
+            '3\x04rd': 'º',
+            '4\x04th': 'º',
+            '5\x04th': 'º',
+            '6\x04th': 'º',
+            '7\x04th': 'º',
+            '8\x04th': 'º',
+            '9\x04th': 'º',
+            'a day': 'um dia',
+            'a minute': 'um minuto',
+            'a moment': 'um momento',
+            'a month': 'um mês',
+            'a quarter past {hour_count}': '{hour_count} e quinze',
+            'a quarter': 'quinze',
+            'a second': 'um segundo',
+            'a year': 'um ano',
+            'afternoon': 'tarde',
+            'an hour': 'uma hora',
+            'billion': 'milhar de milhão',
+            'decillion': 'mil quintilhões',
+            'eight': 'oito',
+            'evening': 'noite',
+            'five': 'cinco',
+            'four': 'quatro',
+            'googol': 'sextilhão',
+            'half past {hour_count}': '{hour_count} e meia',
+            'last year': 'ano passado',
+            'midnight': 'meia-noite',
+            'million': 'milhão',
+            'morning': 'manhã',
+            'next year': 'ano que vem',
+            'nine': 'nove',
+            'nonillion': 'quintilhão',
+            'noon': 'meio-dia',
+            'now': 'agora',
+            'octillion': 'mil quatriliões',
+            'one': 'um',
+            'quadrillion': 'mil biliões',
+            'quintillion': 'trilião',
+            'septillion': 'quatrilião',
+            'seven': 'sete',
+            'sextillion': 'mil triliões',
+            'six': 'seis',
+            'this year': 'este ano',
+            'three': 'três',
+            'today': 'hoje',
+            'tomorrow': 'amanhã',
+            'trillion': 'bilião',
+            'two': 'dois',
+            'yesterday': 'ontem',
+            'zero': 'zero',
+            '{clock} in the {period}': '{clock} da {period}',
+            '{head} and {tail}': '{head} e {tail}',
+            '{hour_count} and {minute_count}': '{hour_count} e {minute_count}',
+            '{reversed_minute_count} to midnight': '{reversed_minute_count} para a meia-noite',
+            '{reversed_minute_count} to noon': '{reversed_minute_count} para o meio-dia',
+            '{time_difference} ago': 'há {time_difference}',
+            '{time_difference} from now': 'em {time_difference}',
+            ("{hour_count} o'clock", 0): '{hour_count} hora',
+            ("{hour_count} o'clock", 1): '{hour_count} horas',
+            ('1 year, {amount} day', 0): '1 ano e {amount} dia',
+            ('1 year, {amount} day', 1): '1 ano e {amount} dias',
+            ('1 year, {amount} month', 0): '1 ano e {amount} mês',
+            ('1 year, {amount} month', 1): '1 ano e {amount} meses',
+            ('{amount} day', 0): '{amount} dia',
+            ('{amount} day', 1): '{amount} dias',
+            ('{amount} hour', 0): '{amount} hora',
+            ('{amount} hour', 1): '{amount} horas',
+            ('{amount} microsecond', 0): '{amount} microssegundo',
+            ('{amount} microsecond', 1): '{amount} microssegundos',
+            ('{amount} millisecond', 0): '{amount} milissegundo',
+            ('{amount} millisecond', 1): '{amount} milissegundos',
+            ('{amount} minute', 0): '{amount} minuto',
+            ('{amount} minute', 1): '{amount} minutos',
+            ('{amount} month', 0): '{amount} mês',
+            ('{amount} month', 1): '{amount} meses',
+            ('{amount} more', 0): 'mais {amount}',
+            ('{amount} more', 1): 'mais {amount}',
+            ('{amount} second', 0): '{amount} segundo',
+            ('{amount} second', 1): '{amount} segundos',
+            ('{amount} year', 0): '{amount} ano',
+            ('{amount} year', 1): '{amount} anos',
+            ('{minute_translation} past {hour_count}', 0): '{hour_count} hora e {minute_translation}',
+            ('{minute_translation} past {hour_count}', 1): '{hour_count} horas e {minute_translation}',
+            ('{minute_translation} to {hour_count} hour', 0): '{minute_translation} para a {hour_count} hora',
+            ('{minute_translation} to {hour_count} hour', 1): '{minute_translation} para as {hour_count} horas',
+            ('{reversed_minute_count} to {hour_count}', 0): '{reversed_minute_count} para a {hour_count}',
+            ('{reversed_minute_count} to {hour_count}', 1): '{reversed_minute_count} para as {hour_count}',
+        },
+    ),
+    'ru_RU': (
+        _plural_4,
+        {
+            'content-transfer-encoding': '8bit',
+            'content-type': 'text/plain; charset=utf-8',
+            'generated-by': 'Babel 0.9.6',
+            'language': 'ru',
+            'language-team': 'ru_RU <LL@li.org>',
+            'last-translator': 'Sergey Prokhorov <me@seriyps.ru>',
+            'mime-version': '1.0',
+            'plural-forms': 'nplurals=3; plural=(n%10==1 && n%100!=11 ? 0 : n%10>=2 && n%10<=4 && (n%100<10 || n%100>=20) ? 1 : 2);',
+            'po-revision-date': '2021-03-09 13:16+0100',
+            'project-id-version': 'PROJECT VERSION',
+            'report-msgid-bugs-to': '',
+            'x-generator': 'Poedit 2.4.1',
+        },
+        {
+            '': 'Project-Id-Version: PROJECT VERSION\nReport-Msgid-Bugs-To: \nPO-Revision-Date: 2021-03-09 13:16+0100\nLast-Translator: Sergey Prokhorov <me@seriyps.ru>\nLanguage-Team: ru_RU <LL@li.org>\nLanguage: ru\nMIME-Version: 1.0\nContent-Type: text/plain; charset=utf-8\nContent-Transfer-Encoding: 8bit\nPlural-Forms: nplurals=3; plural=(n%10==1 && n%100!=11 ? 0 : n%10>=2 && n%10<=4 && (n%100<10 || n%100>=20) ? 1 : 2);\nGenerated-By: Babel 0.9.6\nX-Generator: Poedit 2.4.1\n',
+            '0\x04th': 'ой',
+            '1 year, 1 month': '1 год, 1 месяц',
+            '1\x04st': 'ый',
+            '2\x04nd': 'ой',
+            '3\x04rd': 'ий',
+            '4\x04th': 'ый',
+            '5\x04th': 'ый',
+            '6\x04th': 'ой',
+            '7\x04th': 'ой',
+            '8\x04th': 'ой',
+            '9\x04th': 'ый',
+            'a day': 'день',
+            'a minute': 'минуту',
+            'a moment': 'только что',
+            'a month': 'месяц',
+            'a second': 'секунду',
+            'a year': 'год',
+            'afternoon': 'после полудня',
+            'an hour': 'час',
+            'billion': 'миллиарда',
+            'decillion': 'децилиона',
+            'eight': 'восемь',
+            'evening': 'вечер',
+            'five': 'пять',
+            'four': 'четыре',
+            'googol': 'гогола',
+            'last year': 'прошедший год',
+            'midnight': 'полночь',
+            'million': 'миллиона',
+            'morning': 'утро',
+            'next year': 'Следующий год',
+            'nine': 'девять',
+            'nonillion': 'нониллиона',
+            'noon': 'полдень',
+            'now': 'сейчас',
+            'octillion': 'октиллиона',
+            'one': 'один',
+            'quadrillion': 'квадриллиона',
+            'quintillion': 'квинтиллиона',
+            'septillion': 'септиллиона',
+            'seven': 'семь',
+            'sextillion': 'сикстиллиона',
+            'six': 'шесть',
+            'this year': 'этот год',
+            'three': 'три',
+            'today': 'сегодня',
+            'tomorrow': 'завтра',
+            'trillion': 'триллиона',
+            'two': 'два',
+            'yesterday': 'вчера',
+            '{head} and {tail}': '{head} и {tail}',
+            '{time_difference} ago': '{time_difference} назад',
+            '{time_difference} from now': 'через {time_difference}',
+            ('1 year, {amount} day', 0): '1 год, {amount} день',
+            ('1 year, {amount} day', 1): '1 год, {amount} дня',
+            ('1 year, {amount} day', 2): '1 год, {amount} дней',
+            ('1 year, {amount} month', 0): '1 год, {amount} месяц',
+            ('1 year, {amount} month', 1): '1 год, {amount} месяца',
+            ('1 year, {amount} month', 2): '1 год, {amount} месяцев',
+            ('{amount} day', 0): '{amount} день',
+            ('{amount} day', 1): '{amount} дня',
+            ('{amount} day', 2): '{amount} дней',
+            ('{amount} hour', 0): '{amount} час',
+            ('{amount} hour', 1): '{amount} часа',
+            ('{amount} hour', 2): '{amount} часов',
+            ('{amount} microsecond', 0): '{amount} микросекунда',
+            ('{amount} microsecond', 1): '{amount} микросекунды',
+            ('{amount} microsecond', 2): '{amount} микросекунд',
+            ('{amount} millisecond', 0): '{amount} миллисекунда',
+            ('{amount} millisecond', 1): '{amount} миллисекунды',
+            ('{amount} millisecond', 2): '{amount} миллисекун',
+            ('{amount} minute', 0): '{amount} минута',
+            ('{amount} minute', 1): '{amount} минуты',
+            ('{amount} minute', 2): '{amount} минут',
+            ('{amount} month', 0): '{amount} месяц',
+            ('{amount} month', 1): '{amount} месяца',
+            ('{amount} month', 2): '{amount} месяцев',
+            ('{amount} more', 0): 'ещё {amount}',
+            ('{amount} more', 1): 'ещё {amount}',
+            ('{amount} more', 2): 'ещё {amount}',
+            ('{amount} second', 0): '{amount} секунда',
+            ('{amount} second', 1): '{amount} секунды',
+            ('{amount} second', 2): '{amount} секунд',
+            ('{amount} year', 0): '{amount} год',
+            ('{amount} year', 1): '{amount} года',
+            ('{amount} year', 2): '{amount} лет',
+        },
+    ),
+    'sk_SK': (
+        _plural_5,
+        {
+            'content-transfer-encoding': '8bit',
+            'content-type': 'text/plain; charset=UTF-8',
+            'language': 'sk',
+            'language-team': 'sk <LL@li.org>',
+            'last-translator': 'Jose Riha <jose1711 gmail com>',
+            'mime-version': '1.0',
+            'plural-forms': 'nplurals=3; plural=(n==1) ? 0 : (n>=2 && n<=4) ? 1 : 2;',
+            'po-revision-date': '2021-03-09 13:57+0100',
+            'project-id-version': 'humanize',
+            'report-msgid-bugs-to': '',
+            'x-generator': 'Poedit 2.4.1',
+        },
+        {
+            '': 'Project-Id-Version: humanize\nReport-Msgid-Bugs-To: \nPO-Revision-Date: 2021-03-09 13:57+0100\nLast-Translator: Jose Riha <jose1711 gmail com>\nLanguage-Team: sk <LL@li.org>\nLanguage: sk\nMIME-Version: 1.0\nContent-Type: text/plain; charset=UTF-8\nContent-Transfer-Encoding: 8bit\nPlural-Forms: nplurals=3; plural=(n==1) ? 0 : (n>=2 && n<=4) ? 1 : 2;\nX-Generator: Poedit 2.4.1\n',
+            '0\x04th': '.',
+            '1 year, 1 month': '1 rok, 1 mesiac',
+            '1\x04st': '.',
+            '2\x04nd': '.',
+            '3\x04rd': '.',
+            '4\x04th': '.',
+            '5\x04th': '.',
+            '6\x04th': '.',
+            '7\x04th': '.',
+            '8\x04th': '.',
+            '9\x04th': '.',
+            'a day': 'deň',
+            'a minute': 'minútu',
+            'a moment': 'chvíľku',
+            'a month': 'mesiac',
+            'a second': 'sekundu',
+            'a year': 'rok',
+            'afternoon': 'popoludnie',
+            'an hour': 'hodinu',
+            'billion': 'miliardy/árd',
+            'decillion': 'kvintiliardy/árd',
+            'eight': 'osem',
+            'evening': 'večer',
+            'five': 'päť',
+            'four': 'štyri',
+            'googol': 'googola/ov',
+            'last year': 'minulý rok',
+            'midnight': 'polnoc',
+            'million': 'milióna/ov',
+            'morning': 'ráno',
+            'next year': 'ďalší rok',
+            'nine': 'deväť',
+            'nonillion': 'kvintilióna/ov',
+            'noon': 'poludnie',
+            'now': 'teraz',
+            'octillion': 'kvadriliardy/árd',
+            'one': 'jedna',
+            'quadrillion': 'biliardy/árd',
+            'quintillion': 'trilióna/árd',
+            'septillion': 'kvadrilióna/ov',
+            'seven': 'sedem',
+            'sextillion': 'triliardy/árd',
+            'six': 'šesť',
+            'this year': 'tento rok',
+            'three': 'tri',
+            'today': 'dnes',
+            'tomorrow': 'zajtra',
+            'trillion': 'bilióna/ov',
+            'two': 'dve',
+            'yesterday': 'včera',
+            'zero': 'nula',
+            '{head} and {tail}': '{head} a {tail}',
+            '{time_difference} ago': '{time_difference} naspäť',
+            '{time_difference} from now': 'o {time_difference}',
+            ("{hour_count} o'clock", 0): '{hour_count} hodina',
+            ("{hour_count} o'clock", 1): '{hour_count} hodiny',
+            ("{hour_count} o'clock", 2): '{hour_count} hodín',
+            ('1 year, {amount} day', 0): '1 rok, {amount} deň',
+            ('1 year, {amount} day', 1): '1 rok, {amount} dni',
+            ('1 year, {amount} day', 2): '1 rok, {amount} dní',
+            ('1 year, {amount} month', 0): '1 rok, {amount} mesiac',
+            ('1 year, {amount} month', 1): '1 rok, {amount} mesiace',
+            ('1 year, {amount} month', 2): '1 rok, {amount} mesiacov',
+            ('{amount} day', 0): '{amount} deň',
+            ('{amount} day', 1): '{amount} dni',
+            ('{amount} day', 2): '{amount} dní',
+            ('{amount} hour', 0): '{amount} hodina',
+            ('{amount} hour', 1): '{amount} hodiny',
+            ('{amount} hour', 2): '{amount} hodín',
+            ('{amount} microsecond', 0): '{amount} mikrosekundu',
+            ('{amount} microsecond', 1): '{amount} mikrosekundy',
+            ('{amount} microsecond', 2): '{amount} mikrosekúnd',
+            ('{amount} millisecond', 0): '{amount} milisekunda',
+            ('{amount} millisecond', 1): '{amount} milisekundy',
+            ('{amount} millisecond', 2): '{amount} milisekúnd',
+            ('{amount} minute', 0): '{amount} minúta',
+            ('{amount} minute', 1): '{amount} minúty',
+            ('{amount} minute', 2): '{amount} minút',
+            ('{amount} month', 0): '{amount} mesiac',
+            ('{amount} month', 1): '{amount} mesiace',
+            ('{amount} month', 2): '{amount} mesiacov',
+            ('{amount} more', 0): '{amount} ďalší',
+            ('{amount} more', 1): '{amount} ďalšie',
+            ('{amount} more', 2): '{amount} ďalších',
+            ('{amount} second', 0): '{amount} sekunda',
+            ('{amount} second', 1): '{amount} sekundy',
+            ('{amount} second', 2): '{amount} sekúnd',
+            ('{amount} year', 0): '{amount} rok',
+            ('{amount} year', 1): '{amount} roky',
+            ('{amount} year', 2): '{amount} rokov',
+        },
+    ),
+    'tr_TR': (
+        _plural_0,
+        {
+            'content-transfer-encoding': '8bit',
+            'content-type': 'text/plain; charset=UTF-8',
+            'generated-by': 'Emre Çintay',
+            'language': 'tr_TR',
+            'language-team': 'Turkish',
+            'last-translator': 'Emre Çintay <emre@cintay.com>',
+            'mime-version': '1.0',
+            'plural-forms': 'nplurals=2; plural=(n != 1);',
+            'po-revision-date': '2021-03-09 14:47+0100',
+            'project-id-version': 'humanize',
+            'report-msgid-bugs-to': '',
+            'x-generator': 'Poedit 2.4.1',
+        },
+        {
+            '': 'Project-Id-Version: humanize\nReport-Msgid-Bugs-To: \nPO-Revision-Date: 2021-03-09 14:47+0100\nLast-Translator: Emre Çintay <emre@cintay.com>\nLanguage-Team: Turkish\nLanguage: tr_TR\nMIME-Version: 1.0\nContent-Type: text/plain; charset=UTF-8\nContent-Transfer-Encoding: 8bit\nPlural-Forms: nplurals=2; plural=(n != 1);\nX-Generator: Poedit 2.4.1\nGenerated-By: Emre Çintay\n',
+            '0\x04th': '.',
+            '1 year, 1 month': '1 yıl, 1 ay',
+            '1\x04st': '.',
+            '2\x04nd': '.',
+            '3\x04rd': '.',
+            '4\x04th': '.',
+            '5\x04th': '.',
+            '6\x04th': '.',
+            '7\x04th': '.',
+            '8\x04th': '.',
+            '9\x04th': '.',
+            'a day': 'bir gün',
+            'a minute': 'bir dakika',
+            'a moment': 'biraz',
+            'a month': 'bir ay',
+            'a second': 'bir saniye',
+            'a year': 'bir yıl',
+            'afternoon': 'öğleden sonra',
+            'an hour': 'bir saat',
+            'billion': 'milyar',
+            'decillion': 'desilyon',
+            'eight': 'sekiz',
+            'evening': 'akşam',
+            'five': 'beş',
+            'four': 'dört',
+            'googol': 'googol',
+            'last year': 'geçen yıl',
+            'midnight': 'gece yarısı',
+            'million': 'milyon',
+            'morning': 'sabah',
+            'next year': 'gelecek yıl',
+            'nine': 'dokuz',
+            'nonillion': 'nonilyon',
+            'noon': 'öğle vakti',
+            'now': 'şimdi',
+            'octillion': 'oktilyon',
+            'one': 'bir',
+            'quadrillion': 'katrilyon',
+            'quintillion': 'kentilyon',
+            'septillion': 'septilyon',
+            'seven': 'yedi',
+            'sextillion': 'sekstilyon',
+            'six': 'altı',
+            'this year': 'bu yıl',
+            'three': 'üç',
+            'today': 'bugün',
+            'tomorrow': 'yarın',
+            'trillion': 'trilyon',
+            'two': 'iki',
+            'yesterday': 'dün',
+            '{head} and {tail}': '{head} ve {tail}',
+            '{time_difference} ago': '{time_difference} önce',
+            '{time_difference} from now': 'şu andan itibaren {time_difference}',
+            ('1 year, {amount} day', 0): '1 yıl, {amount} gün',
+            ('1 year, {amount} day', 1): '1 yıl, {amount} gün',
+            ('1 year, {amount} month', 0): '1 yıl, {amount} ay',
+            ('1 year, {amount} month', 1): '1 yıl, {amount} ay',
+            ('{amount} day', 0): '{amount} gün',
+            ('{amount} day', 1): '{amount} gün',
+            ('{amount} hour', 0): '{amount} saat',
+            ('{amount} hour', 1): '{amount} saat',
+            ('{amount} microsecond', 0): '{amount} mikrosaniye',
+            ('{amount} microsecond', 1): '{amount} mikrosaniye',
+            ('{amount} millisecond', 0): '{amount} milisaniye',
+            ('{amount} millisecond', 1): '{amount} milisaniye',
+            ('{amount} minute', 0): '{amount} dakika',
+            ('{amount} minute', 1): '{amount} dakika',
+            ('{amount} month', 0): '{amount} ay',
+            ('{amount} month', 1): '{amount} ay',
+            ('{amount} more', 0): '{amount} tane daha',
+            ('{amount} more', 1): '{amount} tane daha',
+            ('{amount} second', 0): '{amount} saniye',
+            ('{amount} second', 1): '{amount} saniye',
+            ('{amount} year', 0): '{amount} yıl',
+            ('{amount} year', 1): '{amount} yıl',
+        },
+    ),
+    'uk_UA': (
+        _plural_4,
+        {
+            'content-transfer-encoding': '8bit',
+            'content-type': 'text/plain; charset=utf-8',
+            'generated-by': '',
+            'language': 'uk',
+            'language-team': 'uk_UA',
+            'last-translator': 'TL',
+            'mime-version': '1.0',
+            'plural-forms': 'nplurals=3; plural=(n%10==1 && n%100!=11 ? 0 : n%10>=2 && n%10<=4 && (n%100<10 || n%100>=20) ? 1 : 2);',
+            'po-revision-date': '',
+            'project-id-version': 'PROJECT VERSION',
+            'report-msgid-bugs-to': '',
+            'x-generator': 'Poedit 2.4.1',
+        },
+        {
+            '': 'Project-Id-Version: PROJECT VERSION\nReport-Msgid-Bugs-To: \nPO-Revision-Date: \nLast-Translator: TL\nLanguage-Team: uk_UA\nLanguage: uk\nMIME-Version: 1.0\nContent-Type: text/plain; charset=utf-8\nContent-Transfer-Encoding: 8bit\nPlural-Forms: nplurals=3; plural=(n%10==1 && n%100!=11 ? 0 : n%10>=2 && n%10<=4 && (n%100<10 || n%100>=20) ? 1 : 2);\nGenerated-By: \nX-Generator: Poedit 2.4.1\n',
+            '0\x04th': 'ий',
+            '1 year, 1 month': '1 рік, 1 місяць',
+            '1\x04st': 'ий',
+            '2\x04nd': 'ий',
+            '3\x04rd': 'ій',
+            '4\x04th': 'ий',
+            '5\x04th': 'ий',
+            '6\x04th': 'ий',
+            '7\x04th': 'ий',
+            '8\x04th': 'ий',
+            '9\x04th': 'ий',
+            'a day': 'день',
+            'a minute': 'хвилина',
+            'a moment': 'у цей момент',
+            'a month': 'місяць',
+            'a second': 'секунду',
+            'a year': 'рік',
+            'afternoon': 'вдень',
+            'an hour': 'година',
+            'billion': 'мільярдів',
+            'decillion': 'децильйонів',
+            'eight': 'вісім',
+            'evening': 'вечірній',
+            'five': "п'ять",
+            'four': 'чотири',
+            'googol': 'гугола',
+            'last year': 'минулого року',
+            'midnight': 'опівночі',
+            'million': 'мільйонів',
+            'morning': 'вранці',
+            'next year': 'наступного року',
+            'nine': "дев'ять",
+            'nonillion': 'нонильйонів',
+            'noon': 'полудень',
+            'now': 'зараз',
+            'octillion': 'октильйонів',
+            'one': 'один',
+            'quadrillion': 'квадрильйонів',
+            'quintillion': 'квинтиліонів',
+            'septillion': 'септильйонів',
+            'seven': 'сім',
+            'sextillion': 'сикстильйонів',
+            'six': 'шість',
+            'this year': 'цього року',
+            'three': 'три',
+            'today': 'сьогодні',
+            'tomorrow': 'завтра',
+            'trillion': 'трильйонів',
+            'two': 'два',
+            'yesterday': 'вчора',
+            'zero': 'нуль',
+            '{head} and {tail}': '{head} i {tail}',
+            '{time_difference} ago': '{time_difference} тому',
+            '{time_difference} from now': 'через {time_difference}',
+            ("{hour_count} o'clock", 0): '{hour_count} година',
+            ("{hour_count} o'clock", 1): '{hour_count} години',
+            ("{hour_count} o'clock", 2): '{hour_count} годин',
+            ('1 year, {amount} day', 0): '1 рік, {amount} день',
+            ('1 year, {amount} day', 1): '1 рік, {amount} дні',
+            ('1 year, {amount} day', 2): '1 рік, {amount} годин',
+            ('1 year, {amount} month', 0): '1 рік, {amount} місяць',
+            ('1 year, {amount} month', 1): '1 рік, {amount} місяці',
+            ('1 year, {amount} month', 2): '1 рік, {amount} місяців',
+            ('{amount} day', 0): '{amount} день',
+            ('{amount} day', 1): '{amount} дні',
+            ('{amount} day', 2): '{amount} днів',
+            ('{amount} hour', 0): '{amount} година',
+            ('{amount} hour', 1): '{amount} години',
+            ('{amount} hour', 2): '{amount} годин',
+            ('{amount} microsecond', 0): '{amount} мікросекунда',
+            ('{amount} microsecond', 1): '{amount} мікросекунди',
+            ('{amount} microsecond', 2): '{amount} мікросекунд',
+            ('{amount} millisecond', 0): '{amount} мілісекунда',
+            ('{amount} millisecond', 1): '{amount} мілісекунди',
+            ('{amount} millisecond', 2): '{amount} мілісекунд',
+            ('{amount} minute', 0): '{amount} хвилина',
+            ('{amount} minute', 1): '{amount} хвилини',
+            ('{amount} minute', 2): '{amount} хвилин',
+            ('{amount} month', 0): '{amount} місяць',
+            ('{amount} month', 1): '{amount} місяці',
+            ('{amount} month', 2): '{amount} місяців',
+            ('{amount} more', 0): 'ще {amount}',
+            ('{amount} more', 1): 'ще {amount}',
+            ('{amount} more', 2): 'ще {amount}',
+            ('{amount} second', 0): '{amount} секунда',
+            ('{amount} second', 1): '{amount} секунди',
+            ('{amount} second', 2): '{amount} секунди',
+            ('{amount} year', 0): '{amount} рік',
+            ('{amount} year', 1): '{amount} роки',
+            ('{amount} year', 2): '{amount} років',
+        },
+    ),
+    'vi_VI': (
+        _plural_1,
+        {
+            'content-transfer-encoding': '8bit',
+            'content-type': 'text/plain; charset=UTF-8',
+            'generated-by': 'Babel 0.9.6',
+            'language': 'vi_VN',
+            'language-team': 'vi_VI <sapd@vccloud.vn>',
+            'last-translator': 'Olivier Cortès <oc@1flow.io>',
+            'mime-version': '1.0',
+            'plural-forms': 'nplurals=2; plural=(n > 1);',
+            'po-revision-date': '2021-03-09 18:36+0100',
+            'project-id-version': 'PROJECT VERSION',
+            'report-msgid-bugs-to': '',
+            'x-generator': 'Poedit 2.4.1',
+        },
+        {
+            '': 'Project-Id-Version: PROJECT VERSION\nReport-Msgid-Bugs-To: \nPO-Revision-Date: 2021-03-09 18:36+0100\nLast-Translator: Olivier Cortès <oc@1flow.io>\nLanguage-Team: vi_VI <sapd@vccloud.vn>\nLanguage: vi_VN\nMIME-Version: 1.0\nContent-Type: text/plain; charset=UTF-8\nContent-Transfer-Encoding: 8bit\nPlural-Forms: nplurals=2; plural=(n > 1);\nGenerated-By: Babel 0.9.6\nX-Generator: Poedit 2.4.1\n',
+            '0\x04th': '.',
+            '1 year, 1 month': '1 năm 1 tháng',
+            '1\x04st': '.',
+            '2\x04nd': '.',
+            '3\x04rd': '.',
+            '4\x04th': '.',
+            '5\x04th': '.',
+            '6\x04th': '.',
+            '7\x04th': '.',
+            '8\x04th': '.',
+            '9\x04th': '.',
+            'a day': 'một ngày',
+            'a minute': 'một phút',
+            'a moment': 'ngay lúc này',
+            'a month': 'một tháng',
+            'a second': 'một giây',
+            'a year': 'một năm',
+            'afternoon': 'buổi chiều',
+            'an hour': 'một giờ',
+            'billion': 'tỷ',
+            'eight': 'tám',
+            'evening': 'tối',
+            'five': 'năm',
+            'four': 'bốn',
+            'last year': 'năm ngoái',
+            'midnight': 'nửa đêm',
+            'million': '%(value)s\xa0triệu',
+            'morning': 'buổi sáng',
+            'next year': 'năm sau',
+            'nine': 'chín',
+            'noon': 'không bật',
+            'now': 'ngay bây giờ',
+            'one': 'một',
+            'quadrillion': '%(value)s triệu tỷ',
+            'seven': 'bảy',
+            'six': 'sáu',
+            'this year': 'năm nay',
+            'three': 'ba',
+            'today': 'hôm nay',
+            'tomorrow': 'ngày mai',
+            'trillion': '%(value)s\xa0nghìn tỷ',
+            'two': 'hai',
+            'yesterday': 'ngày hôm qua',
+            '{head} and {tail}': '{head} và {tail}',
+            '{time_difference} ago': '{time_difference} trước',
+            '{time_difference} from now': '{time_difference} ngày tới',
+            ("{hour_count} o'clock", 0): '{hour_count} giờ',
+            ("{hour_count} o'clock", 1): '{hour_count} giờ',
+            ('1 year, {amount} day', 0): '1 năm {amount} ngày',
+            ('1 year, {amount} day', 1): '1 năm {amount} ngày',
+            ('1 year, {amount} month', 0): '1 năm {amount} tháng',
+            ('1 year, {amount} month', 1): '1 năm {amount} tháng',
+            ('{amount} hour', 0): '{amount} giờ',
+            ('{amount} hour', 1): '{amount} giờ',
+            ('{amount} microsecond', 0): '{amount} micro giây',
+            ('{amount} microsecond', 1): '{amount} micro giây',
+            ('{amount} millisecond', 0): '{amount} mili giây',
+            ('{amount} millisecond', 1): '{amount} mili giây',
+            ('{amount} minute', 0): '{amount} phút',
+            ('{amount} minute', 1): '{amount} phút',
+            ('{amount} month', 0): '{amount} tháng',
+            ('{amount} month', 1): '{amount} tháng',
+            ('{amount} more', 0): 'thêm {amount}',
+            ('{amount} more', 1): 'thêm {amount}',
+            ('{amount} second', 0): '{amount} giây',
+            ('{amount} second', 1): '{amount} giây',
+            ('{amount} year', 0): '{amount} năm',
+            ('{amount} year', 1): '{amount} năm',
+        },
+    ),
+    'zh_CN': (
+        _plural_1,
+        {
+            'content-transfer-encoding': '8bit',
+            'content-type': 'text/plain; charset=UTF-8',
+            'language': 'zh_CN',
+            'language-team': 'Chinese (simplified)',
+            'last-translator': 'Liwen SUN <sunliwen@gmail.com>',
+            'mime-version': '1.0',
+            'plural-forms': 'nplurals=2; plural=(n > 1);',
+            'po-revision-date': '2021-03-09 18:47+0100',
+            'project-id-version': '1.0',
+            'report-msgid-bugs-to': '',
+            'x-generator': 'Poedit 2.4.1',
+        },
+        {
+            '': 'Project-Id-Version: 1.0\nReport-Msgid-Bugs-To: \nPO-Revision-Date: 2021-03-09 18:47+0100\nLast-Translator: Liwen SUN <sunliwen@gmail.com>\nLanguage-Team: Chinese (simplified)\nLanguage: zh_CN\nMIME-Version: 1.0\nContent-Type: text/plain; charset=UTF-8\nContent-Transfer-Encoding: 8bit\nPlural-Forms: nplurals=2; plural=(n > 1);\nX-Generator: Poedit 2.4.1\n',
+            '0\x04th': '第',
+            '1 year, 1 month': '1年又1月',
+            '1\x04st': '第',
+            '2\x04nd': '第',
+            '3\x04rd': '第',
+            '4\x04th': '第',
+            '5\x04th': '第',
+            '6\x04th': '第',
+            '7\x04th': '第',
+            '8\x04th': '第',
+            '9\x04th': '第',
+            'a day': '1天',
+            'a minute': '1分',
+            'a moment': '一会儿',
+            'a month': '1月',
+            'a second': '1秒',
+            'a year': '1年',
+            'afternoon': '下午',
+            'an hour': '1小时',
+            'billion': '十亿',
+            'decillion': '十沟',
+            'eight': '八',
+            'evening': '晚上',
+            'five': '五',
+            'four': '四',
+            'googol': '古高尔',
+            'last year': '去年',
+            'midnight': '午夜',
+            'million': '百万',
+            'morning': '早晨',
+            'next year': '明年',
+            'nine': '九',
+            'nonillion': '百穰',
+            'noon': '中午',
+            'now': '现在',
+            'octillion': '千秭',
+            'one': '一',
+            'quadrillion': '万亿',
+            'quintillion': '百京',
+            'septillion': '秭',
+            'seven': '七',
+            'sextillion': '十垓',
+            'six': '六',
+            'this year': '今年',
+            'three': '三',
+            'today': '今天',
+            'tomorrow': '明天',
+            'trillion': '兆',
+            'two': '二',
+            'yesterday': '昨天',
+            '{head} and {tail}': '{head}{tail}',
+            '{time_difference} ago': '{time_difference}之前',
+            '{time_difference} from now': '{time_difference}之后',
+            ("{hour_count} o'clock", 0): '{hour_count}点',
+            ("{hour_count} o'clock", 1): '{hour_count}点',
+            ('1 year, {amount} day', 0): '1年零{amount}天',
+            ('1 year, {amount} day', 1): '1年零{amount}天',
+            ('1 year, {amount} month', 0): '1年又{amount}月',
+            ('1 year, {amount} month', 1): '1年又{amount}月',
+            ('{amount} day', 0): '{amount}天',
+            ('{amount} day', 1): '{amount}天',
+            ('{amount} hour', 0): '{amount}小时',
+            ('{amount} hour', 1): '{amount}小时',
+            ('{amount} microsecond', 0): '{amount}微秒',
+            ('{amount} microsecond', 1): '{amount}微秒',
+            ('{amount} millisecond', 0): '{amount}毫秒',
+            ('{amount} millisecond', 1): '{amount}毫秒',
+            ('{amount} minute', 0): '{amount}分',
+            ('{amount} minute', 1): '{amount}分',
+            ('{amount} month', 0): '{amount}月',
+            ('{amount} month', 1): '{amount}月',
+            ('{amount} more', 0): '另外{amount}项',
+            ('{amount} more', 1): '另外{amount}项',
+            ('{amount} second', 0): '{amount}秒',
+            ('{amount} second', 1): '{amount}秒',
+            ('{amount} year', 0): '{amount}年',
+            ('{amount} year', 1): '{amount}年',
+        },
+    ),
+    'zh_TW': (
+        _plural_2,
+        {
+            'content-transfer-encoding': '8bit',
+            'content-type': 'text/plain; charset=UTF-8',
+            'language': 'zh_TW',
+            'language-team': '',
+            'last-translator': '',
+            'mime-version': '1.0',
+            'plural-forms': 'nplurals=1; plural=0;',
+            'po-revision-date': '',
+            'project-id-version': '',
+            'report-msgid-bugs-to': '',
+            'x-generator': 'Poedit 2.4.1',
+        },
+        {
+            '': 'Project-Id-Version: \nReport-Msgid-Bugs-To: \nPO-Revision-Date: \nLast-Translator: \nLanguage-Team: \nLanguage: zh_TW\nMIME-Version: 1.0\nContent-Type: text/plain; charset=UTF-8\nContent-Transfer-Encoding: 8bit\nPlural-Forms: nplurals=1; plural=0;\nX-Generator: Poedit 2.4.1\n',
+            '0\x04th': 'th',
+            '1 year, 1 month': '1年又1月',
+            '1\x04st': 'st',
+            '2\x04nd': 'nd',
+            '3\x04rd': 'rd',
+            '4\x04th': 'th',
+            '5\x04th': 'th',
+            '6\x04th': 'th',
+            '7\x04th': 'th',
+            '8\x04th': 'th',
+            '9\x04th': 'th',
+            'a day': '1天',
+            'a minute': '1分',
+            'a moment': '稍早前',
+            'a month': '1月',
+            'a second': '1秒',
+            'a year': '1年',
+            'afternoon': '下午',
+            'an hour': '1小時',
+            'billion': '十億',
+            'decillion': '十溝',
+            'eight': '八',
+            'evening': '晚上',
+            'five': '五',
+            'four': '四',
+            'googol': '古戈爾',
+            'last year': '去年',
+            'midnight': '午夜',
+            'million': '百萬',
+            'morning': '早晨',
+            'next year': '明年',
+            'nine': '九',
+            'nonillion': '百穰',
+            'noon': '中午',
+            'now': '現在',
+            'octillion': '千秭',
+            'one': '一',
+            'quadrillion': '千兆',
+            'quintillion': '百京',
+            'septillion': '秭',
+            'seven': '七',
+            'sextillion': '十垓',
+            'six': '六',
+            'this year': '今年',
+            'three': '三',
+            'today': '今天',
+            'tomorrow': '明天',
+            'trillion': '兆',
+            'two': '二',
+            'yesterday': '昨天',
+            'zero': '零',
+            '{head} and {tail}': '{head}和{tail}',
+            '{time_difference} ago': '{time_difference}之前',
+            '{time_difference} from now': '{time_difference}之後',
+            ("{hour_count} o'clock", 0): '{hour_count}點',
+            ('1 year, {amount} day', 0): '1年又{amount}年',
+            ('1 year, {amount} month', 0): '1年又{amount}月',
+            ('{amount} day', 0): '{amount}天',
+            ('{amount} hour', 0): '{amount}小時',
+            ('{amount} microsecond', 0): '{amount}微秒',
+            ('{amount} millisecond', 0): '{amount}毫秒',
+            ('{amount} minute', 0): '{amount}分',
+            ('{amount} month', 0): '{amount}月',
+            ('{amount} more', 0): '另外{amount}項',
+            ('{amount} second', 0): '{amount}秒',
+            ('{amount} year', 0): '{amount}年',
+        },
+    ),
+}
@@ -0,0 +1,26 @@
+"""Optional NumPy support of the functions humanizing many values."""
+
+from __future__ import annotations
+
+from types import ModuleType
+
+
+def numpy_module(values: object) -> ModuleType | None:
+    """Return NumPy if `values` is a NumPy array, else None.
+
+    NumPy is an optional dependency, so it is never imported for other
+    values. Only NumPy builds objects with a ``dtype``, so NumPy is already
+    importable when one is given.
+
+    Args:
+        values: values given to a function humanizing many values.
+
+    Returns:
+        ModuleType | None: the ``numpy`` module, or None.
+
+    """
+    if not hasattr(values, "dtype"):
+        return None
+    import numpy
+
+    return numpy
@@ -0,0 +1,246 @@
+"""Single-file bundle of the catalogs of every locale.
+
+Loading a locale normally opens and parses its own ``.mo`` file. The bundle
+is a generated Python module, ``_bundle.py``, holding the messages of every
+locale with their plural-form functions already compiled, so that all
+catalogs are loaded with the single read of its bytecode.
+
+Regenerate it after changing a catalog with:
+
+    python -m human_readable.bundle
+"""
+
+from __future__ import annotations
+
+import gettext
+import os.path
+import re
+import sys
+from collections.abc import Callable
+
+import human_readable.i18n as i18n
+
+
+__all__ = ["BundledTranslations", "build", "install"]
+
+_DEFAULT_OUTPUT = os.path.join(os.path.dirname(__file__), "_bundle.py")
+_HEADER = '''"""Catalogs of every bundled locale.
+
+Generated by ``python -m human_readable.bundle`` from the ``.mo`` files of
+the ``locale`` folder, do not edit.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+'''
+
+
+class BundledTranslations(gettext.GNUTranslations):
+    """Translations of a locale, built from the bundle instead of a file.
+
+    Args:
+        plural: plural-form function.
+        info: metadata of the catalog.
+        catalog: messages, like ``gettext.GNUTranslations`` stores them.
+
+    """
+
+    # set by gettext.NullTranslations, which typeshed does not declare
+    _catalog: dict[str | tuple[str, int], str]
+    _charset: str | None
+    _info: dict[str, str]
+
+    def __init__(
+        self,
+        plural: Callable[[int], int],
+        info: dict[str, str],
+        catalog: dict[str | tuple[str, int], str],
+    ) -> None:
+        """Use the compiled plural function and messages of the bundle."""
+        super().__init__()
+        self.plural = plural
+        self._info = info
+        self._charset = info["content-type"].split("charset=")[1]
+        self._catalog = catalog
+
+
+def build(path: str | None = None) -> str:
+    """Return the source of the bundle of the catalogs found in `path`.
+
+    Args:
+        path: Path to search for locales. Defaults to the bundled locales.
+
+    Returns:
+        str: source of the bundle module.
+
+    Raises:
+        ValueError: if the locale folder is unknown, or a catalog has invalid
+            plural forms.
+
+    """
+    path = path or i18n._get_default_locale_path()
+    if path is None:
+        raise ValueError(
+            "Human readable cannot determinate the default location of the "
+            "'locale' folder. You need to pass the path explicitly."
+        )
+    plurals: dict[str, str] = {}
+    catalogs = []
+    for locale in sorted(os.listdir(path)):
+        translation = gettext.translation("human_readable", path, [locale])
+        info = translation.info()
+        expression = _plural_expression(info)
+        name = plurals.setdefault(expression, f"_plural_{len(plurals)}")
+        catalog = translation._catalog  # type: ignore[attr-defined]
+        lines = [
+            f"    {locale!r}: (",
+            f"        {name},",
+            "        {",
+            *(f"            {key!r}: {info[key]!r}," for key in sorted(info)),
+            "        },",
+            "        {",
+            *(
+                f"            {key!r}: {catalog[key]!r},"
+                for key in sorted(catalog, key=repr)
+            ),
+            "        },",
+            "    ),",
+        ]
+        catalogs.append("\n".join(lines))
+    functions = [
+        f"\n\ndef {name}(n: int) -> int:\n    return int({expression})\n"
+        for expression, name in plurals.items()
+    ]
+    return (
+        _HEADER
+        + "".join(functions)
+        + "\n\nCATALOGS: dict[\n"
+        + "    str,\n"
+        + "    tuple[\n"
+        + "        Callable[[int], int],\n"
+        + "        dict[str, str],\n"
+        + "        dict[str | tuple[str, int], str],\n"
+        + "    ],\n"
+        + "] = {\n"
+        + "\n".join(catalogs)
+        + "\n}\n"
+    )
+
+
+def _plural_expression(info: dict[str, str]) -> str:
+    """Return the plural-form expression of a catalog in Python syntax."""
+    if "plural-forms" not in info:
+        return "n != 1"
+    plural = info["plural-forms"].split(";")[1].split("plural=")[1]
+    tokens = _PLURAL_TOKEN.findall(plural)
+    if "".join(tokens) != "".join(plural.split()):
+        raise ValueError(f"invalid plural forms: {plural!r}")
+    # popped from the end
+    tokens.reverse()
+    expression = _plural_ternary(tokens, plural)
+    if tokens:
+        raise ValueError(f"invalid plural forms: {plural!r}")
+    return expression
+
+
+# tokens of the C subset of plural forms, see gettext.c2py
+_PLURAL_TOKEN = re.compile(r"\d+|n|&&|\|\||[=!<>]=|[-+*/%<>?:()!]")
+# precedence and Python operator of the binary operators
+_PLURAL_BINARY = {
+    "||": (1, "or"),
+    "&&": (2, "and"),
+    "==": (3, "=="),
+    "!=": (3, "!="),
+    "<": (4, "<"),
+    "<=": (4, "<="),
+    ">": (4, ">"),
+    ">=": (4, ">="),
+    "+": (5, "+"),
+    "-": (5, "-"),
+    "*": (6, "*"),
+    "/": (6, "//"),
+    "%": (6, "%"),
+}
+
+
+def _plural_ternary(tokens: list[str], plural: str) -> str:
+    """Translate ``condition ? then : otherwise``, the lowest precedence."""
+    condition = _plural_binary(tokens, plural, 0)
+    if not tokens or tokens[-1] != "?":
+        return condition
+    tokens.pop()
+    then = _plural_ternary(tokens, plural)
+    if not tokens or tokens.pop() != ":":
+        raise ValueError(f"invalid plural forms: {plural!r}")
+    otherwise = _plural_ternary(tokens, plural)
+    return f"({then} if {condition} else {otherwise})"
+
+
+def _plural_binary(tokens: list[str], plural: str, precedence: int) -> str:
+    """Translate binary operators binding tighter than `precedence`."""
+    left = _plural_operand(tokens, plural)
+    while tokens and _PLURAL_BINARY.get(tokens[-1], (0, ""))[0] > precedence:
+        operator_precedence, operator = _PLURAL_BINARY[tokens.pop()]
+        right = _plural_binary(tokens, plural, operator_precedence)
+        # parenthesized, as C does not chain comparisons like Python
+        left = f"({left} {operator} {right})"
+    return left
+
+
+def _plural_operand(tokens: list[str], plural: str) -> str:
+    """Translate `n`, a number, a negation or a parenthesized expression."""
+    token = tokens.pop() if tokens else ""
+    if token == "!":
+        return f"(not {_plural_operand(tokens, plural)})"
+    if token == "(":
+        expression = _plural_ternary(tokens, plural)
+        if tokens and tokens.pop() == ")":
+            return expression
+    elif token == "n" or token.isdigit():
+        return token
+    raise ValueError(f"invalid plural forms: {plural!r}")
+
+
+def install() -> list[str]:
+    """Load the catalogs of every locale from the bundle.
+
+    Later calls to `i18n.activate`, `i18n.activated` and `i18n.load` without
+    `path` use these catalogs instead of opening ``.mo`` files.
+
+    Example:
+        >>> from human_readable import i18n
+        >>> "pt_BR" in install()
+        True
+        >>> with i18n.activated("pt_BR"):
+        ...     i18n.gettext("today")
+        'hoje'
+
+    Returns:
+        list[str]: installed locales.
+
+    """
+    from human_readable._bundle import CATALOGS
+
+    for locale, (plural, info, catalog) in CATALOGS.items():
+        i18n._TRANSLATIONS[locale] = BundledTranslations(plural, info, catalog)
+    return list(CATALOGS)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Write the bundle of the catalogs."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--path", help="path to search for locales")
+    parser.add_argument(
+        "--output", default=_DEFAULT_OUTPUT, help="file to write the bundle to"
+    )
+    args = parser.parse_args(argv)
+    with open(args.output, "w", encoding="utf-8") as output:
+        output.write(build(args.path))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,187 @@
+"""Translation catalogs read on demand from memory-mapped `.mo` files."""
+
+from __future__ import annotations
+
+import functools
+import gettext
+import mmap
+import struct
+from collections.abc import Callable
+from typing import IO
+from typing import Any
+
+
+__all__ = ["MappedTranslations"]
+
+
+class MappedTranslations(gettext.GNUTranslations):
+    """Translations looked up in a memory-mapped `.mo` file.
+
+    ``gettext.GNUTranslations`` decodes every message of the file into a dict
+    when it is loaded. This class maps the file instead and binary searches
+    its table of original strings, which GNU ``msgfmt`` sorts, decoding only
+    the messages that are looked up; the most recent lookups are cached.
+    Processes loading the same catalogs share the pages of the file through
+    the page cache of the operating system instead of holding private copies.
+
+    Lookups give the same results as ``gettext.GNUTranslations``. Pass this
+    class to `i18n.load` or `i18n.activate` to use it:
+
+    Example:
+        >>> from human_readable import i18n
+        >>> translation = i18n.load("pt_BR", class_=MappedTranslations)
+        >>> translation.gettext("today")
+        'hoje'
+
+    """
+
+    # set by gettext.NullTranslations, which typeshed does not declare
+    _charset: str | None
+    _fallback: gettext.NullTranslations | None
+    _info: dict[str, str]
+    plural: Callable[[int], int]
+
+    def _parse(self, fp: IO[bytes]) -> None:  # type: ignore[override]
+        """Map the file and read its header, without decoding messages."""
+        filename = getattr(fp, "name", "")
+        self.plural = lambda n: int(n != 1)  # germanic plural by default
+        self._map = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+        magic = struct.unpack("<I", self._map[:4])[0]
+        if magic == self.LE_MAGIC:
+            order = "<"
+        elif magic == self.BE_MAGIC:
+            order = ">"
+        else:
+            raise OSError(0, "Bad magic number", filename)
+        version, self._count, originals, translations = struct.unpack(
+            f"{order}4I", self._map[4:20]
+        )
+        major_version = version >> 16
+        if major_version not in self.VERSIONS:
+            raise OSError(
+                0, "Bad version number " + str(major_version), filename
+            )
+        self._entry = struct.Struct(f"{order}II")
+        self._originals = originals
+        self._translations = translations
+        self._lookup = functools.lru_cache(maxsize=256)(self._find)
+        header = self._index(b"")
+        if header is not None:
+            self._parse_header(self._translation(header).decode())
+
+    def _parse_header(self, header: str) -> None:
+        """Read charset, plural forms and other metadata of the catalog."""
+        last_key = None
+        for line in header.split("\n"):
+            item = line.strip()
+            if not item or (
+                item.startswith("#-#-#-#-#") and item.endswith("#-#-#-#-#")
+            ):
+                continue
+            if ":" in item:
+                key, value = item.split(":", 1)
+                last_key = key.strip().lower()
+                self._info[last_key] = value = value.strip()
+                if last_key == "content-type":
+                    self._charset = value.split("charset=")[1]
+                elif last_key == "plural-forms":
+                    plural = value.split(";")[1].split("plural=")[1]
+                    self.plural = gettext.c2py(plural)
+            elif last_key:
+                self._info[last_key] += "\n" + item
+
+    def _original(self, index: int) -> bytes:
+        length, offset = self._entry.unpack_from(
+            self._map, self._originals + 8 * index
+        )
+        return self._map[offset : offset + length]
+
+    def _translation(self, index: int) -> bytes:
+        length, offset = self._entry.unpack_from(
+            self._map, self._translations + 8 * index
+        )
+        return self._map[offset : offset + length]
+
+    def _index(self, key: bytes) -> int | None:
+        """Return the index of the original string `key`, if any."""
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            # plural entries are looked up by their singular
+            if self._original(middle).partition(b"\x00")[0] < key:
+                low = middle + 1
+            else:
+                high = middle
+        if low < self._count:
+            if self._original(low).partition(b"\x00")[0] == key:
+                return low
+        return None
+
+    def _find(self, message: str) -> tuple[bool, tuple[str, ...]] | None:
+        """Return whether `message` has plural forms and its translations."""
+        charset = self._charset or "ascii"
+        try:
+            index = self._index(message.encode(charset))
+        except UnicodeEncodeError:
+            return None
+        if index is None:
+            return None
+        translation = str(self._translation(index), charset)
+        if b"\x00" in self._original(index):
+            return True, tuple(translation.split("\x00"))
+        return False, (translation,)
+
+    def _singular(self, message: str) -> str | None:
+        found = self._lookup(message)
+        if found is None:
+            return None
+        plural, forms = found
+        if not plural:
+            return forms[0]
+        return self._form(forms, 1)
+
+    def _form(self, forms: tuple[str, ...], n: Any) -> str | None:
+        index = self.plural(n)
+        return forms[index] if index < len(forms) else None
+
+    def _plural(self, message: str, n: Any) -> str | None:
+        found = self._lookup(message)
+        if found is None or not found[0]:
+            return None
+        return self._form(found[1], n)
+
+    def gettext(self, message: str) -> str:
+        """Return the translation of `message`."""
+        translation = self._singular(message)
+        if translation is not None:
+            return translation
+        if self._fallback:
+            return self._fallback.gettext(message)
+        return message
+
+    def ngettext(self, msgid1: str, msgid2: str, n: int) -> str:
+        """Return the translation of `msgid1` or `msgid2` for `n`."""
+        translation = self._plural(msgid1, n)
+        if translation is not None:
+            return translation
+        if self._fallback:
+            return self._fallback.ngettext(msgid1, msgid2, n)
+        return msgid1 if n == 1 else msgid2
+
+    def pgettext(self, context: str, message: str) -> str:
+        """Return the translation of `message` in `context`."""
+        translation = self._singular(self.CONTEXT % (context, message))
+        if translation is not None:
+            return translation
+        if self._fallback:
+            return self._fallback.pgettext(context, message)
+        return message
+
+    def npgettext(self, context: str, msgid1: str, msgid2: str, n: int) -> str:
+        """Return the translation of `msgid1` or `msgid2` in `context`."""
+        translation = self._plural(self.CONTEXT % (context, msgid1), n)
+        if translation is not None:
+            return translation
+        if self._fallback:
+            return self._fallback.npgettext(context, msgid1, msgid2, n)
+        return msgid1 if n == 1 else msgid2
@@ -1,5 +1,57 @@
 """Bits & Bytes related humanization."""
 
+from __future__ import annotations
+
+import bisect
+import math
+import re
+from collections.abc import Iterable
+
+from human_readable._numpy import numpy_module
+
+
+__all__ = [
+    "file_size",
+    "file_size_many",
+    "parse_file_size",
+    "parse_file_size_many",
+]
+
+_DECIMAL_SUFFIXES = (" KB", " MB", " GB", " TB", " PB", " EB", " ZB", " YB")
+_BINARY_SUFFIXES = (
+    " KiB",
+    " MiB",
+    " GiB",
+    " TiB",
+    " PiB",
+    " EiB",
+    " ZiB",
+    " YiB",
+)
+_GNU_SUFFIXES = ("K", "M", "G", "T", "P", "E", "Z", "Y")
+# upper bound (exclusive) of each suffix, by base
+_THRESHOLDS = {
+    base: [base ** (i + 2) for i in range(8)] for base in (1000, 1024)
+}
+# number with optional fraction and exponent, then unit, e.g. "1.2 GiB"
+_SIZE = re.compile(
+    r"\s*([-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)\s*([A-Za-z]*)\s*",
+    re.ASCII,
+)
+# bytes per unit, by lowercase unit: "kb" is decimal, "k" (GNU), "ki" and
+# "kib" are binary
+_MULTIPLIERS: dict[str, int] = {
+    "": 1,
+    "b": 1,
+    "byte": 1,
+    "bytes": 1,
+    **{
+        f"{prefix}{suffix}": (1000 if suffix == "b" else 1024) ** power
+        for power, prefix in enumerate("kmgtpezy", 1)
+        for suffix in ("", "b", "i", "ib")
+    },
+}
+
 
 def file_size(
     value: int,
@@ -31,35 +83,188 @@ def file_size(
         str: file size in natural language.
 
     """
-    if gnu:
-        suffixes = ("K", "M", "G", "T", "P", "E", "Z", "Y")
-    elif binary:
-        suffixes = (
-            " KiB",
-            " MiB",
-            " GiB",
-            " TiB",
-            " PiB",
-            " EiB",
-            " ZiB",
-            " YiB",
-        )
+    base, suffixes = _units(binary, gnu)
+    if value < base:
+        return _small_size(value, gnu, small_formatting)
+    index = bisect.bisect_right(_THRESHOLDS[base], float(value))
+    return _large_size(value, index, base, suffixes, formatting)
+
+
+def file_size_many(
+    values: Iterable[int],
+    binary: bool = False,
+    gnu: bool = False,
+    formatting: str = ".1f",
+    small_formatting: str = "",
+) -> list[str]:
+    """Return human-readable file sizes for many values at once.
+
+    Output is identical to calling ``file_size`` on every value with the same
+    arguments, but the suffix table is resolved once and the unit of every
+    value is found by binary search. NumPy integer arrays are accepted too
+    (install the ``numpy`` extra); their units are computed in a single
+    vectorized ``searchsorted`` call.
+
+    Examples:
+        >>> file_size_many([1, 300, 2900000])
+        ['1 Byte', '300 Bytes', '2.9 MB']
+        >>> file_size_many([300, 2900000], gnu=True)
+        ['300B', '2.8M']
+
+    Args:
+        values: sizes as a sequence, ``array.array`` or NumPy array.
+        binary: binary format. Defaults to False.
+        gnu: GNU format. Defaults to False.
+        formatting: format pattern (applied to a float). Defaults to ".1f".
+        small_formatting: format pattern for small values (applied to an int). Defaults to "".
+
+    Returns:
+        list[str]: file sizes in natural language.
+
+    """
+    base, suffixes = _units(binary, gnu)
+    thresholds = _THRESHOLDS[base]
+    numpy = numpy_module(values)
+    if numpy is not None:
+        array = numpy.asarray(values)
+        indexes = numpy.searchsorted(
+            numpy.array(thresholds, dtype=float), array, side="right"
+        ).tolist()
+        sizes = array.tolist()
     else:
-        suffixes = (" KB", " MB", " GB", " TB", " PB", " EB", " ZB", " YB")
+        sizes = list(values)
+        indexes = [bisect.bisect_right(thresholds, float(v)) for v in sizes]
+    return [
+        _small_size(value, gnu, small_formatting)
+        if value < base
+        else _large_size(value, index, base, suffixes, formatting)
+        for value, index in zip(sizes, indexes)
+    ]
 
-    base = 1024 if (gnu or binary) else 1000
 
-    if value == 1 and not gnu:
-        return f"{1:{small_formatting}} Byte"
-    if value < base and not gnu:
-        return f"{value:{small_formatting}} Bytes"
-    if value < base and gnu:
+def parse_file_size(value: str) -> int:
+    """Return the number of bytes of a human-readable file size.
+
+    Reads the sizes written by ``file_size`` in all its formats, and the
+    usual variants typed by people: units are case insensitive and spacing
+    is optional. Units are ``B``, ``Byte`` or ``Bytes``, or a prefix from
+    ``K`` to ``Y`` followed by ``B`` for decimal units (powers of 1000), by
+    ``iB`` or ``i`` for binary units (powers of 1024) or alone for GNU units
+    (powers of 1024 too). A number without unit is a number of bytes.
+    Fractional sizes are rounded to the nearest byte, half to even.
+
+    Examples:
+        >>> parse_file_size("1.2 GB")
+        1200000000
+        >>> parse_file_size("1.2 GiB")
+        1288490189
+        >>> parse_file_size("340K")
+        348160
+        >>> parse_file_size("12 Bytes")
+        12
+
+    Args:
+        value: file size in natural language.
+
+    Returns:
+        int: number of bytes.
+
+    Raises:
+        ValueError: if `value` is not a file size, or has an exponent beyond
+            the range of floats.
+
+    """
+    return _parse_file_size(value, _SIZE.fullmatch(value))
+
+
+def parse_file_size_many(values: Iterable[str]) -> list[int]:
+    """Return the numbers of bytes of many human-readable file sizes.
+
+    Same as calling ``parse_file_size`` on every value, for columns of
+    sizes read from configuration or log files.
+
+    Examples:
+        >>> parse_file_size_many(["300 Bytes", "2.9 MB", "2.8M"])
+        [300, 2900000, 2936013]
+
+    Args:
+        values: file sizes in natural language.
+
+    Returns:
+        list[int]: numbers of bytes.
+
+    Raises:
+        ValueError: if a value is not a file size.
+
+    """
+    match = _SIZE.fullmatch
+    return [_parse_file_size(value, match(value)) for value in values]
+
+
+def _parse_file_size(value: str, match: re.Match[str] | None) -> int:
+    """Return the number of bytes of `value`, matched by the size pattern."""
+    if match is not None:
+        number, unit = match.groups()
+        multiplier = _MULTIPLIERS.get(unit.lower())
+        if multiplier is not None:
+            # integers are multiplied exactly, however large
+            if number.lstrip("+-").isdigit():
+                return int(number) * multiplier
+            # numbers with an exponent too large for a float are refused
+            if math.isfinite(float(number)):
+                return _round_size(number, multiplier)
+    raise ValueError(f"invalid file size: {value!r}")
+
+
+def _round_size(number: str, multiplier: int) -> int:
+    """Return `number` times `multiplier`, rounded half to even exactly."""
+    mantissa, _, exponent = number.lower().partition("e")
+    integer, _, decimals = mantissa.partition(".")
+    numerator = int(integer + decimals) * multiplier
+    shift = int(exponent) - len(decimals) if exponent else -len(decimals)
+    if not numerator:
+        return 0
+    if shift >= 0:
+        scale: int = 10**shift
+        return numerator * scale
+    # multipliers have at most 25 digits, so this is below a tenth of a byte
+    if shift < -len(mantissa) - 25:
+        return 0
+    denominator: int = 10**-shift
+    quotient, remainder = divmod(numerator, denominator)
+    remainder *= 2
+    if remainder > denominator or (remainder == denominator and quotient & 1):
+        quotient += 1
+    return quotient
+
+
+def _units(binary: bool, gnu: bool) -> tuple[int, tuple[str, ...]]:
+    """Return base and suffixes for the chosen format."""
+    if gnu:
+        return 1024, _GNU_SUFFIXES
+    if binary:
+        return 1024, _BINARY_SUFFIXES
+    return 1000, _DECIMAL_SUFFIXES
+
+
+def _small_size(value: int, gnu: bool, small_formatting: str) -> str:
+    """Return size of values smaller than the base, in bytes."""
+    if gnu:
         return f"{value:{small_formatting}}B"
+    if value == 1:
+        return f"{1:{small_formatting}} Byte"
+    return f"{value:{small_formatting}} Bytes"
 
-    byte_size = float(value)
-    suffix = ""
-    for i, suffix in enumerate(suffixes):
-        unit = base ** (i + 2)
-        if byte_size < unit:
-            return f"{base * byte_size / unit:{formatting}}{suffix}"
-    return f"{base * byte_size / unit:{formatting}}{suffix}"
+
+def _large_size(
+    value: int,
+    index: int,
+    base: int,
+    suffixes: tuple[str, ...],
+    formatting: str,
+) -> str:
+    """Return size of values of at least the base, in the unit at `index`."""
+    # sizes beyond the last unit are still expressed in it
+    index = min(index, len(suffixes) - 1)
+    unit = base ** (index + 2)
+    return f"{base * float(value) / unit:{formatting}}{suffixes[index]}"
@@ -0,0 +1,200 @@
+"""Humanizing functions bound to a locale."""
+
+from __future__ import annotations
+
+import datetime as dt
+from collections.abc import Iterable
+from typing import TYPE_CHECKING
+from typing import Any
+
+import human_readable.files as files
+import human_readable.i18n as i18n
+import human_readable.lists as lists
+import human_readable.numbers as numbers
+import human_readable.times as times
+
+
+if TYPE_CHECKING:
+    from decimal import Decimal
+
+__all__ = ["Humanizer"]
+
+
+class Humanizer:
+    """Humanizing functions bound to a fixed locale.
+
+    The catalog of `locale` is resolved once, when the humanizer is created,
+    and every method uses it directly instead of looking up the active locale
+    of the current thread. This makes humanizers cheap to use in hot loops and
+    safe to share between threads, independently of `i18n.activate`.
+
+    Example:
+        >>> import datetime as dt
+        >>> humanizer = Humanizer("pt_BR")
+        >>> humanizer.time_delta(dt.timedelta(days=3))
+        '3 dias'
+        >>> Humanizer().ordinal(2)
+        '2nd'
+
+    Args:
+        locale: Language name, e.g. `en_GB`. Defaults to no translation.
+        path: Path to search for locales.
+
+    """
+
+    def __init__(self, locale: str = "", path: str | None = None) -> None:
+        """Resolve the translations of `locale`."""
+        self.locale = locale
+        self.translation = i18n.load(locale, path)
+        self._thousands_separator = numbers._THOUSANDS_SEPARATOR.get(
+            locale, ","
+        )
+
+    file_size = staticmethod(files.file_size)
+    file_size_many = staticmethod(files.file_size_many)
+    parse_file_size = staticmethod(files.parse_file_size)
+    parse_file_size_many = staticmethod(files.parse_file_size_many)
+    fractional = staticmethod(numbers.fractional)
+    fractional_many = staticmethod(numbers.fractional_many)
+    scientific_notation = staticmethod(numbers.scientific_notation)
+    scientific_notation_many = staticmethod(numbers.scientific_notation_many)
+
+    def listing(
+        self,
+        items: Iterable[Any],
+        separator: Any,
+        conjunction: Any = None,
+        oxford: bool = False,
+        max_items: int | None = None,
+    ) -> str:
+        """Return human readable list, see `lists.listing`."""
+        if max_items is not None:
+            items = lists._truncate(
+                items, max_items, self.translation, self._thousands_separator
+            )
+        return lists.listing(items, separator, conjunction, oxford)
+
+    def ordinal(self, value: int | str) -> str:
+        """Convert an integer to its ordinal, see `numbers.ordinal`."""
+        return numbers._ordinal(self.translation, value)
+
+    def ordinal_many(self, values: Iterable[int | str]) -> list[str]:
+        """Convert integers to their ordinals, see `numbers.ordinal_many`."""
+        return numbers._ordinal_many(self.translation, values)
+
+    def int_comma(self, value: str | float | Decimal) -> str:
+        """Add thousands separators, see `numbers.int_comma`."""
+        return numbers._int_comma(value, self._thousands_separator)
+
+    def int_comma_many(
+        self, values: Iterable[str | float | Decimal]
+    ) -> list[str]:
+        """Add thousands separators, see `numbers.int_comma_many`."""
+        sep = self._thousands_separator
+        return [numbers._int_comma(value, sep) for value in values]
+
+    def int_word(
+        self, value: float, formatting: str = ".1f", exact: bool = False
+    ) -> str:
+        """Convert a large integer to text, see `numbers.int_word`."""
+        return numbers._int_word(self.translation, value, formatting, exact)
+
+    def int_word_many(
+        self,
+        values: Iterable[float],
+        formatting: str = ".1f",
+        exact: bool = False,
+    ) -> list[str]:
+        """Convert large integers to text, see `numbers.int_word_many`."""
+        return numbers._int_word_many(
+            self.translation, values, formatting, exact
+        )
+
+    def ap_number(self, value: float | str) -> str | float:
+        """Spell out numbers 1-9, see `numbers.ap_number`."""
+        return numbers._ap_number(self.translation, value)
+
+    def time_of_day(self, hour: int) -> str:
+        """Return time of the day, see `times.time_of_day`."""
+        return times._time_of_day(self.translation, hour)
+
+    def timing(self, time: dt.time, formal: bool = True) -> str:
+        """Return human-readable time, see `times.timing`."""
+        return times._timing(self.translation, time, formal)
+
+    def time_delta(
+        self,
+        value: dt.timedelta | int | dt.datetime,
+        use_months: bool = True,
+        minimum_unit: str = "seconds",
+        when: dt.datetime | None = None,
+    ) -> str:
+        """Return time difference, see `times.time_delta`."""
+        return times._time_delta(
+            self.translation, value, use_months, minimum_unit, when
+        )
+
+    def time_delta_many(
+        self,
+        values: Iterable[dt.timedelta | int | dt.datetime],
+        use_months: bool = True,
+        minimum_unit: str = "seconds",
+        when: dt.datetime | None = None,
+    ) -> list[str]:
+        """Return time differences, see `times.time_delta_many`."""
+        return times._time_delta_many(
+            self.translation, values, use_months, minimum_unit, when
+        )
+
+    def date_time(
+        self,
+        value: dt.timedelta | int | dt.datetime,
+        future: bool = False,
+        use_months: bool = True,
+        minimum_unit: str = "seconds",
+        when: dt.datetime | None = None,
+    ) -> str:
+        """Return human-readable time, see `times.date_time`."""
+        return times._date_time(
+            self.translation, value, future, use_months, minimum_unit, when
+        )
+
+    def date_time_and_next_change(
+        self,
+        value: dt.datetime,
+        use_months: bool = True,
+        minimum_unit: str = "seconds",
+        when: dt.datetime | None = None,
+    ) -> tuple[str, dt.datetime]:
+        """Return time and its next change, see `times.date_time_and_next_change`."""
+        return times._date_time_and_next_change(
+            self.translation, value, use_months, minimum_unit, when
+        )
+
+    def day(self, date: dt.date, formatting: str = "%b %d") -> str:
+        """Return human-readable day, see `times.day`."""
+        return times._day(self.translation, date, formatting)
+
+    def date(self, date: dt.date) -> str:
+        """Return human-readable date, see `times.date`."""
+        return times._date(self.translation, date)
+
+    def year(self, date: dt.date) -> str:
+        """Return human-readable year, see `times.year`."""
+        return times._year(self.translation, date)
+
+    def precise_delta(
+        self,
+        value: dt.timedelta | int,
+        minimum_unit: str = "seconds",
+        suppress: list[str] | None = None,
+        formatting: str = ".2f",
+    ) -> str:
+        """Return precise time difference, see `times.precise_delta`."""
+        return times._precise_delta(
+            self.translation, value, minimum_unit, suppress, formatting
+        )
+
+    def parse_delta(self, value: str) -> dt.timedelta:
+        """Return the time delta of a text, see `times.parse_delta`."""
+        return times._parse_delta(self.translation, value)
@@ -2,15 +2,32 @@
 
 from __future__ import annotations
 
+import contextlib
+import contextvars
+import gc
 import gettext as gettext_module
 import os.path
 import threading
+from collections.abc import Iterable
+from collections.abc import Iterator
 
 
-__all__ = ["activate", "deactivate", "gettext", "ngettext"]
+__all__ = [
+    "activate",
+    "activated",
+    "deactivate",
+    "gettext",
+    "load",
+    "ngettext",
+    "preload_locales",
+]
 
 _TRANSLATIONS = {"": gettext_module.NullTranslations()}
 _CURRENT = threading.local()
+# locale of the innermost `activated` scope, it takes precedence over _CURRENT
+_CONTEXT_LOCALE: contextvars.ContextVar[str | None] = contextvars.ContextVar(
+    "human_readable_locale", default=None
+)
 
 
 def _get_default_locale_path() -> str | None:
@@ -22,31 +39,44 @@ def _get_default_locale_path() -> str | None:
         return None
 
 
+def _current_locale() -> str:
+    locale = _CONTEXT_LOCALE.get()
+    if locale is None:
+        locale = getattr(_CURRENT, "locale", None)
+    return locale or ""
+
+
 def get_translation() -> gettext_module.NullTranslations:
-    try:
-        return _TRANSLATIONS[_CURRENT.locale]
-    except (AttributeError, KeyError):
-        return _TRANSLATIONS[""]
+    return _TRANSLATIONS[_current_locale()]
 
 
-def activate(
-    locale: str, path: str | None = None
+def load(
+    locale: str,
+    path: str | None = None,
+    class_: type[gettext_module.GNUTranslations] | None = None,
 ) -> gettext_module.NullTranslations:
-    """Activate internationalisation.
+    """Load translations of `locale` without activating it.
 
-    Set `locale` as current locale. Search for locale in directory `path`.
+    Catalogs are loaded once and shared with `activate`. An empty `locale`
+    returns the untranslated (English) catalog.
 
     Args:
         locale: Language name, e.g. `en_GB`.
         path: Path to search for locales.
+        class_: Class of the catalog, e.g.
+            `catalogs.MappedTranslations`. Defaults to the catalog already
+            loaded, or `gettext.GNUTranslations`.
 
     Returns:
-        dict: Translations.
+        Translations.
 
     Raises:
         Exception: If human readable cannot find the locale folder.
 
     """
+    if not locale:
+        return _TRANSLATIONS[""]
+
     if path is None:
         path = _get_default_locale_path()
 
@@ -55,13 +85,41 @@ def activate(
             "Human readable cannot determinate the default location of the 'locale' "
             "folder. You need to pass the path explicitly."
         )
-    if locale not in _TRANSLATIONS:
+    translation = _TRANSLATIONS.get(locale)
+    if translation is None or (
+        class_ is not None and not isinstance(translation, class_)
+    ):
         translation = gettext_module.translation(
-            "human_readable", path, [locale]
+            "human_readable", path, [locale], class_
         )
         _TRANSLATIONS[locale] = translation
+    return translation
+
+
+def activate(
+    locale: str,
+    path: str | None = None,
+    class_: type[gettext_module.GNUTranslations] | None = None,
+) -> gettext_module.NullTranslations:
+    """Activate internationalisation.
+
+    Set `locale` as current locale. Search for locale in directory `path`.
+
+    Args:
+        locale: Language name, e.g. `en_GB`.
+        path: Path to search for locales.
+        class_: Class of the catalog, see `load`.
+
+    Returns:
+        dict: Translations.
+
+    Raises:
+        Exception: If human readable cannot find the locale folder.
+
+    """
+    translation = load(locale, path, class_)
     _CURRENT.locale = locale
-    return _TRANSLATIONS[locale]
+    return translation
 
 
 def deactivate() -> None:
@@ -69,6 +127,97 @@ def deactivate() -> None:
     _CURRENT.locale = None
 
 
+def preload_locales(
+    locales: Iterable[str] | None = None,
+    path: str | None = None,
+    class_: type[gettext_module.GNUTranslations] | None = None,
+    freeze: bool = False,
+) -> list[str]:
+    """Load catalogs and the tables derived from them ahead of time.
+
+    Meant for servers that fork workers: preloading in the parent process
+    spares each worker the loading of every catalog on its first request,
+    and the loaded data is shared copy-on-write between workers. With
+    `freeze`, the objects are moved out of reach of the garbage collector
+    (``gc.freeze``), whose passes would otherwise write to them and unshare
+    their memory pages.
+
+    Args:
+        locales: Language names, e.g. `en_GB`. Defaults to every locale
+            found in `path`.
+        path: Path to search for locales.
+        class_: Class of the catalogs, see `load`.
+        freeze: if true, collect garbage then call ``gc.freeze``.
+
+    Returns:
+        list[str]: preloaded locales.
+
+    Raises:
+        Exception: If human readable cannot find the locale folder.
+
+    """
+    # imported here: they depend on this module
+    import human_readable.numbers as numbers
+    import human_readable.times as times
+
+    if locales is None:
+        folder = path or _get_default_locale_path()
+        if folder is None:
+            raise Exception(
+                "Human readable cannot determinate the default location of the 'locale' "
+                "folder. You need to pass the path explicitly."
+            )
+        locales = sorted(os.listdir(folder))
+    preloaded = list(locales)
+    for locale in ["", *preloaded]:
+        translation = load(locale, path, class_)
+        times._clock_words(translation)
+        numbers._ordinal_suffixes(translation)
+    if freeze:
+        gc.collect()
+        gc.freeze()
+    return preloaded
+
+
+@contextlib.contextmanager
+def activated(
+    locale: str,
+    path: str | None = None,
+    class_: type[gettext_module.GNUTranslations] | None = None,
+) -> Iterator[gettext_module.NullTranslations]:
+    """Activate internationalisation for the enclosed block only.
+
+    Unlike `activate`, which sets the locale of the whole thread, the locale
+    is stored in a context variable: each asyncio task (and each thread) sees
+    only the scopes it entered itself, so concurrent coroutines can humanize
+    in different languages without locking. Inside the block it takes
+    precedence over `activate`; scopes can be nested.
+
+    Example:
+        >>> from human_readable.numbers import ordinal
+        >>> with activated("pt_BR"):
+        ...     ordinal(1)
+        '1º'
+        >>> ordinal(1)
+        '1st'
+
+    Args:
+        locale: Language name, e.g. `en_GB`.
+        path: Path to search for locales.
+        class_: Class of the catalog, see `load`.
+
+    Yields:
+        Translations.
+
+    """
+    translation = load(locale, path, class_)
+    token = _CONTEXT_LOCALE.set(locale)
+    try:
+        yield translation
+    finally:
+        _CONTEXT_LOCALE.reset(token)
+
+
 def gettext(message: str) -> str:
     """Get translation.
 
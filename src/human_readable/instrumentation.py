@@ -0,0 +1,262 @@
+"""Opt-in metrics of calls to humanizing functions and catalog lookups.
+
+Nothing is recorded until `enable` is called: it replaces the functions
+exported by `human_readable` with timed wrappers, in their modules and in the
+package, and `disable` puts the originals back, so instrumentation costs
+nothing while disabled. References taken before `enable`, e.g. with
+``from human_readable.times import time_delta``, keep calling the original
+functions, as do the methods of `Humanizer`.
+"""
+
+from __future__ import annotations
+
+import collections
+import functools
+import gettext
+import importlib
+import math
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+
+import human_readable
+import human_readable.i18n as i18n
+
+
+__all__ = ["disable", "enable", "reset", "snapshot"]
+
+# exports that are not humanizing functions
+_NOT_INSTRUMENTED = {
+    "Humanizer",
+    "RelativeTimeTicker",
+    "activate",
+    "deactivate",
+}
+# caches whose statistics are part of the snapshot, by module
+_CACHES = {
+    "human_readable.numbers": (
+        "_fractional",
+        "_ordinal_suffixes",
+    ),
+    "human_readable.times": (
+        "_bucket_text",
+        "_clock_words",
+        "_delta_parser",
+        "_precise_delta_plan",
+        "_time_delta_minimum_unit",
+    ),
+}
+# caches keyed on catalogs, which hold the counting catalogs while enabled
+_CATALOG_CACHES = {
+    "human_readable.numbers": ("_ordinal_suffixes",),
+    "human_readable.times": ("_bucket_text", "_clock_words", "_delta_parser"),
+}
+_LOCK = threading.Lock()
+_ORIGINALS: dict[tuple[str, str], Any] = {}
+_TRANSLATIONS: dict[gettext.NullTranslations, _CountingTranslations] = {}
+
+
+class _Stats:
+    """Call count, total time and most recent durations of a function."""
+
+    def __init__(self, samples: int) -> None:
+        self.calls = 0
+        self.total = 0.0
+        self.durations: collections.deque[float] = collections.deque(
+            maxlen=samples
+        )
+
+    def as_dict(self) -> dict[str, float]:
+        durations = sorted(self.durations)
+        result = {
+            "calls": self.calls,
+            "total": self.total,
+            "mean": self.total / self.calls,
+        }
+        for percent in (50, 90, 99):
+            # nearest-rank percentile
+            rank = math.ceil(len(durations) * percent / 100)
+            result[f"p{percent}"] = durations[max(rank, 1) - 1]
+        return result
+
+
+_STATS: dict[str, _Stats] = {}
+_LOOKUPS: collections.Counter[tuple[str, str]] = collections.Counter()
+_SETTINGS: dict[str, Any] = {"callback": None, "samples": 10_000}
+
+
+class _CountingTranslations(gettext.NullTranslations):
+    """Catalog counting the lookups made in the catalog it wraps."""
+
+    def __init__(self, translation: gettext.NullTranslations, locale: str):
+        super().__init__()
+        self.add_fallback(translation)
+        self._locale = locale
+
+    def _count(self, method: str) -> None:
+        with _LOCK:
+            _LOOKUPS[self._locale, method] += 1
+
+    def gettext(self, message: str) -> str:
+        self._count("gettext")
+        return super().gettext(message)
+
+    def ngettext(self, msgid1: str, msgid2: str, n: int) -> str:
+        self._count("ngettext")
+        return super().ngettext(msgid1, msgid2, n)
+
+    def pgettext(self, context: str, message: str) -> str:
+        self._count("pgettext")
+        return super().pgettext(context, message)
+
+    def npgettext(self, context: str, msgid1: str, msgid2: str, n: int) -> str:
+        self._count("npgettext")
+        return super().npgettext(context, msgid1, msgid2, n)
+
+
+def _timed(name: str, func: Callable[..., Any]) -> Callable[..., Any]:
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            with _LOCK:
+                stats = _STATS.get(name)
+                if stats is None:
+                    stats = _STATS[name] = _Stats(_SETTINGS["samples"])
+                stats.calls += 1
+                stats.total += elapsed
+                stats.durations.append(elapsed)
+            callback = _SETTINGS["callback"]
+            if callback is not None:
+                callback(name, elapsed)
+
+    return wrapper
+
+
+def _get_translation(
+    get_translation: Callable[[], gettext.NullTranslations],
+) -> Callable[[], gettext.NullTranslations]:
+    @functools.wraps(get_translation)
+    def wrapper() -> gettext.NullTranslations:
+        translation = get_translation()
+        # one wrapper per catalog, so that caches keyed on it keep working
+        counting = _TRANSLATIONS.get(translation)
+        if counting is None:
+            counting = _TRANSLATIONS[translation] = _CountingTranslations(
+                translation, i18n._current_locale()
+            )
+        return counting
+
+    return wrapper
+
+
+def _clear_catalog_caches() -> None:
+    # entries built with the catalogs of the other mode are never used again
+    for module_name, names in _CATALOG_CACHES.items():
+        module = importlib.import_module(module_name)
+        for name in names:
+            getattr(module, name).cache_clear()
+
+
+def _replace(module_name: str, name: str, value: Any) -> None:
+    module = importlib.import_module(module_name)
+    _ORIGINALS.setdefault((module_name, name), getattr(module, name))
+    setattr(module, name, value)
+    if module_name != "human_readable.i18n" and name in vars(human_readable):
+        setattr(human_readable, name, value)
+
+
+def enable(
+    callback: Callable[[str, float], None] | None = None,
+    samples: int = 10_000,
+) -> None:
+    """Start recording calls and catalog lookups.
+
+    Example:
+        >>> import human_readable
+        >>> from human_readable import instrumentation
+        >>> instrumentation.enable()
+        >>> human_readable.int_comma(12345)
+        '12,345'
+        >>> instrumentation.snapshot()["functions"]["int_comma"]["calls"]
+        1
+        >>> instrumentation.disable()
+
+    Args:
+        callback: called with the name and duration, in seconds, of every
+            call of a humanizing function.
+        samples: number of most recent durations per function that
+            percentiles are computed from.
+
+    """
+    _SETTINGS["callback"] = callback
+    _SETTINGS["samples"] = samples
+    if _ORIGINALS:
+        return
+    for name, module_name in human_readable._LAZY_ATTRIBUTES.items():
+        if name not in _NOT_INSTRUMENTED:
+            func = getattr(importlib.import_module(module_name), name)
+            _replace(module_name, name, _timed(name, func))
+    _replace(
+        "human_readable.i18n",
+        "get_translation",
+        _get_translation(i18n.get_translation),
+    )
+    _clear_catalog_caches()
+
+
+def disable() -> None:
+    """Stop recording, keeping what was recorded so far."""
+    for (module_name, name), original in _ORIGINALS.items():
+        setattr(importlib.import_module(module_name), name, original)
+        if module_name != "human_readable.i18n" and name in vars(
+            human_readable
+        ):
+            setattr(human_readable, name, original)
+    _ORIGINALS.clear()
+    _TRANSLATIONS.clear()
+    _clear_catalog_caches()
+    _SETTINGS["callback"] = None
+
+
+def reset() -> None:
+    """Forget what was recorded so far."""
+    with _LOCK:
+        _STATS.clear()
+        _LOOKUPS.clear()
+
+
+def snapshot() -> dict[str, Any]:
+    """Return what was recorded so far.
+
+    Returns:
+        dict[str, Any]: with the keys
+
+            - ``functions``: per function name, its number of ``calls``, the
+              ``total`` and ``mean`` time spent in it and the ``p50``, ``p90``
+              and ``p99`` percentiles of its durations, in seconds;
+            - ``lookups``: per locale (``""`` for English), the number of
+              lookups per method of the catalog, e.g. ``ngettext``;
+            - ``caches``: statistics of the internal caches, like
+              ``functools.lru_cache`` gives them.
+
+    """
+    with _LOCK:
+        functions = {name: stats.as_dict() for name, stats in _STATS.items()}
+        lookups: dict[str, dict[str, int]] = {}
+        for (locale, method), count in _LOOKUPS.items():
+            lookups.setdefault(locale, {})[method] = count
+    caches = {
+        f"{module_name}.{name}": getattr(
+            importlib.import_module(module_name), name
+        )
+        .cache_info()
+        ._asdict()
+        for module_name, names in _CACHES.items()
+        for name in names
+    }
+    return {"functions": functions, "lookups": lookups, "caches": caches}
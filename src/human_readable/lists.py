@@ -2,42 +2,145 @@
 
 from __future__ import annotations
 
+import gettext
+import itertools
+from collections.abc import Iterable
 from collections.abc import Sequence
 from typing import Any
+from typing import Protocol
 
-__all__ = ["listing"]
+import human_readable.i18n as i18n
+import human_readable.numbers as numbers
+
+
+__all__ = ["listing", "write_listing"]
+
+
+class _Writer(Protocol):
+    def write(self, text: str, /) -> Any: ...
 
 
 def listing(
-    items: Sequence[Any], separator: Any, conjunction: Any = None, oxford: bool = False
+    items: Iterable[Any],
+    separator: Any,
+    conjunction: Any = None,
+    oxford: bool = False,
+    max_items: int | None = None,
 ) -> str:
     """Return human readable list separated by separator.
 
     Optional argument is conjuntion that substitutes the last separator.
 
+    With `max_items`, only that many items are shown and the rest is
+    summarised as the last item, e.g. 'a, b, c and 9,997 more', in the
+    language of the active locale. Items that are not shown are never
+    converted to strings; for sequences they are not even visited, but other
+    iterables are still read to the end to count them.
+
+    Examples:
+        >>> listing(range(1, 10001), ",", "and", max_items=3)
+        '1, 2, 3 and 9,997 more'
+
     Args:
         items: list of items.
         separator: separator of items.
         conjunction: word/string as last separator. Defaults to None.
         oxford: apply separators in the same manner as an oxford comma
+        max_items: maximum number of items to show. Defaults to None (all).
 
     Returns:
         str: list in natural language.
 
+    Raises:
+        ValueError: if `max_items` is negative.
+
     """
-    len_items = len(items)
-    if len_items == 0:
-        return ""
-    if len_items == 1:
-        return str(items[0])
-    phrase = str(items[0])
-    if conjunction is not None:
-        for i in range(1, len_items - 1):
-            phrase += f"{separator} {items[i]}"
-        if oxford and len_items > 2:
-            phrase += str(separator)
-        phrase += f" {conjunction} {items[len_items - 1]}"
+    if max_items is not None:
+        items = _truncate(
+            items,
+            max_items,
+            i18n.get_translation(),
+            numbers._thousands_separator(),
+        )
+    strings = [str(item) for item in items]
+    joiner = f"{separator} "
+    if conjunction is None or len(strings) < 2:
+        return joiner.join(strings)
+    head = joiner.join(strings[:-1])
+    if oxford and len(strings) > 2:
+        head += str(separator)
+    return f"{head} {conjunction} {strings[-1]}"
+
+
+def _truncate(
+    items: Iterable[Any],
+    max_items: int,
+    translation: gettext.NullTranslations,
+    sep: str,
+) -> list[Any]:
+    """Return the first `max_items` items and a "N more" item for the rest."""
+    if max_items < 0:
+        raise ValueError(f"max_items must not be negative: {max_items}")
+    if isinstance(items, Sequence):
+        shown = list(items[:max_items])
+        remaining = len(items) - len(shown)
     else:
-        for i in range(1, len_items):
-            phrase += f"{separator} {items[i]}"
-    return phrase
+        iterator = iter(items)
+        shown = list(itertools.islice(iterator, max_items))
+        remaining = sum(1 for _ in iterator)
+    if remaining > 0:
+        more = translation.ngettext("{amount} more", "{amount} more", remaining)
+        shown.append(more.format(amount=numbers._int_comma(remaining, sep)))
+    return shown
+
+
+def write_listing(
+    items: Iterable[Any],
+    writer: _Writer,
+    separator: Any,
+    conjunction: Any = None,
+    oxford: bool = False,
+) -> None:
+    """Write human readable list separated by separator to `writer`.
+
+    Same output as ``listing``, but items are consumed lazily from any
+    iterable and written as they come, so the whole list is never held in
+    memory. Only one item is kept back to know where the conjunction goes.
+
+    Examples:
+        >>> import io
+        >>> out = io.StringIO()
+        >>> write_listing(iter(["a", "b", "c"]), out, ",", "and", oxford=True)
+        >>> out.getvalue()
+        'a, b, and c'
+
+    Args:
+        items: iterable of items.
+        writer: text stream or any object with a ``write`` method.
+        separator: separator of items.
+        conjunction: word/string as last separator. Defaults to None.
+        oxford: apply separators in the same manner as an oxford comma
+
+    """
+    iterator = iter(items)
+    try:
+        pending = next(iterator)
+    except StopIteration:
+        return
+    writer.write(str(pending))
+    joiner = f"{separator} "
+    count = 1
+    for item in iterator:
+        # the first item is already written, later ones wait for the next
+        if count > 1:
+            writer.write(f"{joiner}{pending}")
+        pending = item
+        count += 1
+    if count == 1:
+        return
+    if conjunction is None:
+        writer.write(f"{joiner}{pending}")
+        return
+    if oxford and count > 2:
+        writer.write(str(separator))
+    writer.write(f" {conjunction} {pending}")
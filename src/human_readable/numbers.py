@@ -2,17 +2,27 @@
 
 from __future__ import annotations
 
-import fractions
+import array
+import bisect
+import functools
+import gettext
+import math
 import re
+from collections.abc import Callable
+from collections.abc import Iterable
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
 
 import human_readable.i18n as i18n
+from human_readable._numpy import numpy_module
 
 
-_ = i18n.gettext
+if TYPE_CHECKING:
+    from decimal import Decimal
+
 # BEWARE: by some convention this has to be N_ to be detected
 # but this is not ngettext as it seems
 N_ = i18n.gettext_noop
-P_ = i18n.pgettext
 
 # Mapping of locale to thousands separator
 _THOUSANDS_SEPARATOR = {
@@ -27,11 +37,7 @@ def _thousands_separator() -> str:
          str: Thousands separator.
 
     """
-    try:
-        sep = _THOUSANDS_SEPARATOR[i18n._CURRENT.locale]
-    except (AttributeError, KeyError):
-        sep = ","
-    return sep
+    return _THOUSANDS_SEPARATOR.get(i18n._current_locale(), ",")
 
 
 def ordinal(value: int | str) -> str:
@@ -48,6 +54,62 @@ def ordinal(value: int | str) -> str:
         str: ordinal string.
 
     """
+    return _ordinal(i18n.get_translation(), value)
+
+
+def ordinal_many(values: Iterable[int | str]) -> list[str]:
+    """Convert many integers to their ordinals as strings.
+
+    Same as calling ``ordinal`` on every value, but the suffixes of the
+    active locale are resolved only once. Ranges, e.g. the ranks of a
+    leaderboard, and NumPy arrays are accepted too.
+
+    Examples:
+        >>> ordinal_many(range(1, 5))
+        ['1st', '2nd', '3rd', '4th']
+
+    Args:
+        values: integers.
+
+    Returns:
+        list[str]: ordinal strings.
+
+    """
+    return _ordinal_many(i18n.get_translation(), values)
+
+
+def _ordinal(translation: gettext.NullTranslations, value: int | str) -> str:
+    """Convert an integer to its ordinal translated with `translation`."""
+    value = int(value)
+    return f"{value}{_ordinal_suffixes(translation)[value % 100]}"
+
+
+def _ordinal_many(
+    translation: gettext.NullTranslations, values: Iterable[int | str]
+) -> list[str]:
+    """Convert many integers to ordinals translated with `translation`."""
+    suffixes = _ordinal_suffixes(translation)
+    numpy = numpy_module(values)
+    if numpy is not None:
+        values = numpy.asarray(values).tolist()
+    return [f"{value}{suffixes[value % 100]}" for value in map(int, values)]
+
+
+@functools.lru_cache(maxsize=None)
+def _ordinal_suffixes(translation: gettext.NullTranslations) -> tuple[str, ...]:
+    """Return the ordinal suffix of every value modulo 100 for a catalog.
+
+    Like `times._clock_words`, the table is built once per catalog, which is
+    its cache key, so activating another locale switches tables.
+
+    Args:
+        translation: catalog used to translate the suffixes.
+
+    Returns:
+        Tuple with the suffixes of 0 to 99.
+
+    """
+    P_ = translation.pgettext
     suffixes = (
         P_("0", "th"),
         P_("1", "st"),
@@ -60,13 +122,13 @@ def ordinal(value: int | str) -> str:
         P_("8", "th"),
         P_("9", "th"),
     )
-    value = int(value)
-    if value % 100 in (11, 12, 13):
-        return f"{value}{suffixes[0]}"
-    return f"{value}{suffixes[value % 10]}"
+    return tuple(
+        suffixes[0] if value in (11, 12, 13) else suffixes[value % 10]
+        for value in range(100)
+    )
 
 
-def int_comma(value: str | float) -> str:
+def int_comma(value: str | float | Decimal) -> str:
     """Convert an integer to a string containing commas every three digits.
 
     For example, 3000 becomes '3,000' and 45000 becomes '45,000'.  To maintain
@@ -79,20 +141,56 @@ def int_comma(value: str | float) -> str:
     Returns:
         str: formatted number with commas.
 
+    """
+    return _int_comma(value, _thousands_separator())
+
+
+def int_comma_many(values: Iterable[str | float | Decimal]) -> list[str]:
+    """Convert many numbers to strings containing commas every three digits.
+
+    Same as calling ``int_comma`` on every value, but the thousands separator
+    of the active locale is resolved only once.
+
+    Examples:
+        >>> int_comma_many([100, 45000, "1234567.5"])
+        ['100', '45,000', '1,234,567.5']
+
+    Args:
+        values: any numbers.
+
+    Returns:
+        list[str]: formatted numbers with commas.
+
     """
     sep = _thousands_separator()
+    return [_int_comma(value, sep) for value in values]
+
+
+_LEADING_DIGITS = re.compile(r"-?(\d+)")
+
+
+def _int_comma(value: str | float | Decimal, sep: str) -> str:
+    """Insert `sep` every three digits of the leading integer part of `value`."""
+    if type(value) is int:
+        grouped = f"{value:,}"
+        return grouped if sep == "," else grouped.replace(",", sep)
     if isinstance(value, str):
         float(value.replace(sep, ""))
     else:
         float(value)
     orig = str(value)
-    new = re.sub(r"^(-?\d+)(\d{3})", rf"\g<1>{sep}\g<2>", orig)
-    if orig == new:
-        return new
-    return int_comma(new)
-
-
-POWERS = [10**x for x in (6, 9, 12, 15, 18, 21, 24, 27, 30, 33, 100)]
+    match = _LEADING_DIGITS.match(orig)
+    if match is None:
+        return orig
+    start, end = match.span(1)
+    head = (end - start) % 3 or 3
+    groups = [orig[start : start + head]]
+    groups.extend(orig[i : i + 3] for i in range(start + head, end, 3))
+    return f"{orig[:start]}{sep.join(groups)}{orig[end:]}"
+
+
+_EXPONENTS = (6, 9, 12, 15, 18, 21, 24, 27, 30, 33, 100)
+POWERS = [10**x for x in _EXPONENTS]
 HUMAN_POWERS = (
     N_("million"),
     N_("billion"),
@@ -108,7 +206,7 @@ HUMAN_POWERS = (
 )
 
 
-def int_word(value: float, formatting: str = ".1f") -> str:
+def int_word(value: float, formatting: str = ".1f", exact: bool = False) -> str:
     """Convert a large integer to a friendly text representation.
 
     Works best for numbers over 1 million.
@@ -120,25 +218,169 @@ def int_word(value: float, formatting: str = ".1f") -> str:
     This function returns a string unless the value passed was unable to be
     coaxed into an int.
 
+    Integers are divided by their scale as floats, which only keeps about 16
+    significant digits. With `exact`, they are divided as decimals instead,
+    so that every digit shown is right however large the integer is, and
+    formatted like ``decimal.Decimal`` numbers.
+
+    Examples:
+        >>> int_word(10**33 + 1, ".33f")
+        '1.000000000000000000000000000000000 decillion'
+        >>> int_word(10**33 + 1, ".33f", exact=True)
+        '1.000000000000000000000000000000001 decillion'
+
     Args:
         value: any number.
         formatting: string formatting pattern. Defaults to ".1f".
+        exact: divide integers exactly. Defaults to False.
 
     Returns:
         str: number formatted with scale words.
 
     """
-    if value < POWERS[0]:
+    return _int_word(i18n.get_translation(), value, formatting, exact)
+
+
+def int_word_many(
+    values: Iterable[float], formatting: str = ".1f", exact: bool = False
+) -> list[str]:
+    """Convert many large integers to friendly text representations.
+
+    Same as calling ``int_word`` on every value, but the catalog of the
+    active locale is resolved only once. NumPy arrays are accepted too.
+
+    Examples:
+        >>> int_word_many([100, 1200000, 999999999])
+        ['100', '1.2 million', '1.0 billion']
+
+    Args:
+        values: any numbers.
+        formatting: string formatting pattern. Defaults to ".1f".
+        exact: divide integers exactly. Defaults to False.
+
+    Returns:
+        list[str]: numbers formatted with scale words.
+
+    """
+    return _int_word_many(i18n.get_translation(), values, formatting, exact)
+
+
+def _int_word_many(
+    translation: gettext.NullTranslations,
+    values: Iterable[float],
+    formatting: str,
+    exact: bool,
+) -> list[str]:
+    """Convert many large integers to text translated with `translation`."""
+    numpy = numpy_module(values)
+    if numpy is not None:
+        # NumPy scalars to Python numbers, which Decimal accepts
+        values = numpy.asarray(values).tolist()
+    return [
+        _int_word(translation, value, formatting, exact) for value in values
+    ]
+
+
+def _int_word(
+    translation: gettext.NullTranslations,
+    value: float,
+    formatting: str,
+    exact: bool = False,
+) -> str:
+    """Convert a large integer to text translated with `translation`."""
+    # POWERS[unit] <= value < POWERS[unit + 1]
+    unit = bisect.bisect_right(POWERS, value) - 1
+    if unit in (-1, len(POWERS) - 1):
         return str(value)
-    for ordinal, power in enumerate(POWERS[1:], 1):
-        if value < power:
-            chopped = value / float(POWERS[ordinal - 1])
-            if float(f"{chopped:{formatting}}") == float(10**3):
-                chopped = value / float(POWERS[ordinal])
-                return f"{chopped:{formatting}} {_(HUMAN_POWERS[ordinal])}"
-            else:
-                return f"{chopped:{formatting}} {_(HUMAN_POWERS[ordinal - 1])}"
-    return str(value)
+    chopped: float | Decimal
+    # values shown as exactly 1000 of a unit are shown in the next one
+    if exact and isinstance(value, int):
+        low, high = _exact_round_up_range(formatting, _EXPONENTS[unit])
+        if low <= value < high:
+            unit += 1
+        chopped = _decimal_quotient(value, _EXPONENTS[unit])
+    else:
+        chopped = value / float(POWERS[unit])
+        low_float, high_float = _round_up_range(formatting)
+        if low_float <= chopped < high_float:
+            unit += 1
+            chopped = value / float(POWERS[unit])
+    return f"{chopped:{formatting}} {translation.gettext(HUMAN_POWERS[unit])}"
+
+
+@functools.lru_cache(maxsize=32)
+def _round_up_range(formatting: str) -> tuple[float, float]:
+    """Return the range of floats that `formatting` rounds to 1000."""
+
+    def rounded(number: float) -> float:
+        return float(f"{number:{formatting}}")
+
+    return (
+        _first_float(0.0, 1000.0, lambda number: rounded(number) >= 1000),
+        _first_float(1000.0, 2000.0, lambda number: rounded(number) > 1000),
+    )
+
+
+def _first_float(
+    low: float, high: float, predicate: Callable[[float], bool]
+) -> float:
+    """Return the smallest float up to `high` for which `predicate` holds.
+
+    The predicate must hold for `high` and for every float above the
+    returned one, as for a threshold on a rounded value.
+    """
+    while True:
+        middle = (low + high) / 2
+        if middle in (low, high):
+            return high
+        if predicate(middle):
+            high = middle
+        else:
+            low = middle
+
+
+@functools.lru_cache(maxsize=256)
+def _exact_round_up_range(formatting: str, exponent: int) -> tuple[int, int]:
+    """Return the range of integers rounded to 1000 times 10**exponent."""
+    import decimal
+
+    def rounded(number: int) -> Decimal:
+        quotient = _decimal_quotient(number, exponent)
+        return decimal.Decimal(f"{quotient:{formatting}}")
+
+    power = 10**exponent
+    return (
+        _first_int(0, 1000 * power, lambda number: rounded(number) >= 1000),
+        _first_int(
+            1000 * power, 2000 * power, lambda number: rounded(number) > 1000
+        ),
+    )
+
+
+def _first_int(low: int, high: int, predicate: Callable[[int], bool]) -> int:
+    """Return the smallest integer up to `high` for which `predicate` holds.
+
+    Like `_first_float`, for integers.
+    """
+    while high - low > 1:
+        middle = (low + high) // 2
+        if predicate(middle):
+            high = middle
+        else:
+            low = middle
+    return high
+
+
+def _decimal_quotient(value: int, exponent: int) -> Decimal:
+    """Return `value` divided by 10**exponent, without rounding."""
+    import decimal
+
+    # unlike arithmetic, the constructor ignores the context precision, and
+    # without trailing zeros "g" formats like it does for floats
+    digits = str(value)
+    significant = digits.rstrip("0") or "0"
+    shift = len(digits) - len(significant) - exponent
+    return decimal.Decimal(f"{significant}E{shift}")
 
 
 def ap_number(value: float | str) -> str | float:
@@ -153,6 +395,14 @@ def ap_number(value: float | str) -> str | float:
         Union[str, float]: spelled 1-9 numbers or original number.
 
     """
+    return _ap_number(i18n.get_translation(), value)
+
+
+def _ap_number(
+    translation: gettext.NullTranslations, value: float | str
+) -> str | float:
+    """Spell 1-9 numbers translated with `translation`."""
+    _ = translation.gettext
     value = int(value)
     if not 0 <= value < 10:
         return str(value)
@@ -201,11 +451,33 @@ def fractional(value: str | float) -> str:
         str: human readable number.
 
     """
-    number = float(value)
+    return _fractional(float(value))
+
+
+def fractional_many(values: Iterable[str | float]) -> list[str]:
+    """Return human readable fractional numbers for many values at once.
+
+    Same as calling ``fractional`` on every value, sharing its cache.
+
+    Examples:
+        >>> fractional_many([0.5, 1.3, "2.25", 3])
+        ['1/2', '1 3/10', '2 1/4', '3']
+
+    Args:
+        values: any numbers.
+
+    Returns:
+        list[str]: human readable numbers.
+
+    """
+    return [_fractional(float(value)) for value in values]
+
+
+@functools.lru_cache(maxsize=1024)
+def _fractional(number: float) -> str:
+    """Return the fractional text of a float, cached as few values repeat."""
     whole_number = int(number)
-    frac = fractions.Fraction(number - whole_number).limit_denominator(1000)
-    numerator = frac.numerator
-    denominator = frac.denominator
+    numerator, denominator = _limit_denominator(number - whole_number)
     if whole_number and not numerator and denominator == 1:
         # this means that an integer was passed in
         # or variants of that integer like 1.0000
@@ -216,6 +488,60 @@ def fractional(value: str | float) -> str:
         return f"{whole_number:.0f} {numerator:.0f}/{denominator:.0f}"
 
 
+_MAX_DENOMINATOR = 1000
+
+
+@functools.lru_cache(maxsize=None)
+def _fraction_table() -> tuple[Sequence[float], Sequence[int]]:
+    """Return the sorted fractions of [0, 1/2] with denominators up to 1000.
+
+    Fractions above 1/2 mirror them. The table is built on first use, as the
+    values of the fractions and their numerator and denominator packed as
+    ``numerator << 10 | denominator``, both in arrays. The fractions are the
+    start of the Farey sequence of order 1000, walked in increasing order.
+    """
+    values = array.array("d")
+    packed = array.array("I")
+    # a / b and c / d are neighbours, each one gives the next
+    a, b, c, d = 0, 1, 1, _MAX_DENOMINATOR
+    while 2 * a <= b:
+        values.append(a / b)
+        packed.append(a << 10 | b)
+        k = (_MAX_DENOMINATOR + b) // d
+        a, b, c, d = c, d, k * c - a, k * d - b
+    return values, packed
+
+
+def _limit_denominator(value: float) -> tuple[int, int]:
+    """Return the closest fraction to `value`, in (-1, 1), as a pair.
+
+    Same as ``Fraction(value).limit_denominator(1000)``, found by binary
+    search in the table of fractions instead of by continued fractions.
+    """
+    # 1 - x is exact for x in [1/2, 1], so only [0, 1/2] is searched
+    target = abs(value)
+    mirrored = target > 0.5
+    if mirrored:
+        target = 1 - target
+    values, packed = _fraction_table()
+    index = bisect.bisect_left(values, target)
+    # the value of at most one fraction rounds to the target, so the closest
+    # fraction is next to the first one not below it. No float is halfway
+    # between two neighbouring fractions, so there are no ties to break.
+    ratio, scale = target.as_integer_ratio()
+    best = best_error = best_denominator = 0
+    for pair in packed[max(index - 1, 0) : index + 2]:
+        denominator = pair & 1023
+        # distance to the target times scale * denominator
+        error = abs(ratio * denominator - (pair >> 10) * scale)
+        if not best or error * best_denominator < best_error * denominator:
+            best, best_error, best_denominator = pair, error, denominator
+    numerator, denominator = best >> 10, best & 1023
+    if mirrored:
+        numerator = denominator - numerator
+    return (-numerator if value < 0 else numerator), denominator
+
+
 def scientific_notation(value: float | str, precision: int = 2) -> str:
     """Return number in string scientific notation z.wq x 10ⁿ.
 
@@ -241,43 +567,56 @@ def scientific_notation(value: float | str, precision: int = 2) -> str:
         str: Number in scientific notation z.wq x 10ⁿ.
 
     """
-    exponents = {
-        "0": "⁰",
-        "1": "¹",
-        "2": "²",
-        "3": "³",
-        "4": "⁴",
-        "5": "⁵",
-        "6": "⁶",
-        "7": "⁷",
-        "8": "⁸",
-        "9": "⁹",
-        "-": "⁻",
-    }
-    negative = False
-
-    if "-" in str(value):
-        value = str(value).replace("-", "")
-        negative = True
+    return _scientific_notation(value, precision)
 
-    if isinstance(value, str):
-        value = float(value)
 
-    precision_number = f"{value:.{precision}e}"
+def scientific_notation_many(
+    values: Iterable[float | str], precision: int = 2
+) -> list[str]:
+    """Return many numbers in string scientific notation z.wq x 10ⁿ.
+
+    Same as calling ``scientific_notation`` on every value. NumPy arrays are
+    accepted too.
+
+    Examples:
+        >>> scientific_notation_many([0.3, 500, "99"])
+        ['3.00 x 10⁻¹', '5.00 x 10²', '9.90 x 10¹']
+
+    Args:
+        values: input numbers.
+        precision: number of decimal for first part of the numbers.
 
-    significand, exponent = precision_number.split("e")
-    # remove extra 0
-    if exponent[1] == "0":
-        exponent = exponent[0] + exponent[2:]
-    # remove + sign
-    if exponent[0] == "+":
-        exponent = exponent[1:]
+    Returns:
+        list[str]: Numbers in scientific notation z.wq x 10ⁿ.
 
-    formatted_exponent = []
-    if negative:
-        formatted_exponent.append(exponents["-"])
+    """
+    numpy = numpy_module(values)
+    if numpy is not None:
+        # NumPy scalars to Python numbers, which take the fast path
+        values = numpy.asarray(values).tolist()
+    return [_scientific_notation(value, precision) for value in values]
 
-    for char in exponent:
-        formatted_exponent.append(exponents[char])
 
-    return f"{significand} x 10{''.join(formatted_exponent)}"
+_SUPERSCRIPTS = str.maketrans("0123456789-", "⁰¹²³⁴⁵⁶⁷⁸⁹⁻")
+
+
+def _scientific_notation(value: float | str, precision: int) -> str:
+    """Return `value` in scientific notation, see `scientific_notation`."""
+    # a minus sign anywhere in the text of the value, even in its exponent,
+    # is dropped and makes the exponent negative. Floats from 1e-4 up and
+    # non-negative integers have none, so their text is not needed.
+    if (type(value) is float and value >= 1e-4) or (
+        type(value) is int and value >= 0
+    ):
+        sign = ""
+    else:
+        text = str(value)
+        sign = "-" if "-" in text else ""
+        if sign:
+            value = float(text.replace("-", ""))
+        elif isinstance(value, str):
+            value = float(value)
+    significand, exponent = f"{value:.{precision}e}".split("e")
+    # the exponent without its plus sign nor leading zero
+    exponent = f"{sign}{int(exponent)}".translate(_SUPERSCRIPTS)
+    return f"{significand} x 10{exponent}"
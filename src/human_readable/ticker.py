@@ -0,0 +1,176 @@
+"""Live relative time labels refreshed only when their text changes."""
+
+from __future__ import annotations
+
+import datetime as dt
+import heapq
+import itertools
+from collections.abc import Hashable
+
+import human_readable.i18n as i18n
+import human_readable.times as times
+
+
+__all__ = ["RelativeTimeTicker"]
+
+
+class RelativeTimeTicker:
+    """Relative time labels of many datetimes, kept up to date by ticks.
+
+    Every registered datetime has a label, the text of ``date_time``, which
+    only changes when the time elapsed crosses the boundary of its unit. The
+    entries are kept in a heap ordered by the instant their label changes,
+    so each `tick` only recomputes the labels that are due and returns the
+    ones whose text changed.
+
+    Example:
+        >>> import datetime as dt
+        >>> now = dt.datetime(2020, 2, 2, 12, 0, 0)
+        >>> ticker = RelativeTimeTicker()
+        >>> login = now - dt.timedelta(minutes=5, seconds=10)
+        >>> ticker.add("login", login, now=now)
+        '5 minutes ago'
+        >>> ticker.tick(now + dt.timedelta(seconds=30))
+        []
+        >>> ticker.tick(now + dt.timedelta(seconds=50))
+        [('login', '6 minutes ago')]
+
+    Args:
+        locale: Language name, e.g. `en_GB`. Defaults to no translation.
+        path: Path to search for locales.
+        use_months: if true return number of months. Defaults to True.
+        minimum_unit: The lowest unit that can be used.
+
+    """
+
+    def __init__(
+        self,
+        locale: str = "",
+        path: str | None = None,
+        use_months: bool = True,
+        minimum_unit: str = "seconds",
+    ) -> None:
+        """Resolve the translations of `locale` and check `minimum_unit`."""
+        times._time_delta_minimum_unit(minimum_unit)
+        self.translation = i18n.load(locale, path)
+        self.use_months = use_months
+        self.minimum_unit = minimum_unit
+        # key -> (datetime, label, sequence number of its live heap entry)
+        self._entries: dict[Hashable, tuple[dt.datetime, str, int]] = {}
+        # (change instant, sequence number, key); removed or replaced keys
+        # leave stale items behind, skipped when popped
+        self._heap: list[tuple[dt.datetime, int, Hashable]] = []
+        self._sequence = itertools.count()
+
+    def __len__(self) -> int:
+        """Return the number of registered keys."""
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Return whether `key` is registered."""
+        return key in self._entries
+
+    def __getitem__(self, key: Hashable) -> str:
+        """Return the current label of `key`."""
+        return self._entries[key][1]
+
+    def add(
+        self, key: Hashable, value: dt.datetime, now: dt.datetime | None = None
+    ) -> str:
+        """Register `value` under `key`, replacing any previous datetime.
+
+        Args:
+            key: identifier of the label.
+            value: datetime to humanize.
+            now: current time. Defaults to the current time in the local
+                timezone.
+
+        Returns:
+            str: label of `value`.
+
+        """
+        text, change = self._label(value, now or times._now())
+        self._schedule(key, value, text, change)
+        # a replaced key leaves its previous item behind
+        self._compact()
+        return text
+
+    def remove(self, key: Hashable) -> None:
+        """Unregister `key`.
+
+        Args:
+            key: identifier of the label.
+
+        Raises:
+            KeyError: when `key` is not registered.
+
+        """
+        del self._entries[key]
+        self._compact()
+
+    def next_tick(self) -> dt.datetime | None:
+        """Return when the next label changes, or None without labels."""
+        heap = self._heap
+        while heap:
+            _, sequence, key = heap[0]
+            entry = self._entries.get(key)
+            if entry is not None and entry[2] == sequence:
+                return heap[0][0]
+            heapq.heappop(heap)
+        return None
+
+    def tick(
+        self, now: dt.datetime | None = None
+    ) -> list[tuple[Hashable, str]]:
+        """Update the labels that are due and return the changed ones.
+
+        Args:
+            now: current time. Defaults to the current time in the local
+                timezone.
+
+        Returns:
+            list[tuple[Hashable, str]]: keys whose label changed, with their
+                new label, in the order the changes happened.
+
+        """
+        now = now or times._now()
+        heap = self._heap
+        entries = self._entries
+        changed = []
+        while heap and heap[0][0] <= now:
+            _, sequence, key = heapq.heappop(heap)
+            entry = entries.get(key)
+            if entry is None or entry[2] != sequence:
+                continue
+            value, previous, _ = entry
+            text, change = self._label(value, now)
+            self._schedule(key, value, text, change)
+            if text != previous:
+                changed.append((key, text))
+        return changed
+
+    def _label(
+        self, value: dt.datetime, now: dt.datetime
+    ) -> tuple[str, dt.datetime]:
+        return times._date_time_and_next_change(
+            self.translation, value, self.use_months, self.minimum_unit, now
+        )
+
+    def _compact(self) -> None:
+        # stale items are only skipped once at the top of the heap, which can
+        # take months, so they are dropped when they outnumber the live ones
+        if len(self._heap) > 2 * len(self._entries) + 64:
+            self._heap = [
+                item
+                for item in self._heap
+                if item[2] in self._entries
+                and self._entries[item[2]][2] == item[1]
+            ]
+            heapq.heapify(self._heap)
+
+    def _schedule(
+        self, key: Hashable, value: dt.datetime, text: str, change: dt.datetime
+    ) -> None:
+        sequence = next(self._sequence)
+        self._entries[key] = (value, text, sequence)
+        heapq.heappush(self._heap, (change, sequence, key))
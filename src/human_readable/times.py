@@ -2,18 +2,22 @@
 
 from __future__ import annotations
 
+import contextlib
+import contextvars
 import datetime as dt
 import enum
 import functools
+import gettext
 import math
+import re
+from collections.abc import Collection
+from collections.abc import Iterable
+from collections.abc import Iterator
+from types import ModuleType
 from typing import Any
 
 import human_readable.i18n as i18n
-
-
-_ = i18n.gettext
-P_ = i18n.pgettext
-N_ = i18n.ngettext
+from human_readable._numpy import numpy_module
 
 
 @functools.total_ordering
@@ -34,12 +38,63 @@ class Unit(enum.Enum):
         return self.value < other.value
 
 
+_UNITS = tuple(Unit)
+
+# snapshot of the innermost `frozen_now` scope, used instead of the clock
+_FROZEN_NOW: contextvars.ContextVar[dt.datetime | None] = (
+    contextvars.ContextVar("human_readable_now", default=None)
+)
+
+
 def _now() -> dt.datetime:
-    return dt.datetime.now()
+    return _FROZEN_NOW.get() or dt.datetime.now()
+
+
+def _today() -> dt.date:
+    return _now().date()
+
+
+@contextlib.contextmanager
+def frozen_now(now: dt.datetime | None = None) -> Iterator[dt.datetime]:
+    """Use a single snapshot of the current time for the enclosed block.
+
+    Every function of this module that defaults to the current time reads the
+    clock once per call. Inside the block they all use the same snapshot
+    instead, so a batch of values is rendered consistently and without one
+    clock read per value. Like `i18n.activated`, the snapshot is stored in a
+    context variable; nested scopes keep the outer snapshot unless `now` is
+    given.
+
+    Example:
+        >>> import datetime as dt
+        >>> with frozen_now(dt.datetime(2020, 2, 2, 12, 0, 0)) as now:
+        ...     date_time(dt.datetime(2020, 2, 2, 11, 58, 0))
+        '2 minutes ago'
+
+    Args:
+        now: Point in time to use. Defaults to the current time in the local
+            timezone.
+
+    Yields:
+        dt.datetime: the snapshot.
+
+    """
+    snapshot = now or _now()
+    token = _FROZEN_NOW.set(snapshot)
+    try:
+        yield snapshot
+    finally:
+        _FROZEN_NOW.reset(token)
 
 
 def time_of_day(hour: int) -> str:
     """Given current hour, returns time of the day."""
+    return _time_of_day(i18n.get_translation(), hour)
+
+
+def _time_of_day(translation: gettext.NullTranslations, hour: int) -> str:
+    """Return time of the day translated with `translation`."""
+    _ = translation.gettext
     if 0 < hour < 12:
         return _("morning")
     elif 12 < hour <= 18:
@@ -50,38 +105,48 @@ def time_of_day(hour: int) -> str:
 
 
 def _formal_time(
-    value: dt.time, hour: int, count_hours: list[str], count_minutes: list[str]
+    translation: gettext.NullTranslations,
+    value: dt.time,
+    hour: int,
+    count_hours: tuple[str, ...],
+    count_minutes: tuple[str, ...],
 ) -> str:
     """Return formal timing."""
+    N_ = translation.ngettext
     hour_count = count_hours[hour]
     if value.minute > 30:
         reversed_minute_count = count_minutes[60 - value.minute]
-        minute_translation = i18n.ngettext(
+        minute_translation = N_(
             "{amount} minute", "{amount} minutes", 60 - value.minute
         ).format(amount=reversed_minute_count)
-        return i18n.ngettext(
+        return N_(
             "{minute_translation} to {hour_count} hour",
             "{minute_translation} to {hour_count} hours",
             hour,
         ).format(minute_translation=minute_translation, hour_count=hour_count)
     elif value.minute == 0:
-        return i18n.ngettext(
-            "{hour_count} o'clock", "{hour_count} o'clock", hour
-        ).format(hour_count=hour_count)
+        return N_("{hour_count} o'clock", "{hour_count} o'clock", hour).format(
+            hour_count=hour_count
+        )
     else:
         minute_count = count_minutes[value.minute]
-        minute_translation = i18n.ngettext(
+        minute_translation = N_(
             "{amount} minute", "{amount} minutes", value.minute
         ).format(amount=minute_count)
-        return i18n.ngettext(
+        return N_(
             "{minute_translation} past {hour_count}",
             "{minute_translation} past {hour_count}",
             hour,
         ).format(hour_count=hour_count, minute_translation=minute_translation)
 
 
-def _informal_hour_count(hour: int, count_hours: list[str]) -> str:
+def _informal_hour_count(
+    translation: gettext.NullTranslations,
+    hour: int,
+    count_hours: tuple[str, ...],
+) -> str:
     """Return word hour used in informal timing."""
+    _ = translation.gettext
     if hour == 0:
         hour_count = _("midnight")
     elif hour == 12:
@@ -94,9 +159,14 @@ def _informal_hour_count(hour: int, count_hours: list[str]) -> str:
 
 
 def _informal_minute_count(
-    value: dt.time, hour: int, hour_count: str, count_minutes: list[str]
+    translation: gettext.NullTranslations,
+    value: dt.time,
+    hour: int,
+    hour_count: str,
+    count_minutes: tuple[str, ...],
 ) -> str:
     """Return messsage format informal timing based on minute count."""
+    _ = translation.gettext
     if value.minute == 0:
         clock = hour_count
     elif value.minute > 30:
@@ -113,7 +183,7 @@ def _informal_minute_count(
                 reversed_minute_count=reversed_minute_count
             )
         else:
-            clock = i18n.ngettext(
+            clock = translation.ngettext(
                 "{reversed_minute_count} to {hour_count}",
                 "{reversed_minute_count} to {hour_count}",
                 hour,
@@ -134,35 +204,46 @@ def _informal_minute_count(
 
 
 def _informal_time(
-    value: dt.time, hour: int, count_hours: list[str], count_minutes: list[str]
+    translation: gettext.NullTranslations,
+    value: dt.time,
+    hour: int,
+    count_hours: tuple[str, ...],
+    count_minutes: tuple[str, ...],
 ) -> str:
     """Return informal timing."""
-    period = time_of_day(hour)
+    _ = translation.gettext
+    period = _time_of_day(translation, hour)
 
-    hour_count = _informal_hour_count(hour, count_hours)
+    hour_count = _informal_hour_count(translation, hour, count_hours)
 
-    clock = _informal_minute_count(value, hour, hour_count, count_minutes)
+    clock = _informal_minute_count(
+        translation, value, hour, hour_count, count_minutes
+    )
 
     if period:
         return _("{clock} in the {period}").format(clock=clock, period=period)
     return clock
 
 
-def timing(time: dt.time, formal: bool = True) -> str:
-    """Return human-readable time.
+@functools.lru_cache(maxsize=None)
+def _clock_words(
+    translation: gettext.NullTranslations,
+) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """Return the hour and minute words used by `timing` for a catalog.
 
-    Compares time values to present time returns representing readable of time
-    with the given day period.
+    The tables are built once per translation catalog; since the catalog
+    itself is the cache key, activating or deactivating a locale switches
+    tables without any explicit invalidation.
 
     Args:
-        time: any datetime.
-        formal: formal or informal reading. Defaults to True.
+        translation: catalog used to translate the words.
 
     Returns:
-        str: readable time or original object.
+        Tuple with the 24 hour words and the 60 minute words.
 
     """
-    count_hours = [
+    P_ = translation.pgettext
+    count_hours = (
         P_("hour 0", "zero"),
         P_("hour 1", "one"),
         P_("hour 2", "two"),
@@ -187,9 +268,8 @@ def timing(time: dt.time, formal: bool = True) -> str:
         P_("hour 21", "nine"),
         P_("hour 22", "ten"),
         P_("hour 23", "eleven"),
-    ]
-
-    count_minutes = [
+    )
+    count_minutes = (
         P_("minute 0", "zero"),
         P_("minute 1", "one"),
         P_("minute 2", "two"),
@@ -250,7 +330,32 @@ def timing(time: dt.time, formal: bool = True) -> str:
         P_("minute 57", "fifty seven"),
         P_("minute 58", "fifty eight"),
         P_("minute 59", "fifty nine"),
-    ]
+    )
+    return count_hours, count_minutes
+
+
+def timing(time: dt.time, formal: bool = True) -> str:
+    """Return human-readable time.
+
+    Compares time values to present time returns representing readable of time
+    with the given day period.
+
+    Args:
+        time: any datetime.
+        formal: formal or informal reading. Defaults to True.
+
+    Returns:
+        str: readable time or original object.
+
+    """
+    return _timing(i18n.get_translation(), time, formal)
+
+
+def _timing(
+    translation: gettext.NullTranslations, time: dt.time, formal: bool
+) -> str:
+    """Return human-readable time translated with `translation`."""
+    count_hours, count_minutes = _clock_words(translation)
 
     # time relative to next hour
     if time.minute > 30:
@@ -261,9 +366,13 @@ def timing(time: dt.time, formal: bool = True) -> str:
         hour = time.hour
 
     if formal:
-        clock = _formal_time(time, hour, count_hours, count_minutes)
+        clock = _formal_time(
+            translation, time, hour, count_hours, count_minutes
+        )
     else:
-        clock = _informal_time(time, hour, count_hours, count_minutes)
+        clock = _informal_time(
+            translation, time, hour, count_hours, count_minutes
+        )
 
     return clock
 
@@ -279,8 +388,7 @@ def _abs_timedelta(delta: dt.timedelta) -> dt.timedelta:
 
     """
     if delta.days < 0:
-        now = _now()
-        return now - (now + delta)
+        return -delta
     return delta
 
 
@@ -306,86 +414,144 @@ def date_and_delta(
 
 
 def _less_than_a_day(
-    seconds: int, minimum_unit_type: Unit, delta: dt.timedelta
-) -> str:
+    seconds: int, minimum_unit_type: Unit, microseconds: int
+) -> tuple[str, int]:
     if seconds == 0:
-        if minimum_unit_type == Unit.MICROSECONDS and delta.microseconds < 1000:
-            return i18n.ngettext(
-                "{amount} microsecond",
-                "{amount} microseconds",
-                delta.microseconds,
-            ).format(amount=delta.microseconds)
+        if minimum_unit_type == Unit.MICROSECONDS and microseconds < 1000:
+            return "microseconds", microseconds
         elif minimum_unit_type == Unit.MILLISECONDS or (
             minimum_unit_type == Unit.MICROSECONDS
-            and 1000 <= delta.microseconds < 1_000_000
+            and 1000 <= microseconds < 1_000_000
         ):
-            milliseconds = delta.microseconds / 1000
-            return i18n.ngettext(
-                "{amount} millisecond",
-                "{amount} milliseconds",
-                int(milliseconds),
-            ).format(amount=int(milliseconds))
-        return _("a moment")
-    elif seconds == 1:
-        return _("a second")
+            return "milliseconds", microseconds // 1000
+        return "seconds", 0
     elif seconds < 60:
-        return i18n.ngettext(
-            "{amount} second", "{amount} seconds", seconds
-        ).format(amount=seconds)
-    elif 60 <= seconds < 120:
-        return _("a minute")
-    elif 120 <= seconds < 3600:
-        minutes = seconds // 60
-        return i18n.ngettext(
-            "{amount} minute", "{amount} minutes", minutes
-        ).format(amount=minutes)
-    elif 3600 <= seconds < 3600 * 2:
+        return "seconds", seconds
+    elif seconds < 3600:
+        return "minutes", seconds // 60
+    return "hours", seconds // 3600
+
+
+def _less_than_a_year(
+    days: int, months: int, use_months: bool
+) -> tuple[str, int]:
+    if use_months and months:
+        return "months", months
+    return "days", days
+
+
+def _one_year(days: int, months: int, use_months: bool) -> tuple[str, int]:
+    if use_months and months:
+        return "1 year, months", months
+    return "1 year, days", days
+
+
+@functools.lru_cache(maxsize=4096)
+def _bucket_text(
+    translation: gettext.NullTranslations, unit: str, amount: int
+) -> str:
+    """Return the `time_delta` text of `amount` in the bucket `unit`.
+
+    The text only depends on the bucket, so it is cached per translation:
+    catalogs loaded or activated later are new keys and never see stale
+    entries.
+    """
+    if unit in _CLOCK_BUCKETS:
+        return _clock_bucket_text(translation, unit, amount)
+    return _calendar_bucket_text(translation, unit, amount)
+
+
+_CLOCK_BUCKETS = {"microseconds", "milliseconds", "seconds", "minutes", "hours"}
+
+
+def _clock_bucket_text(
+    translation: gettext.NullTranslations, unit: str, amount: int
+) -> str:
+    _ = translation.gettext
+    if unit == "microseconds":
+        return translation.ngettext(
+            "{amount} microsecond", "{amount} microseconds", amount
+        ).format(amount=amount)
+    elif unit == "milliseconds":
+        return translation.ngettext(
+            "{amount} millisecond", "{amount} milliseconds", amount
+        ).format(amount=amount)
+    elif unit == "seconds":
+        if amount == 0:
+            return _("a moment")
+        elif amount == 1:
+            return _("a second")
+        return translation.ngettext(
+            "{amount} second", "{amount} seconds", amount
+        ).format(amount=amount)
+    elif unit == "minutes":
+        if amount == 1:
+            return _("a minute")
+        return translation.ngettext(
+            "{amount} minute", "{amount} minutes", amount
+        ).format(amount=amount)
+    elif amount == 1:
         return _("an hour")
-    else:
-        hours = seconds // 3600
-        return i18n.ngettext("{amount} hour", "{amount} hours", hours).format(
-            amount=hours
-        )
+    return translation.ngettext(
+        "{amount} hour", "{amount} hours", amount
+    ).format(amount=amount)
 
 
-def _less_than_a_year(days: int, months: int, use_months: bool) -> str:
-    if days == 1:
-        return _("a day")
-    if not use_months:
-        return i18n.ngettext("{amount} day", "{amount} days", days).format(
-            amount=days
-        )
-    else:
-        if not months:
-            return i18n.ngettext("{amount} day", "{amount} days", days).format(
-                amount=days
-            )
-        elif months == 1:
+def _calendar_bucket_text(
+    translation: gettext.NullTranslations, unit: str, amount: int
+) -> str:
+    _ = translation.gettext
+    if unit == "days":
+        if amount == 1:
+            return _("a day")
+        return translation.ngettext(
+            "{amount} day", "{amount} days", amount
+        ).format(amount=amount)
+    elif unit == "months":
+        if amount == 1:
             return _("a month")
-        else:
-            return i18n.ngettext(
-                "{amount} month", "{amount} months", months
-            ).format(amount=months)
-
-
-def _one_year(days: int, months: int, use_months: bool) -> str:
-    if not months and not days:
-        return _("a year")
-    elif not months:
-        return i18n.ngettext(
-            "1 year, {amount} day", "1 year, {amount} days", days
-        ).format(amount=days)
-    elif use_months:
-        if months == 1:
+        return translation.ngettext(
+            "{amount} month", "{amount} months", amount
+        ).format(amount=amount)
+    elif unit == "1 year, days":
+        if amount == 0:
+            return _("a year")
+        return translation.ngettext(
+            "1 year, {amount} day", "1 year, {amount} days", amount
+        ).format(amount=amount)
+    elif unit == "1 year, months":
+        if amount == 1:
             return _("1 year, 1 month")
-        else:
-            return i18n.ngettext(
-                "1 year, {amount} month", "1 year, {amount} months", months
-            ).format(amount=months)
-    else:
-        return i18n.ngettext(
-            "1 year, {amount} day", "1 year, {amount} days", days
-        ).format(amount=days)
+        return translation.ngettext(
+            "1 year, {amount} month", "1 year, {amount} months", amount
+        ).format(amount=amount)
+    return translation.ngettext(
+        "{amount} year", "{amount} years", amount
+    ).format(amount=amount)
+
+
+def time_delta_cache_info() -> Any:
+    """Return statistics of the cache of `time_delta` texts.
+
+    Every text produced by ``time_delta``, ``time_delta_many`` and
+    ``date_time`` is cached per locale and time bucket, such as 5 minutes or
+    3 months. The cache holds at most 4096 texts, least recently used first
+    out.
+
+    Returns:
+        named tuple of hits, misses, maxsize and currsize, like
+        ``functools.lru_cache``.
+
+    """
+    return _bucket_text.cache_info()
+
+
+def time_delta_cache_clear() -> None:
+    """Empty the cache of `time_delta` texts and reset its statistics.
+
+    Switching locales does not require it: texts are cached per catalog.
+    """
+    _bucket_text.cache_clear()
 
 
 def time_delta(
@@ -418,10 +584,20 @@ def time_delta(
         Time representation in natural language.
 
     """
-    tmp = Unit[minimum_unit.upper()]
-    if tmp not in (Unit.SECONDS, Unit.MILLISECONDS, Unit.MICROSECONDS):
-        raise ValueError(f"Minimum unit '{minimum_unit}' not supported")
-    minimum_unit_type = tmp
+    return _time_delta(
+        i18n.get_translation(), value, use_months, minimum_unit, when
+    )
+
+
+def _time_delta(
+    translation: gettext.NullTranslations,
+    value: dt.timedelta | int | dt.datetime,
+    use_months: bool,
+    minimum_unit: str,
+    when: dt.datetime | None,
+) -> str:
+    """Return human-readable time difference translated with `translation`."""
+    minimum_unit_type = _time_delta_minimum_unit(minimum_unit)
 
     if isinstance(value, dt.datetime):
         if not when:
@@ -439,14 +615,179 @@ def time_delta(
     days = days % 365
     months = int(days // 30.5)
 
+    return _delta_text(
+        translation,
+        years,
+        days,
+        months,
+        seconds,
+        delta.microseconds,
+        use_months,
+        minimum_unit_type,
+    )
+
+
+def time_delta_many(
+    values: Iterable[dt.timedelta | int | dt.datetime],
+    use_months: bool = True,
+    minimum_unit: str = "seconds",
+    when: dt.datetime | None = None,
+) -> list[str]:
+    """Return human-readable time differences for many values at once.
+
+    Output is identical to calling ``time_delta`` on every value with the
+    same arguments, but the minimum unit and the translations are resolved
+    once and datetimes are all compared to a single snapshot of the current
+    time. NumPy ``timedelta64``, ``datetime64`` and number (seconds) arrays
+    are accepted too (install the ``numpy`` extra); their units are computed
+    in bulk.
+
+    Examples:
+        >>> time_delta_many([1, dt.timedelta(days=-3), 3600 * 24 * 400])
+        ['a second', '3 days', '1 year, 1 month']
+
+    Args:
+        values: timedeltas, numbers of seconds or datetimes, as a sequence or
+            a NumPy array.
+        use_months: If `True`, then a number of months (based on 30.5 days) will be
+            used for fuzziness between years.
+        minimum_unit: The lowest unit that can be used. Options: "seconds",
+            "milliseconds" or "microseconds".
+        when: Point in time relative to which datetimes are interpreted.
+            Defaults to the current time in the local timezone.
+
+    Returns:
+        list[str]: time representations in natural language.
+
+    Raises:
+        TypeError: if `values` is a NumPy array of anything else.
+
+    """
+    return _time_delta_many(
+        i18n.get_translation(), values, use_months, minimum_unit, when
+    )
+
+
+def _time_delta_many(
+    translation: gettext.NullTranslations,
+    values: Iterable[dt.timedelta | int | dt.datetime],
+    use_months: bool,
+    minimum_unit: str,
+    when: dt.datetime | None,
+) -> list[str]:
+    """Return human-readable time differences translated with `translation`."""
+    minimum_unit_type = _time_delta_minimum_unit(minimum_unit)
+    numpy = numpy_module(values)
+    if numpy is not None:
+        parts = _split_delta_array(numpy, values, when)
+    else:
+        now = when
+        parts = []
+        for value in values:
+            if isinstance(value, dt.datetime):
+                if not now:
+                    now = _now()
+                delta = now - value
+            elif isinstance(value, int):
+                delta = dt.timedelta(seconds=value)
+            else:
+                delta = value
+            if delta.days < 0:
+                delta = -delta
+            years, days = divmod(delta.days, 365)
+            parts.append(
+                (
+                    years,
+                    days,
+                    int(days // 30.5),
+                    delta.seconds,
+                    delta.microseconds,
+                )
+            )
+    return [
+        _delta_text(
+            translation,
+            years,
+            days,
+            months,
+            seconds,
+            microseconds,
+            use_months,
+            minimum_unit_type,
+        )
+        for years, days, months, seconds, microseconds in parts
+    ]
+
+
+def _split_delta_array(
+    numpy: ModuleType, values: Any, when: dt.datetime | None
+) -> Iterable[tuple[int, ...]]:
+    """Split a NumPy array of deltas in years, days, months and seconds.
+
+    Raises:
+        TypeError: if the array holds neither timedeltas, datetimes nor
+            numbers of seconds.
+
+    """
+    array = numpy.asarray(values)
+    kind = array.dtype.kind
+    if kind == "M":
+        # like datetimes in time_delta, relative to a single point in time
+        now = numpy.datetime64(when or _now(), "us")
+        array = now - array.astype("datetime64[us]")
+        kind = "m"
+    if kind == "m":
+        microseconds = array.astype("timedelta64[us]").astype(numpy.int64)
+    elif kind in "iu":
+        microseconds = array.astype(numpy.int64) * 1_000_000
+    elif kind == "f":
+        # rounded to the microsecond, like dt.timedelta(seconds=value)
+        microseconds = numpy.rint(array * 1_000_000).astype(numpy.int64)
+    else:
+        raise TypeError(f"unsupported array of {array.dtype}")
+    microseconds = numpy.abs(microseconds)
+    days, microseconds = numpy.divmod(microseconds, 86_400_000_000)
+    seconds, microseconds = numpy.divmod(microseconds, 1_000_000)
+    years, days = numpy.divmod(days, 365)
+    months = (days // 30.5).astype(numpy.int64)
+    return zip(
+        years.tolist(),
+        days.tolist(),
+        months.tolist(),
+        seconds.tolist(),
+        microseconds.tolist(),
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def _time_delta_minimum_unit(minimum_unit: str) -> Unit:
+    """Parse the minimum unit of `time_delta`, which must be below a minute."""
+    unit = Unit[minimum_unit.upper()]
+    if unit not in (Unit.SECONDS, Unit.MILLISECONDS, Unit.MICROSECONDS):
+        raise ValueError(f"Minimum unit '{minimum_unit}' not supported")
+    return unit
+
+
+def _delta_text(
+    translation: gettext.NullTranslations,
+    years: int,
+    days: int,
+    months: int,
+    seconds: int,
+    microseconds: int,
+    use_months: bool,
+    minimum_unit_type: Unit,
+) -> str:
+    """Return `time_delta` text of an absolute delta split in its units."""
     if not years and days < 1:
-        return _less_than_a_day(seconds, minimum_unit_type, delta)
+        bucket = _less_than_a_day(seconds, minimum_unit_type, microseconds)
     elif years == 0:
-        return _less_than_a_year(days, months, use_months)
+        bucket = _less_than_a_year(days, months, use_months)
     elif years == 1:
-        return _one_year(days, months, use_months)
-    translation = i18n.ngettext("{amount} year", "{amount} years", years)
-    return translation.format(amount=years)
+        bucket = _one_year(days, months, use_months)
+    else:
+        bucket = "years", years
+    return _bucket_text(translation, *bucket)
 
 
 def date_time(
@@ -477,13 +818,28 @@ def date_time(
         Time in natural language.
 
     """
+    return _date_time(
+        i18n.get_translation(), value, future, use_months, minimum_unit, when
+    )
+
+
+def _date_time(
+    translation: gettext.NullTranslations,
+    value: dt.timedelta | int | dt.datetime,
+    future: bool,
+    use_months: bool,
+    minimum_unit: str,
+    when: dt.datetime | None,
+) -> str:
+    """Return human-readable time translated with `translation`."""
+    _ = translation.gettext
     now = when or _now()
     date, delta = date_and_delta(value, now=now)
     # determine tense by value only if datetime/timedelta were passed
     if isinstance(value, (dt.datetime, dt.timedelta)):
         future = date > now
 
-    str_delta = time_delta(delta, use_months, minimum_unit, when=when)
+    str_delta = _time_delta(translation, delta, use_months, minimum_unit, when)
 
     if str_delta == _("a moment"):
         return _("now")
@@ -494,6 +850,120 @@ def date_time(
         return _("{time_difference} ago").format(time_difference=str_delta)
 
 
+def date_time_and_next_change(
+    value: dt.datetime,
+    use_months: bool = True,
+    minimum_unit: str = "seconds",
+    when: dt.datetime | None = None,
+) -> tuple[str, dt.datetime]:
+    """Return human-readable time and when it will change.
+
+    The text is the one of ``date_time``. As time goes by, it only changes
+    when the time elapsed since (or left until) `value` crosses the boundary
+    of its unit, e.g. "5 minutes ago" stays the same for a whole minute. The
+    second item returned is the first point in time, to the microsecond, at
+    which ``date_time`` of `value` gives another text, so that live labels
+    can be refreshed only when they are due.
+
+    Examples:
+        >>> import datetime as dt
+        >>> when = dt.datetime(2020, 2, 2, 12, 0, 0)
+        >>> text, change = date_time_and_next_change(
+        ...     dt.datetime(2020, 2, 2, 11, 54, 30), when=when
+        ... )
+        >>> text, change.time()
+        ('5 minutes ago', datetime.time(12, 0, 30))
+
+    Args:
+        value: datetime to humanize.
+        use_months: if true return number of months. Defaults to True.
+        minimum_unit: The lowest unit that can be used.
+        when: Point in time relative to which _value_ is
+            interpreted.  Defaults to the current time in the local timezone.
+
+    Returns:
+        tuple[str, dt.datetime]: time in natural language and the datetime it
+            will next change at.
+
+    """
+    return _date_time_and_next_change(
+        i18n.get_translation(), value, use_months, minimum_unit, when
+    )
+
+
+def _date_time_and_next_change(
+    translation: gettext.NullTranslations,
+    value: dt.datetime,
+    use_months: bool,
+    minimum_unit: str,
+    when: dt.datetime | None,
+) -> tuple[str, dt.datetime]:
+    """Return human-readable time and its next change with `translation`."""
+    now = when or _now()
+    text = _date_time(translation, value, False, use_months, minimum_unit, now)
+    delta = now - value
+    lower, upper = _bucket_bounds(
+        abs(delta) // _MICROSECOND,
+        use_months,
+        _time_delta_minimum_unit(minimum_unit),
+    )
+    if delta >= dt.timedelta(0):
+        # in the past, the time elapsed grows up to the next bucket
+        return text, value + upper * _MICROSECOND
+    elif lower:
+        # in the future, the time left shrinks below the current bucket
+        return text, value - (lower - 1) * _MICROSECOND
+    elif upper == _SECOND:
+        # "now" lasts until a second has elapsed
+        return text, value + upper * _MICROSECOND
+    # the tense changes when `value` is reached
+    return text, value
+
+
+_MICROSECOND = dt.timedelta(microseconds=1)
+_SECOND = 1_000_000
+_DAY = 86_400 * _SECOND
+
+
+def _bucket_bounds(
+    microseconds: int, use_months: bool, minimum_unit_type: Unit
+) -> tuple[int, int]:
+    """Return bounds, in microseconds, of deltas with the same text.
+
+    Args:
+        microseconds: absolute delta.
+        use_months: if true, months are used between days and years.
+        minimum_unit_type: lowest unit of the text.
+
+    Returns:
+        tuple[int, int]: lower (included) and upper (excluded) bounds.
+
+    """
+    days, microseconds = divmod(microseconds, _DAY)
+    if not days:
+        seconds, microseconds = divmod(microseconds, _SECOND)
+        if seconds:
+            step = 1 if seconds < 60 else 60 if seconds < 3600 else 3600
+            lower = seconds // step * step * _SECOND
+            return lower, lower + step * _SECOND
+        if minimum_unit_type == Unit.MICROSECONDS and microseconds < 1000:
+            return microseconds, microseconds + 1
+        if minimum_unit_type != Unit.SECONDS:
+            lower = microseconds // 1000 * 1000
+            return lower, lower + 1000
+        return 0, _SECOND
+    years, days = divmod(days, 365)
+    if years > 1:
+        return years * 365 * _DAY, (years + 1) * 365 * _DAY
+    months = int(days // 30.5)
+    if use_months and months:
+        first = math.ceil(months * 30.5)
+        last = min(math.ceil((months + 1) * 30.5), 365)
+    else:
+        first, last = days, days + 1
+    return (years * 365 + first) * _DAY, (years * 365 + last) * _DAY
+
+
 def day(date: dt.date, formatting: str = "%b %d") -> str:
     """Return human-readable day.
 
@@ -509,7 +979,15 @@ def day(date: dt.date, formatting: str = "%b %d") -> str:
         str: date formatted in natural language.
 
     """
-    delta = date - dt.date.today()
+    return _day(i18n.get_translation(), date, formatting)
+
+
+def _day(
+    translation: gettext.NullTranslations, date: dt.date, formatting: str
+) -> str:
+    """Return human-readable day translated with `translation`."""
+    _ = translation.gettext
+    delta = date - _today()
     if delta.days == 0:
         return _("today")
     elif delta.days == 1:
@@ -532,10 +1010,15 @@ def date(date: dt.date) -> str:
         str: date in natural language.
 
     """
-    delta = _abs_timedelta(date - dt.date.today())
+    return _date(i18n.get_translation(), date)
+
+
+def _date(translation: gettext.NullTranslations, date: dt.date) -> str:
+    """Return human-readable date translated with `translation`."""
+    delta = _abs_timedelta(date - _today())
     if delta.days >= 5 * 365 / 12:
-        return day(date, "%b %d %Y")
-    return day(date)
+        return _day(translation, date, "%b %d %Y")
+    return _day(translation, date, "%b %d")
 
 
 def year(date: dt.date) -> str:
@@ -552,7 +1035,13 @@ def year(date: dt.date) -> str:
         Year in natural language.
 
     """
-    delta = date.year - dt.date.today().year
+    return _year(i18n.get_translation(), date)
+
+
+def _year(translation: gettext.NullTranslations, date: dt.date) -> str:
+    """Return human-readable year translated with `translation`."""
+    _ = translation.gettext
+    delta = date.year - _today().year
     if delta == 0:
         return _("this year")
     if delta == 1:
@@ -567,7 +1056,7 @@ def _quotient_and_remainder(
     divisor: float,
     unit: Unit,
     minimum_unit: Unit,
-    suppress: list[Unit],
+    suppress: Collection[Unit],
 ) -> tuple[float, float]:
     """Divide `value` by `divisor` returning the quotient and remainder.
 
@@ -619,7 +1108,7 @@ def _carry(
     ratio: float,
     unit: Unit,
     min_unit: Unit,
-    suppress: list[Unit],
+    suppress: Collection[Unit],
 ) -> tuple[float, float]:
     """Return a tuple with two values.
 
@@ -722,6 +1211,43 @@ def _suppress_lower_units(min_unit: Unit, suppress: list[Unit]) -> list[Unit]:
     return list(suppress_set)
 
 
+@functools.lru_cache(maxsize=128)
+def _precise_delta_plan(
+    minimum_unit: str, suppress: tuple[str, ...]
+) -> tuple[Unit, frozenset[Unit]]:
+    """Return minimum unit and suppressed units for `precise_delta` options.
+
+    Options are parsed once per distinct (`minimum_unit`, `suppress`) pair, so
+    repeated calls with the same options only do the arithmetic.
+
+    >>> from human_readable.times import _precise_delta_plan
+    >>> min_unit, ext_suppress = _precise_delta_plan("hours", ("hours",))
+    >>> min_unit
+    <Unit.DAYS: 5>
+    >>> sorted(ext_suppress)
+    [<Unit.MICROSECONDS: 0>, <Unit.MILLISECONDS: 1>, <Unit.SECONDS: 2>, <Unit.MINUTES: 3>, <Unit.HOURS: 4>]
+
+    Args:
+        minimum_unit: minimum unit name.
+        suppress: names of units to be suppressed.
+
+    Returns:
+        Suitable minimum unit and the set of units that cannot be used.
+
+    """
+    suppress_units = [Unit[unit.upper()] for unit in suppress]
+
+    # Find a suitable minimum unit (it can be greater the one that the
+    # user gave us if it is suppressed).
+    min_unit = _suitable_minimum_unit(
+        Unit[minimum_unit.upper()], suppress_units
+    )
+
+    # Expand the suppressed units list/set to include all the units
+    # that are below the minimum unit
+    return min_unit, frozenset(_suppress_lower_units(min_unit, suppress_units))
+
+
 def precise_delta(
     value: dt.timedelta | int,
     minimum_unit: str = "seconds",
@@ -784,25 +1310,29 @@ def precise_delta(
         Humanized time delta.
 
     """
+    return _precise_delta(
+        i18n.get_translation(), value, minimum_unit, suppress, formatting
+    )
+
+
+def _precise_delta(
+    translation: gettext.NullTranslations,
+    value: dt.timedelta | int,
+    minimum_unit: str,
+    suppress: list[str] | None,
+    formatting: str,
+) -> str:
+    """Return a precise representation of a timedelta with `translation`."""
+    _ = translation.gettext
+    N_ = translation.ngettext
     if isinstance(value, int):
         delta = dt.timedelta(seconds=value)
     else:
         delta = value
 
-    if not suppress:
-        suppress_units = []
-    else:
-        suppress_units = [Unit[unit.upper()] for unit in suppress]
-
-    # Find a suitable minimum unit (it can be greater the one that the
-    # user gave us if it is suppressed).
-    min_unit = Unit[minimum_unit.upper()]
-    min_unit = _suitable_minimum_unit(min_unit, suppress_units)
-    del minimum_unit
-
-    # Expand the suppressed units list/set to include all the units
-    # that are below the minimum unit
-    ext_suppress = _suppress_lower_units(min_unit, suppress_units)
+    min_unit, ext_suppress = _precise_delta_plan(
+        minimum_unit, tuple(suppress) if suppress else ()
+    )
 
     # handy aliases
     days: float = delta.days
@@ -810,7 +1340,7 @@ def precise_delta(
     usecs: float = delta.microseconds
 
     MICROSECONDS, MILLISECONDS, SECONDS, MINUTES, HOURS, DAYS, MONTHS, YEARS = (
-        list(Unit)
+        _UNITS
     )
 
     # Given DAYS compute YEARS and the remainder of DAYS as follows:
@@ -901,19 +1431,19 @@ def precise_delta(
     ]
 
     texts: list[str] = []
-    for unit, fmt in zip(reversed(Unit), translations):  # pragma: no branch
-        translation, amount = fmt
+    for unit, fmt in zip(reversed(_UNITS), translations):  # pragma: no branch
+        message, amount = fmt
         if amount > 0 or (not texts and unit == min_unit):
             # apply formatting if amount of min unit is factional
             if unit == min_unit and math.modf(amount)[0] > 0:
-                txt_format = translation.replace(
+                txt_format = message.replace(
                     "{amount}", "{amount:{formatting}}"
                 )
                 texts.append(
                     txt_format.format(amount=amount, formatting=formatting)
                 )
             else:
-                texts.append(translation.format(amount=int(amount)))
+                texts.append(message.format(amount=int(amount)))
 
         if unit == min_unit:
             break
@@ -925,3 +1455,193 @@ def precise_delta(
     tail = texts[-1]
 
     return _("{head} and {tail}").format(head=head, tail=tail)
+
+
+# length in seconds of the units of `precise_delta`
+_UNIT_SECONDS = {
+    ("{amount} second", "{amount} seconds"): 1.0,
+    ("{amount} minute", "{amount} minutes"): 60.0,
+    ("{amount} hour", "{amount} hours"): 3600.0,
+    ("{amount} day", "{amount} days"): 86400.0,
+    ("{amount} month", "{amount} months"): 30.5 * 86400,
+    ("{amount} year", "{amount} years"): 365 * 86400.0,
+    ("1 year, {amount} day", "1 year, {amount} days"): 86400.0,
+    ("1 year, {amount} month", "1 year, {amount} months"): 30.5 * 86400,
+    ("{amount} millisecond", "{amount} milliseconds"): 1e-3,
+    ("{amount} microsecond", "{amount} microseconds"): 1e-6,
+}
+# texts of `time_delta` without amount, in seconds
+_CONSTANT_SECONDS = {
+    "a moment": 0.0,
+    "a second": 1.0,
+    "a minute": 60.0,
+    "an hour": 3600.0,
+    "a day": 86400.0,
+    "a month": 30.5 * 86400,
+    "a year": 365 * 86400.0,
+    "1 year, 1 month": 395.5 * 86400,
+}
+_AMOUNT = "([0-9]+(?:\\.[0-9]+)?)"
+
+
+def parse_delta(value: str) -> dt.timedelta:
+    """Return the time delta of a text written by `precise_delta`.
+
+    Reads the texts of ``precise_delta`` and ``time_delta`` in the active
+    locale, e.g. ``2 days, 1 hour and 33 seconds`` or ``a minute``. Like
+    them, it counts 365 days in a year and 30.5 days in a month. A phrase is
+    only read as a unit whose plural form for its amount is written so, and
+    units come from the largest to the smallest, which tells apart the units
+    a catalog writes alike, e.g. ``s`` for seconds and milliseconds in
+    ``en_ABBR``. The pattern reading the texts of a locale is built from its
+    catalog on first use.
+
+    Examples:
+        >>> parse_delta("2 days, 1 hour and 33.12 seconds")
+        datetime.timedelta(days=2, seconds=3633, microseconds=120000)
+        >>> parse_delta("an hour")
+        datetime.timedelta(seconds=3600)
+
+    Args:
+        value: time delta in natural language.
+
+    Returns:
+        dt.timedelta: the time delta.
+
+    Raises:
+        ValueError: if `value` is not a time delta of the active locale, or
+            repeats a unit or has a unit after a smaller one.
+
+    """
+    return _parse_delta(i18n.get_translation(), value)
+
+
+def _parse_delta(
+    translation: gettext.NullTranslations, value: str
+) -> dt.timedelta:
+    """Return the time delta of a text translated with `translation`."""
+    pattern, units, constants, separators = _delta_parser(translation)
+    text = value.strip()
+    seconds = 0.0
+    previous = math.inf
+    end = 0
+    for match in pattern.finditer(text):
+        # phrases are only separated by the separators of `precise_delta`
+        if text[end : match.start()] not in (separators if end else ("",)):
+            break
+        # the last group is the text after the amount, or a whole phrase
+        group = match.lastindex or 0
+        if group not in units:
+            # texts of `time_delta` without amount are never combined
+            if end or match.end() != len(text):
+                break
+            return dt.timedelta(seconds=constants[match[group]])
+        message, meanings = units[group][match[group]]
+        counts = _plural_counts(match[group - 1])
+        for singular, plural, offset, unit in meanings:
+            # the unit has to write the amount so, and to be smaller than the
+            # previous one, where an offset of a year comes first
+            if max(offset, unit) < previous and any(
+                translation.ngettext(singular, plural, count) == message
+                for count in counts
+            ):
+                break
+        else:
+            break
+        seconds += offset + float(match[group - 1]) * unit
+        previous = unit
+        end = match.end()
+    else:
+        if end and end == len(text):
+            return dt.timedelta(seconds=seconds)
+    raise ValueError(f"invalid time delta: {value!r}")
+
+
+def _plural_counts(amount: str) -> tuple[int, ...]:
+    """Return the counts `precise_delta` may pick the plural form of `amount` by.
+
+    It counts the amount rounded up above one and down below it. An amount
+    with decimals was rounded when written, so the count of its neighbours
+    within half a last digit can be the one.
+    """
+    integer, _, decimals = amount.partition(".")
+    if not decimals:
+        return (int(integer),)
+    number = float(amount)
+    error = 0.5 * 10.0 ** -len(decimals)
+    return tuple(
+        math.ceil(value) if value > 1 else math.floor(value)
+        for value in (max(number - error, 0.0), number, number + error)
+    )
+
+
+def _alternation(texts: Iterable[str]) -> str:
+    # longest first, so that " days" is not read as " day"
+    return "|".join(
+        re.escape(text) for text in sorted(texts, key=len, reverse=True)
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _delta_parser(
+    translation: gettext.NullTranslations,
+) -> tuple[
+    re.Pattern[str],
+    dict[int, dict[str, tuple[str, list[tuple[str, str, float, float]]]]],
+    dict[str, float],
+    tuple[str, ...],
+]:
+    """Return the pattern reading the time deltas of a catalog.
+
+    Like `_clock_words`, it is built once per catalog, which is its cache
+    key. Phrases with an amount are grouped by their text before it, e.g.
+    ``""`` for ``{amount} days``, so that the pattern matches the amount once
+    and then any of the texts after it, instead of trying every phrase.
+
+    Args:
+        translation: catalog of the texts to read.
+
+    Returns:
+        Tuple with the pattern of the phrases, the message of each text after
+        an amount by group with the messages, offsets and units, in seconds,
+        it can mean, the seconds of the phrases without amount, and the texts
+        between phrases.
+
+    """
+    affixes: dict[str, dict[str, list[tuple[str, str, float, float]]]] = {}
+    for (singular, plural), unit in _UNIT_SECONDS.items():
+        offset = 365 * 86400.0 if singular.startswith("1 year") else 0.0
+        meaning = (singular, plural, offset, unit)
+        # every plural form shows up among the first hundred counts
+        for count in range(100):
+            message = translation.ngettext(singular, plural, count)
+            prefix, _, suffix = message.partition("{amount}")
+            meanings = affixes.setdefault(prefix, {}).setdefault(suffix, [])
+            if meaning not in meanings:
+                meanings.append(meaning)
+    units = {}
+    alternatives = []
+    # longest first, so that "1 year, {amount} days" is tried first
+    for prefix in sorted(affixes, key=len, reverse=True):
+        suffixes = _alternation(affixes[prefix])
+        alternatives.append(f"{re.escape(prefix)}{_AMOUNT}({suffixes})")
+        units[2 * len(alternatives)] = {
+            suffix: (f"{prefix}{{amount}}{suffix}", meanings)
+            for suffix, meanings in affixes[prefix].items()
+        }
+    constants: dict[str, float] = {}
+    for message, seconds in _CONSTANT_SECONDS.items():
+        constants.setdefault(translation.gettext(message), seconds)
+    alternatives.append(f"({_alternation(constants)})")
+    # the text between head and tail of "{head} and {tail}"
+    conjunction = (
+        translation.gettext("{head} and {tail}")
+        .partition("{head}")[2]
+        .partition("{tail}")[0]
+    )
+    separators = (", ", conjunction)
+    # a phrase ends where a separator or the text does, so that " годин" is
+    # not read at the start of " година"
+    ends = "|".join([*map(re.escape, separators), r"\Z"])
+    pattern = re.compile(f"(?:{'|'.join(alternatives)})(?={ends})")
+    return pattern, units, constants, separators
@@ -1,5 +1,7 @@
 """Fixtures for functional tests."""
 
+from collections.abc import Iterator
+
 import pytest
 from pytest_mock import MockerFixture
 
@@ -14,6 +16,14 @@ def activate_en_abbr() -> MockerFixture:
     i18n.deactivate()
 
 
+@pytest.fixture(scope="module")
+def activate_fa_ir() -> Iterator[None]:
+    """Activate Persian."""
+    i18n.activate("fa_IR")
+    yield None
+    i18n.deactivate()
+
+
 @pytest.fixture(scope="module")
 def activate_fr_fr() -> MockerFixture:
     """Activate French."""
@@ -36,3 +46,11 @@ def activate_ru_ru() -> MockerFixture:
     i18n.activate("ru_RU")
     yield None
     i18n.deactivate()
+
+
+@pytest.fixture(scope="module")
+def activate_uk_ua() -> Iterator[None]:
+    """Activate Ukrainian."""
+    i18n.activate("uk_UA")
+    yield None
+    i18n.deactivate()
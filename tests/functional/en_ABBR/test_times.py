@@ -22,3 +22,30 @@ def test_date_time(
     result = human_readable.date_time(test_input)
 
     assert result == expected
+
+
+@pytest.mark.parametrize(
+    "delta",
+    [
+        dt.timedelta(minutes=1, seconds=31, milliseconds=585),
+        dt.timedelta(days=17, hours=3),
+        dt.timedelta(seconds=2, milliseconds=5, microseconds=7),
+        dt.timedelta(days=800, seconds=45),
+    ],
+)
+def test_parse_delta_round_trip(
+    activate_en_abbr: MockerFixture, delta: dt.timedelta
+) -> None:
+    """Seconds, milliseconds and microseconds, all written "s", are read."""
+    text = human_readable.precise_delta(delta, minimum_unit="microseconds")
+
+    assert human_readable.parse_delta(text) == delta
+
+
+def test_parse_delta_ambiguous(activate_en_abbr: MockerFixture) -> None:
+    """Units written alike are told apart by their order."""
+    assert human_readable.parse_delta("91s and 585s") == dt.timedelta(
+        seconds=91, milliseconds=585
+    )
+    with pytest.raises(ValueError, match="invalid time delta"):
+        human_readable.parse_delta("1s, 2s, 3s and 4s")
@@ -0,0 +1 @@
+"""Persian functional tests."""
@@ -0,0 +1,41 @@
+"""Tests for fa_IR time humanizing."""
+
+import datetime as dt
+
+import pytest
+from pytest_mock import MockerFixture
+
+import human_readable.times as times
+
+
+@pytest.mark.parametrize(
+    "delta",
+    [
+        dt.timedelta(minutes=3, seconds=2),
+        dt.timedelta(minutes=1, seconds=31, milliseconds=585),
+        dt.timedelta(hours=2, minutes=1, seconds=1),
+        dt.timedelta(days=17, hours=3),
+    ],
+)
+def test_parse_delta_round_trip(
+    activate_fa_ir: MockerFixture, delta: dt.timedelta
+) -> None:
+    """Minutes and seconds are read back."""
+    text = times.precise_delta(delta, minimum_unit="microseconds")
+
+    assert times.parse_delta(text) == delta
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("34 ثانیه", dt.timedelta(seconds=34)),
+        ("1 دقیقه", dt.timedelta(minutes=1)),
+        ("1 ساعت and 13 ثانیه", dt.timedelta(hours=1, seconds=13)),
+    ],
+)
+def test_parse_delta(
+    activate_fa_ir: MockerFixture, text: str, expected: dt.timedelta
+) -> None:
+    """Seconds are not read as minutes."""
+    assert times.parse_delta(text) == expected
@@ -0,0 +1,24 @@
+"""Tests for fr_FR locale-bound humanizer."""
+
+from human_readable.humanizer import Humanizer
+
+
+def test_int_comma() -> None:
+    """Humanizer uses the thousands separator of its locale."""
+    humanizer = Humanizer("fr_FR")
+
+    assert humanizer.int_comma(10_000_000) == "10 000 000"
+    assert humanizer.int_comma_many([1000, 10]) == ["1 000", "10"]
+
+
+def test_listing_max_items() -> None:
+    """Humanizer translates the remaining count, with its separator."""
+    humanizer = Humanizer("fr_FR")
+
+    assert humanizer.listing(range(2000), ",", "et", max_items=1) == (
+        "0 et 1 999 autres"
+    )
+    assert humanizer.listing(range(2), ",", "et", max_items=1) == (
+        "0 et 1 autre"
+    )
+    assert humanizer.listing(["a", "b"], ",", "et") == "a et b"
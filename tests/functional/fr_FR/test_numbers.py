@@ -1,5 +1,7 @@
 """Tests for fr_FR numbers humanizing."""
 
+from __future__ import annotations
+
 from pytest_mock import MockerFixture
 
 import human_readable.numbers as numbers
@@ -13,3 +15,13 @@ def test_int_comma(activate_fr_fr: MockerFixture) -> None:
     result = numbers.int_comma(number)
 
     assert result == expected
+
+
+def test_int_comma_many(activate_fr_fr: MockerFixture) -> None:
+    """Int comma of many values localization tests."""
+    values: list[str | float] = [10_000_000, "1234567.5"]
+    expected = ["10 000 000", "1 234 567.5"]
+
+    result = numbers.int_comma_many(values)
+
+    assert result == expected
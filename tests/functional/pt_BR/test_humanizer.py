@@ -0,0 +1,31 @@
+"""Tests for pt_BR locale-bound humanizer."""
+
+from __future__ import annotations
+
+import datetime as dt
+
+import human_readable.i18n as i18n
+import human_readable.times as times
+from human_readable.humanizer import Humanizer
+
+
+def test_humanizer_ignores_active_locale() -> None:
+    """Humanizer keeps its locale regardless of the active one."""
+    humanizer = Humanizer("pt_BR")
+
+    assert humanizer.time_delta(dt.timedelta(days=3)) == "3 dias"
+    assert humanizer.ordinal(1) == "1º"
+    assert times.time_delta(dt.timedelta(days=3)) == "3 days"
+
+    try:
+        i18n.activate("ru_RU")
+        assert humanizer.time_delta(dt.timedelta(days=3)) == "3 dias"
+    finally:
+        i18n.deactivate()
+
+
+def test_humanizer_does_not_activate_locale() -> None:
+    """Creating a humanizer does not change the active locale."""
+    Humanizer("pt_BR")
+
+    assert times.time_of_day(10) == "morning"
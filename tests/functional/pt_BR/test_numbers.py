@@ -22,6 +22,11 @@ def test_ordinal(
     assert numbers.ordinal(params) == expected
 
 
+def test_ordinal_many(activate_pt_br: MockerFixture) -> None:
+    """Ordinals use the suffixes of the active locale."""
+    assert numbers.ordinal_many(range(1, 4)) == ["1º", "2º", "3º"]
+
+
 # TODO improve int_comma to localize for more countries and pass this test
 # @pytest.mark.parametrize(
 #     "params, expected",
@@ -8,6 +8,7 @@ import freezegun
 import pytest
 from pytest_mock import MockerFixture
 
+import human_readable.i18n as i18n
 import human_readable.times as times
 
 
@@ -88,6 +89,14 @@ def test_time_delta(
     assert times.time_delta(value) == expected
 
 
+def test_time_delta_cache_per_locale(activate_pt_br: MockerFixture) -> None:
+    """Cached texts of a locale are not returned for another one."""
+    assert times.time_delta(dt.timedelta(days=3)) == "3 dias"
+
+    with i18n.activated(""):
+        assert times.time_delta(dt.timedelta(days=3)) == "3 days"
+
+
 @freezegun.freeze_time("2020-02-02")
 @pytest.mark.parametrize(
     "value, expected",
@@ -252,3 +261,15 @@ def test_precise_delta_custom_format(
         times.precise_delta(value, minimum_unit=min_unit, formatting=fmt)
         == expected
     )
+
+
+def test_parse_delta(activate_pt_br: MockerFixture) -> None:
+    """It reads the texts of the active locale only."""
+    assert times.parse_delta("2 dias, 1 hora e 33 segundos") == dt.timedelta(
+        days=2, seconds=3633
+    )
+    assert times.parse_delta("uma hora") == dt.timedelta(hours=1)
+    with pytest.raises(ValueError):
+        times.parse_delta("2 days, 1 hour and 33 seconds")
+    with i18n.activated(""):
+        assert times.parse_delta("2 days") == dt.timedelta(days=2)
@@ -17,6 +17,16 @@ def test_date_time(activate_ru_ru: MockerFixture) -> None:
     assert result == expected
 
 
+def test_parse_delta(activate_ru_ru: MockerFixture) -> None:
+    """It reads every plural form of the locale."""
+    for seconds in (1, 2, 5, 21, 22, 25, 3600 * 2, 86400 * 5 + 60 * 21):
+        delta = dt.timedelta(seconds=seconds)
+
+        assert times.parse_delta(times.precise_delta(delta)) == delta
+
+    assert times.parse_delta("минуту") == dt.timedelta(minutes=1)
+
+
 def test_precise_delta(activate_ru_ru: MockerFixture) -> None:
     """It returns precise delta."""
     one_min_three_seconds = dt.timedelta(milliseconds=67_000)
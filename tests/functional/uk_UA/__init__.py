@@ -0,0 +1 @@
+"""Ukrainian functional tests."""
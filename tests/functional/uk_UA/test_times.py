@@ -0,0 +1,47 @@
+"""Tests for uk_UA time humanizing."""
+
+import datetime as dt
+
+import pytest
+from pytest_mock import MockerFixture
+
+import human_readable.times as times
+
+
+@pytest.mark.parametrize(
+    "delta",
+    [
+        dt.timedelta(days=17, hours=3),
+        dt.timedelta(days=5, hours=21, minutes=2),
+        dt.timedelta(minutes=1, seconds=31, milliseconds=585),
+        dt.timedelta(days=370, seconds=5),
+    ],
+)
+def test_parse_delta_round_trip(
+    activate_uk_ua: MockerFixture, delta: dt.timedelta
+) -> None:
+    """Days and hours are read back."""
+    text = times.precise_delta(delta, minimum_unit="microseconds")
+
+    assert times.parse_delta(text) == delta
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("12 годин", dt.timedelta(hours=12)),
+        ("5 днів", dt.timedelta(days=5)),
+        ("7 годин i 3 хвилини", dt.timedelta(hours=7, minutes=3)),
+    ],
+)
+def test_parse_delta(
+    activate_uk_ua: MockerFixture, text: str, expected: dt.timedelta
+) -> None:
+    """Hours are not read as days."""
+    assert times.parse_delta(text) == expected
+
+
+def test_parse_delta_out_of_order(activate_uk_ua: MockerFixture) -> None:
+    """A unit after a smaller one is refused."""
+    with pytest.raises(ValueError, match="invalid time delta"):
+        times.parse_delta("3 хвилини i 17 годин")
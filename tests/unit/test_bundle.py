@@ -0,0 +1,128 @@
+"""Tests for the single-file catalog bundle."""
+
+from __future__ import annotations
+
+import gettext
+import os
+import pathlib
+import runpy
+import sys
+
+import pytest
+
+import human_readable.bundle as bundle
+import human_readable.i18n as i18n
+from human_readable._bundle import CATALOGS
+
+
+PATH = i18n._get_default_locale_path()
+assert PATH is not None
+LOCALES = sorted(os.listdir(PATH))
+
+
+def test_up_to_date() -> None:
+    """The bundle matches the catalogs of the locale folder."""
+    with open(bundle._DEFAULT_OUTPUT, encoding="utf-8") as file:
+        assert file.read() == bundle.build(), (
+            "Run `python -m human_readable.bundle` to update the bundle."
+        )
+
+
+@pytest.mark.parametrize("locale", LOCALES)
+def test_same_as_gnu_translations(locale: str) -> None:
+    """Every message is translated like gettext.GNUTranslations does."""
+    gnu = gettext.translation("human_readable", PATH, [locale])
+    bundled = bundle.BundledTranslations(*CATALOGS[locale])
+
+    assert bundled.info() == gnu.info()
+    assert bundled.charset() == gnu.charset()
+    for key in gnu._catalog:  # type: ignore[attr-defined]
+        if isinstance(key, tuple):
+            for n in range(200):
+                assert bundled.ngettext(key[0], "plural", n) == gnu.ngettext(
+                    key[0], "plural", n
+                )
+        else:
+            assert bundled.gettext(key) == gnu.gettext(key)
+
+
+def test_install(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Installed catalogs are used by activate."""
+    monkeypatch.setattr(i18n, "_TRANSLATIONS", dict(i18n._TRANSLATIONS))
+
+    locales = bundle.install()
+
+    assert locales == LOCALES
+    try:
+        translation = i18n.activate("ru_RU")
+        assert isinstance(translation, bundle.BundledTranslations)
+        assert i18n.ngettext("{amount} day", "{amount} days", 3) == (
+            "{amount} дня"
+        )
+    finally:
+        i18n.deactivate()
+
+
+def test_plural_expression_default() -> None:
+    """Catalogs without plural forms use the germanic plural."""
+    assert bundle._plural_expression({}) == "n != 1"
+
+
+@pytest.mark.parametrize(
+    "plural",
+    [
+        "(n != 1)",
+        "n>1",
+        "0",
+        "n%10==1 && n%100!=11 ? 0 : n%10>=2 && n%10<=4 && (n%100<10 || n%100>=20) ? 1 : 2",
+        "n==1 ? 0 : n==2 ? 1 : (n>2 && n<11) ? 2 : 3",
+        "!(n/10) ? n*2 - 1 : n + 1",
+        "0 < n < 5",
+    ],
+)
+def test_plural_expression(plural: str) -> None:
+    """Plural forms are evaluated like gettext does."""
+    expression = bundle._plural_expression(
+        {"plural-forms": f"nplurals=4; plural={plural};"}
+    )
+
+    function = eval(f"lambda n: int({expression})")  # noqa: S307
+    expected = gettext.c2py(plural)
+    assert [function(n) for n in range(200)] == [
+        expected(n) for n in range(200)
+    ]
+
+
+@pytest.mark.parametrize(
+    "plural", ["n ** 2", "(n == 1", "n ? 1", "n == 1 2", "n >", "x"]
+)
+def test_plural_expression_invalid(plural: str) -> None:
+    """Invalid plural forms raise ValueError."""
+    with pytest.raises(ValueError, match="invalid plural forms"):
+        bundle._plural_expression(
+            {"plural-forms": f"nplurals=2; plural={plural};"}
+        )
+
+
+def test_build_without_path(monkeypatch: pytest.MonkeyPatch) -> None:
+    """It raises ValueError when the locale folder is unknown."""
+    monkeypatch.setattr(i18n, "_get_default_locale_path", lambda: None)
+
+    with pytest.raises(ValueError, match="pass the path explicitly"):
+        bundle.build()
+
+
+def test_main(tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """The command line writes the bundle."""
+    output = tmp_path / "bundle.py"
+    monkeypatch.setattr(
+        sys, "argv", ["bundle", "--path", str(PATH), "--output", str(output)]
+    )
+    # run a fresh copy of the module, as `python -m` does
+    monkeypatch.delitem(sys.modules, "human_readable.bundle")
+
+    with pytest.raises(SystemExit) as excinfo:
+        runpy.run_module("human_readable.bundle", run_name="__main__")
+
+    assert excinfo.value.code == 0
+    assert output.read_text(encoding="utf-8") == bundle.build()
@@ -0,0 +1,208 @@
+"""Tests for memory-mapped translation catalogs."""
+
+from __future__ import annotations
+
+import gettext
+import os
+import pathlib
+import struct
+
+import pytest
+
+import human_readable.i18n as i18n
+from human_readable.catalogs import MappedTranslations
+
+
+PATH = i18n._get_default_locale_path()
+assert PATH is not None
+LOCALES = sorted(os.listdir(PATH))
+HEADER = (
+    "Project-Id-Version: test\n"
+    "#-#-#-#-#  merged  #-#-#-#-#\n"
+    "Content-Type: text/plain; charset=UTF-8\n"
+    "Plural-Forms: nplurals=3; plural=(n==1 ? 0 : n==2 ? 1 : 2);\n"
+    "X-Note: first line\n"
+    " second line\n"
+)
+
+
+def _write_mo(
+    path: pathlib.Path,
+    messages: dict[str, str],
+    order: str = "<",
+    version: int = 0,
+) -> pathlib.Path:
+    """Write a .mo file of `messages`, sorted like msgfmt does."""
+    keys = sorted(messages, key=lambda key: key.encode())
+    originals = [key.encode() for key in keys]
+    translations = [messages[key].encode() for key in keys]
+    start = 28 + 16 * len(keys)
+    tables = b""
+    data = b""
+    for strings in (originals, translations):
+        for string in strings:
+            tables += struct.pack(f"{order}II", len(string), start + len(data))
+            data += string + b"\x00"
+    # the translation table follows the original one, without hash table
+    header = struct.pack(
+        f"{order}7I",
+        gettext.GNUTranslations.LE_MAGIC,
+        version,
+        len(keys),
+        28,
+        28 + 8 * len(keys),
+        0,
+        0,
+    )
+    path.write_bytes(header + tables + data)
+    return path
+
+
+def _open(path: pathlib.Path) -> MappedTranslations:
+    with open(path, "rb") as file:
+        return MappedTranslations(file)
+
+
+@pytest.mark.parametrize("locale", LOCALES)
+def test_same_as_gnu_translations(locale: str) -> None:
+    """Every message is translated like gettext.GNUTranslations does."""
+    gnu = gettext.translation("human_readable", PATH, [locale])
+    mapped = gettext.translation(
+        "human_readable", PATH, [locale], MappedTranslations
+    )
+
+    assert isinstance(mapped, MappedTranslations)
+    assert mapped.info() == gnu.info()
+    assert mapped.charset() == gnu.charset()
+    for key in gnu._catalog:  # type: ignore[attr-defined]
+        if isinstance(key, tuple):
+            message = key[0]
+            assert mapped.gettext(message) == gnu.gettext(message)
+            for n in range(25):
+                assert mapped.ngettext(message, "plural", n) == gnu.ngettext(
+                    message, "plural", n
+                )
+        elif "\x04" in key:
+            context, message = key.split("\x04")
+            assert mapped.pgettext(context, message) == gnu.pgettext(
+                context, message
+            )
+        else:
+            assert mapped.gettext(key) == gnu.gettext(key)
+            assert mapped.ngettext(key, "plural", 1) == gnu.ngettext(
+                key, "plural", 1
+            )
+
+
+def test_lookups(tmp_path: pathlib.Path) -> None:
+    """Plural forms, contexts and missing messages."""
+    mapped = _open(
+        _write_mo(
+            tmp_path / "test.mo",
+            {
+                "": HEADER,
+                "hello": "olá",
+                "{n} day\x00{n} days": "{n} dia\x00{n} dias\x00{n} muitos",
+                "two\x00twos": "dois",
+                "month\x04May": "maio",
+                "verb\x04may\x00mays": "pode\x00podem\x00podem muito",
+            },
+        )
+    )
+
+    assert mapped.info()["x-note"] == "first line\nsecond line"
+    assert mapped.gettext("hello") == "olá"
+    assert mapped.gettext("{n} day") == "{n} dia"
+    assert mapped.gettext("missing") == "missing"
+    assert mapped.gettext("ação") == "ação"
+    assert mapped.ngettext("{n} day", "{n} days", 2) == "{n} dias"
+    assert mapped.ngettext("{n} day", "{n} days", 7) == "{n} muitos"
+    assert mapped.ngettext("two", "twos", 2) == "twos"
+    assert mapped.ngettext("hello", "hellos", 2) == "hellos"
+    assert mapped.ngettext("zzz", "zzzs", 1) == "zzz"
+    assert mapped.pgettext("month", "May") == "maio"
+    assert mapped.pgettext("month", "June") == "June"
+    assert mapped.npgettext("verb", "may", "mays", 2) == "podem"
+    assert mapped.npgettext("verb", "can", "cans", 1) == "can"
+    assert mapped.npgettext("verb", "can", "cans", 2) == "cans"
+
+
+def test_fallback(tmp_path: pathlib.Path) -> None:
+    """Missing messages are looked up in the fallback."""
+    mapped = _open(_write_mo(tmp_path / "test.mo", {"hello": "ola"}))
+    fallback = _open(
+        _write_mo(
+            tmp_path / "fallback.mo",
+            {
+                "": HEADER,
+                "bye": "tchau",
+                "{n} day\x00{n} days": "{n} dia\x00{n} dias\x00{n} muitos",
+                "month\x04May": "maio",
+                "verb\x04may\x00mays": "pode\x00podem\x00podem muito",
+            },
+        )
+    )
+    mapped.add_fallback(fallback)
+
+    assert mapped.gettext("hello") == "ola"
+    assert mapped.gettext("bye") == "tchau"
+    assert mapped.gettext("ação") == "ação"
+    assert mapped.ngettext("{n} day", "{n} days", 2) == "{n} dias"
+    assert mapped.pgettext("month", "May") == "maio"
+    assert mapped.npgettext("verb", "may", "mays", 2) == "podem"
+
+
+def test_big_endian(tmp_path: pathlib.Path) -> None:
+    """Files written on big endian machines are read too."""
+    path = tmp_path / "test.mo"
+    _write_mo(path, {"": HEADER, "hello": "olá"}, order=">")
+    data = path.read_bytes()
+    path.write_bytes(
+        struct.pack(">I", gettext.GNUTranslations.LE_MAGIC) + data[4:]
+    )
+
+    assert _open(path).gettext("hello") == "olá"
+
+
+def test_bad_magic(tmp_path: pathlib.Path) -> None:
+    """It raises OSError for files that are not catalogs."""
+    path = tmp_path / "test.mo"
+    path.write_bytes(b"\x00" * 28)
+
+    with pytest.raises(OSError, match="Bad magic number"):
+        _open(path)
+
+
+def test_bad_version(tmp_path: pathlib.Path) -> None:
+    """It raises OSError for unknown major versions."""
+    path = _write_mo(tmp_path / "test.mo", {"hello": "olá"}, version=2 << 16)
+
+    with pytest.raises(OSError, match="Bad version number 2"):
+        _open(path)
+
+
+def test_lookups_cached(tmp_path: pathlib.Path) -> None:
+    """Messages are decoded once."""
+    mapped = _open(_write_mo(tmp_path / "test.mo", {"hello": "ola"}))
+
+    mapped.gettext("hello")
+    mapped.gettext("hello")
+
+    info = mapped._lookup.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+
+
+def test_load(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Loading with a class replaces catalogs of another class."""
+    monkeypatch.setattr(i18n, "_TRANSLATIONS", dict(i18n._TRANSLATIONS))
+    gnu = i18n.load("pt_BR")
+
+    mapped = i18n.load("pt_BR", class_=MappedTranslations)
+
+    assert not isinstance(gnu, MappedTranslations)
+    assert isinstance(mapped, MappedTranslations)
+    assert i18n.load("pt_BR") is mapped
+    assert i18n.load("pt_BR", class_=MappedTranslations) is mapped
+    with i18n.activated("pt_BR", class_=MappedTranslations) as translation:
+        assert translation is mapped
+        assert i18n.gettext("today") == "hoje"
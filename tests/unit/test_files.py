@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import array
+
 import pytest
 
 from human_readable import files
@@ -99,3 +101,143 @@ def test_file_size_formatted(
 ) -> None:
     """File size with formatting."""
     assert files.file_size(*params) == expected
+
+
+SIZES = [
+    0,
+    1,
+    300,
+    999,
+    1000,
+    1023,
+    1024,
+    2900000,
+    2000000000,
+    10**18,
+    2**63 - 1,
+]
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        (False, False, ".1f", ""),  # decimal
+        (True, False, ".1f", ""),  # binary
+        (False, True, ".1f", ""),  # gnu
+        (True, False, ".3f", ".1f"),  # formatted
+    ],
+)
+def test_file_size_many(params: tuple[bool, bool, str, str]) -> None:
+    """File size of many values matches file size of each value."""
+    expected = [files.file_size(size, *params) for size in SIZES]
+
+    assert files.file_size_many(SIZES, *params) == expected
+    assert files.file_size_many(iter(SIZES), *params) == expected
+    assert files.file_size_many(array.array("q", SIZES), *params) == expected
+
+
+def test_file_size_many_giant() -> None:
+    """File size of many values beyond the last unit."""
+    assert files.file_size_many([10**26 * 30], gnu=True) == ["2481.5Y"]
+
+
+@pytest.mark.parametrize("dtype", ["int64", "uint64", "int32"])
+def test_file_size_many_numpy(dtype: str) -> None:
+    """File size of many values from a NumPy array."""
+    numpy = pytest.importorskip("numpy")
+    sizes = (
+        [size for size in SIZES if size < 2**31] if dtype == "int32" else SIZES
+    )
+    expected = [files.file_size(size, binary=True) for size in sizes]
+
+    result = files.file_size_many(numpy.array(sizes, dtype=dtype), binary=True)
+
+    assert result == expected
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("1 Byte", 1),  # file_size formats
+        ("300 Bytes", 300),
+        ("2.9 MB", 2900000),
+        ("2.8 MiB", 2936013),
+        ("2.8M", 2936013),
+        ("300B", 300),
+        ("1.2GiB", 1288490189),  # variants
+        ("340k", 348160),
+        ("10Ki", 10240),
+        ("12 bytes", 12),
+        (" 5.5 kb\n", 5500),
+        (".5KB", 500),
+        ("7", 7),
+        ("1e3", 1000),
+        ("2EB", 2 * 10**18),
+        ("-5 Bytes", -5),
+        ("9" * 30 + " YB", int("9" * 30) * 10**24),  # large integers
+        ("2.3 EB", 23 * 10**17),  # fractions of large units, exactly
+        ("1.5 ZB", 15 * 10**20),
+        ("0.001 YiB", 1208925819614629174706),
+        ("1.2e3 YB", 12 * 10**26),
+        ("2.5", 2),  # half to even
+        ("3.5 Bytes", 4),
+        ("-0.0005 KB", 0),
+        ("1e-400 YB", 0),
+        ("0e999999999", 0),
+    ],
+)
+def test_parse_file_size(value: str, expected: int) -> None:
+    """Sizes written by file_size and by people are parsed."""
+    assert files.parse_file_size(value) == expected
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "",
+        "KB",
+        ".",
+        "1.2.3",
+        "1 XB",
+        "1 iB",
+        "1 K B",
+        "1,000",
+        "١٢",
+        "1e400 KB",
+        "-1.5e999999999",
+    ],
+)
+def test_parse_file_size_invalid(value: str) -> None:
+    """It raises ValueError for anything else."""
+    with pytest.raises(ValueError, match="invalid file size"):
+        files.parse_file_size(value)
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        (False, False, ".1f", ""),  # decimal
+        (True, False, ".1f", ""),  # binary
+        (False, True, ".1f", ""),  # gnu
+        (True, False, ".3f", ".1f"),  # formatted
+    ],
+)
+def test_parse_file_size_round_trip(
+    params: tuple[bool, bool, str, str],
+) -> None:
+    """Sizes are read back within the precision they were written with."""
+    for size in SIZES:
+        parsed = files.parse_file_size(files.file_size(size, *params))
+
+        assert parsed == pytest.approx(size, rel=0.05)
+
+
+def test_parse_file_size_many() -> None:
+    """Parsing many values matches parsing each value."""
+    values = [files.file_size(size, binary=True) for size in SIZES]
+
+    assert files.parse_file_size_many(values) == [
+        files.parse_file_size(value) for value in values
+    ]
+    with pytest.raises(ValueError, match="'nope'"):
+        files.parse_file_size_many(["1 KB", "nope"])
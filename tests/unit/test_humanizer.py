@@ -0,0 +1,63 @@
+"""Tests for locale-bound humanizer."""
+
+from __future__ import annotations
+
+import datetime as dt
+from typing import Any
+
+import pytest
+
+import human_readable
+from human_readable.humanizer import Humanizer
+
+
+TODAY = dt.date.today()
+
+
+@pytest.mark.parametrize(
+    "name, args",
+    [
+        ("file_size", (2900000,)),
+        ("file_size_many", ([1, 2900000],)),
+        ("parse_file_size", ("2.8 MiB",)),
+        ("parse_file_size_many", (["1 Byte", "2.8M"],)),
+        ("listing", (["a", "b", "c"], ",", "and")),
+        ("fractional", (1.3,)),
+        ("fractional_many", ([1.3, 0.5],)),
+        ("scientific_notation", (500,)),
+        ("scientific_notation_many", ([500, 0.3],)),
+        ("ordinal", (13,)),
+        ("ordinal_many", (range(1, 4),)),
+        ("int_comma", (1234567,)),
+        ("int_comma_many", ([1234, "1234567.5"],)),
+        ("int_word", (1200000,)),
+        ("int_word_many", ([1200000, 10**34],)),
+        ("ap_number", (7,)),
+        ("time_of_day", (17,)),
+        ("timing", (dt.time(21, 40),)),
+        ("time_delta", (dt.timedelta(days=65),)),
+        ("time_delta_many", ([dt.timedelta(days=65), 30],)),
+        ("date_time", (dt.timedelta(minutes=3),)),
+        (
+            "date_time_and_next_change",
+            (
+                dt.datetime(2020, 2, 2),
+                False,
+                "seconds",
+                dt.datetime(2020, 3, 2),
+            ),
+        ),
+        ("day", (TODAY,)),
+        ("date", (TODAY - dt.timedelta(days=400),)),
+        ("year", (TODAY,)),
+        ("precise_delta", (dt.timedelta(days=2, seconds=3633),)),
+        ("parse_delta", ("2 days, 1 hour and 33 seconds",)),
+    ],
+)
+def test_humanizer_matches_functions(name: str, args: tuple[Any, ...]) -> None:
+    """Humanizer without locale gives the same results as functions."""
+    humanizer = Humanizer()
+
+    assert getattr(humanizer, name)(*args) == getattr(human_readable, name)(
+        *args
+    )
@@ -1,9 +1,15 @@
 """Tests for i18n."""
 
+import asyncio
+import datetime as dt
+import os
+
 import pytest
+from pytest_mock import MockerFixture
 
 import human_readable.i18n as i18n
 import human_readable.numbers as numbers
+import human_readable.times as times
 
 
 DOMAIN_NAME = "human_readable"
@@ -44,6 +50,114 @@ def test_int_comma_activate_deactivate() -> None:
         assert numbers.int_comma(number) == "10,000,000"
 
 
+def test_load_does_not_activate() -> None:
+    """Loading a locale returns its translations without activating it."""
+    translation = i18n.load("ru_RU")
+
+    assert translation is i18n.activate("ru_RU")
+    i18n.deactivate()
+    assert i18n.load("") is i18n.get_translation()
+    assert numbers.ordinal(5) == "5th"
+
+
+def test_translation_functions() -> None:
+    """Translations of the active locale."""
+    assert i18n.gettext("today") == "today"
+    assert i18n.pgettext("1", "st") == "st"
+    assert i18n.ngettext("{amount} day", "{amount} days", 2) == "{amount} days"
+
+    try:
+        i18n.activate("pt_BR")
+        assert i18n.gettext("today") == "hoje"
+        assert i18n.pgettext("1", "st") == "º"
+        assert (
+            i18n.ngettext("{amount} day", "{amount} days", 2) == "{amount} dias"
+        )
+    finally:
+        i18n.deactivate()
+
+
+def test_activated_scope() -> None:
+    """Locale is active only inside the scope and scopes nest."""
+    with i18n.activated("pt_BR") as translation:
+        assert translation is i18n.get_translation()
+        assert numbers.ordinal(1) == "1º"
+        with i18n.activated("ru_RU"):
+            assert numbers.ordinal(5) == "5ый"
+        assert numbers.ordinal(1) == "1º"
+    assert numbers.ordinal(1) == "1st"
+
+
+def test_activated_takes_precedence() -> None:
+    """Scoped locale wins over the thread locale."""
+    try:
+        i18n.activate("ru_RU")
+        with i18n.activated("fr_FR"):
+            assert numbers.int_comma(1000) == "1 000"
+            assert numbers.ordinal(5) == "5th"
+        assert numbers.ordinal(5) == "5ый"
+    finally:
+        i18n.deactivate()
+
+
+def test_activated_concurrent_tasks() -> None:
+    """Concurrent asyncio tasks keep their own locale."""
+
+    async def humanize(locale: str) -> list[str]:
+        results = []
+        with i18n.activated(locale):
+            for _ in range(3):
+                results.append(numbers.ordinal(1))
+                await asyncio.sleep(0)
+        return results
+
+    async def main() -> list[list[str]]:
+        return list(await asyncio.gather(humanize("pt_BR"), humanize("")))
+
+    assert asyncio.run(main()) == [["1º"] * 3, ["1st"] * 3]
+
+
+def test_preload_locales(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Catalogs, their clock words and ordinal suffixes are loaded."""
+    monkeypatch.setattr(i18n, "_TRANSLATIONS", dict(i18n._TRANSLATIONS))
+    times._clock_words.cache_clear()
+    numbers._ordinal_suffixes.cache_clear()
+
+    locales = i18n.preload_locales(["pt_BR", "ru_RU"])
+
+    assert locales == ["pt_BR", "ru_RU"]
+    assert {"pt_BR", "ru_RU"} <= i18n._TRANSLATIONS.keys()
+    assert times._clock_words.cache_info().currsize == 3
+    assert numbers._ordinal_suffixes.cache_info().currsize == 3
+    with i18n.activated("pt_BR"):
+        times.timing(dt.time(1, 5))
+        numbers.ordinal(1)
+    assert times._clock_words.cache_info().hits == 1
+    assert numbers._ordinal_suffixes.cache_info().hits == 1
+
+
+def test_preload_all_locales(mocker: MockerFixture) -> None:
+    """All locales are loaded, and the garbage collector frozen."""
+    path = i18n._get_default_locale_path()
+    assert path is not None
+    freeze = mocker.patch("gc.freeze")
+
+    locales = i18n.preload_locales(freeze=True)
+
+    assert locales == sorted(os.listdir(path))
+    assert set(locales) <= i18n._TRANSLATIONS.keys()
+    freeze.assert_called_once_with()
+
+
+def test_preload_locales_without_path(monkeypatch: pytest.MonkeyPatch) -> None:
+    """It raises an Exception when the locale folder is unknown."""
+    monkeypatch.setattr(i18n, "__file__", "")
+
+    with pytest.raises(Exception) as excinfo:
+        i18n.preload_locales()
+    assert str(excinfo.value) == EXPECTED_MSG
+
+
 def test_default_locale_path_defined__file__() -> None:
     """Test _get_default_locale_path."""
     assert i18n._get_default_locale_path() is not None
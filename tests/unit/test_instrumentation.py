@@ -0,0 +1,185 @@
+"""Tests for opt-in instrumentation."""
+
+from __future__ import annotations
+
+import datetime as dt
+from collections.abc import Iterator
+
+import pytest
+
+import human_readable
+import human_readable.i18n as i18n
+import human_readable.numbers as numbers
+import human_readable.times as times
+from human_readable import instrumentation
+
+
+@pytest.fixture(autouse=True)
+def _restore() -> Iterator[None]:
+    """Leave instrumentation disabled and empty after each test."""
+    yield
+    instrumentation.disable()
+    instrumentation.reset()
+
+
+def test_disabled_by_default() -> None:
+    """Functions are the original ones until enabled."""
+    original = numbers.int_comma
+
+    human_readable.int_comma(1000)
+
+    assert human_readable.int_comma is original
+    assert instrumentation.snapshot()["functions"] == {}
+
+
+def test_calls() -> None:
+    """Calls are counted and timed per function."""
+    original = numbers.int_comma
+    instrumentation.enable()
+
+    for value in range(10):
+        human_readable.int_comma(value)
+    numbers.int_word(1000)
+
+    stats = instrumentation.snapshot()["functions"]
+    assert set(stats) == {"int_comma", "int_word"}
+    assert stats["int_comma"]["calls"] == 10
+    assert stats["int_word"]["calls"] == 1
+    assert stats["int_comma"]["total"] == pytest.approx(
+        stats["int_comma"]["mean"] * 10
+    )
+    assert (
+        0
+        <= stats["int_comma"]["p50"]
+        <= stats["int_comma"]["p90"]
+        <= stats["int_comma"]["p99"]
+    )
+    assert human_readable.int_comma.__wrapped__ is original  # type: ignore[attr-defined]
+
+    instrumentation.disable()
+
+    assert human_readable.int_comma is original
+    assert numbers.int_comma is original
+    human_readable.int_comma(1)
+    assert instrumentation.snapshot()["functions"]["int_comma"]["calls"] == 10
+
+
+def test_failed_calls() -> None:
+    """Calls raising an exception are counted too."""
+    instrumentation.enable()
+
+    with pytest.raises(KeyError):
+        human_readable.time_delta(dt.timedelta(1), minimum_unit="decades")
+
+    functions = instrumentation.snapshot()["functions"]
+    assert functions["time_delta"]["calls"] == 1
+
+
+def test_samples() -> None:
+    """Percentiles are computed from the most recent durations."""
+    instrumentation.enable(samples=2)
+
+    for value in range(5):
+        human_readable.int_comma(value)
+
+    assert len(instrumentation._STATS["int_comma"].durations) == 2
+    assert instrumentation.snapshot()["functions"]["int_comma"]["calls"] == 5
+
+
+def test_callback() -> None:
+    """The callback receives the name and duration of every call."""
+    calls: list[tuple[str, float]] = []
+    instrumentation.enable(lambda name, elapsed: calls.append((name, elapsed)))
+
+    human_readable.ordinal(3)
+
+    assert [name for name, _ in calls] == ["ordinal"]
+    assert calls[0][1] >= 0
+
+
+def test_lookups() -> None:
+    """Catalog lookups are counted per locale and method."""
+    instrumentation.enable()
+
+    assert i18n.gettext("today") == "today"
+    assert i18n.pgettext("0 (male)", "th") == "th"
+    assert i18n.ngettext("day", "days", 2) == "days"
+
+    assert instrumentation.snapshot()["lookups"] == {
+        "": {"gettext": 1, "pgettext": 1, "ngettext": 1}
+    }
+    assert isinstance(
+        i18n.get_translation(), instrumentation._CountingTranslations
+    )
+    assert i18n.get_translation() is i18n.get_translation()
+
+    instrumentation.disable()
+
+    assert not isinstance(
+        i18n.get_translation(), instrumentation._CountingTranslations
+    )
+
+
+def test_npgettext_lookups() -> None:
+    """Lookups of plural messages with context are counted."""
+    translation = instrumentation._CountingTranslations(
+        i18n.get_translation(), ""
+    )
+
+    assert translation.npgettext("context", "day", "days", 1) == "day"
+    assert instrumentation.snapshot()["lookups"] == {"": {"npgettext": 1}}
+
+
+def test_caches() -> None:
+    """Statistics of the internal caches are reported."""
+    times.time_delta_cache_clear()
+
+    human_readable.time_delta(dt.timedelta(seconds=3))
+    human_readable.time_delta(dt.timedelta(seconds=3))
+
+    caches = instrumentation.snapshot()["caches"]
+    assert caches["human_readable.times._bucket_text"]["hits"] == 1
+    assert caches["human_readable.times._bucket_text"]["misses"] == 1
+
+
+def test_reset() -> None:
+    """Reset forgets what was recorded."""
+    instrumentation.enable()
+    human_readable.int_comma(1)
+    i18n.gettext("today")
+
+    instrumentation.reset()
+
+    snapshot = instrumentation.snapshot()
+    assert snapshot["functions"] == {}
+    assert snapshot["lookups"] == {}
+
+
+def test_enable_twice() -> None:
+    """Enabling again only changes the settings."""
+    original = numbers.int_comma
+    instrumentation.enable()
+    instrumentation.enable(samples=1)
+
+    human_readable.int_comma(1)
+
+    assert human_readable.int_comma.__wrapped__ is original  # type: ignore[attr-defined]
+    assert instrumentation.snapshot()["functions"]["int_comma"]["calls"] == 1
+
+
+def test_enable_disable_enable() -> None:
+    """Catalog caches do not keep the counting catalogs of a past run."""
+    instrumentation.enable()
+    human_readable.ordinal(3)
+    instrumentation.disable()
+
+    assert numbers._ordinal_suffixes.cache_info().currsize == 0
+    assert human_readable.ordinal(3) == "3rd"
+    assert instrumentation._TRANSLATIONS == {}
+
+    instrumentation.enable()
+    human_readable.ordinal(3)
+
+    assert len(instrumentation._TRANSLATIONS) == 1
+    assert numbers._ordinal_suffixes.cache_info().currsize == 1
+    assert instrumentation.snapshot()["functions"]["ordinal"]["calls"] == 2
@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+import io
+from collections.abc import Iterable
+from typing import Any
+
 import pytest
 
 import human_readable.lists as lists
@@ -57,3 +61,92 @@ def test_listing_with_conjunction_oxford(
 ) -> None:
     """Listing with separator and conjunction."""
     assert lists.listing(*params, oxford=True) == expected
+
+
+def test_listing_iterable() -> None:
+    """Listing accepts any iterable."""
+    items = (name for name in ["jorbas", "maria", "gustavo"])
+
+    assert lists.listing(items, ",", "and") == "jorbas, maria and gustavo"
+
+
+@pytest.mark.parametrize(
+    "params, expected",
+    [
+        (([], ","), ""),  # empty list
+        ((["jorbas"], ",", "or"), "jorbas"),  # one element
+        ((["jorbas", "maria", "gustavo"], ","), "jorbas, maria, gustavo"),
+        ((["jorbas", "maria"], ";", "or", True), "jorbas or maria"),
+        (
+            (["jorbas", "maria", "gustavo"], ";", "or"),
+            "jorbas; maria or gustavo",
+        ),  # conjunction
+        (
+            (["jorbas", "maria", "gustavo"], ";", "or", True),
+            "jorbas; maria; or gustavo",
+        ),  # oxford
+    ],
+)
+def test_write_listing(params: tuple[Any, ...], expected: str) -> None:
+    """Streamed listing matches listing."""
+    items, *args = params
+    out = io.StringIO()
+
+    lists.write_listing(iter(items), out, *args)
+
+    assert out.getvalue() == expected == lists.listing(items, *args)
+
+
+@pytest.mark.parametrize(
+    "params, expected",
+    [
+        ((["a", "b", "c"], ",", "and", False, 3), "a, b and c"),  # all shown
+        ((["a", "b", "c", "d"], ",", "and", False, 3), "a, b, c and 1 more"),
+        ((list(range(10_000)), ",", "and", False, 3), "0, 1, 2 and 9,997 more"),
+        ((list(range(5)), ",", "and", True, 2), "0, 1, and 3 more"),
+        ((list(range(5)), ";", None, False, 1), "0; 4 more"),
+        ((list(range(5)), ",", "and", False, 0), "5 more"),
+    ],
+)
+def test_listing_max_items(params: tuple[Any, ...], expected: str) -> None:
+    """Listing shows at most max items."""
+    items, separator, conjunction, oxford, max_items = params
+
+    assert (
+        lists.listing(items, separator, conjunction, oxford, max_items)
+        == expected
+    )
+    assert (
+        lists.listing(iter(items), separator, conjunction, oxford, max_items)
+        == expected
+    )
+
+
+@pytest.mark.parametrize("items", [list(range(5)), iter(range(5))])
+def test_listing_negative_max_items(items: Iterable[int]) -> None:
+    """It raises ValueError for sequences and other iterables alike."""
+    with pytest.raises(ValueError, match="must not be negative"):
+        lists.listing(items, ",", max_items=-1)
+
+
+class Item:
+    """Item that counts how many times it is converted to string."""
+
+    converted = 0
+
+    def __str__(self) -> str:
+        """Count conversion."""
+        Item.converted += 1
+        return "item"
+
+
+def test_listing_max_items_stringifies_shown_only() -> None:
+    """Listing with max items converts only shown items to string."""
+    Item.converted = 0
+
+    result = lists.listing(
+        (Item() for _ in range(1000)), ",", "and", max_items=2
+    )
+
+    assert result == "item, item and 998 more"
+    assert Item.converted == 2
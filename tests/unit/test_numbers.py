@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+from decimal import Decimal
+from fractions import Fraction
+from random import Random
+
 import pytest
 
 import human_readable.numbers as numbers
@@ -21,6 +25,25 @@ def test_ordinal(params: int, expected: str) -> None:
     assert numbers.ordinal(params) == expected
 
 
+def test_ordinal_many() -> None:
+    """Ordinals of many numbers."""
+    values = [*range(-120, 120), "1", "13", 111]
+
+    assert numbers.ordinal_many(values) == [
+        numbers.ordinal(value) for value in values
+    ]
+    assert numbers.ordinal_many(range(1, 5)) == ["1st", "2nd", "3rd", "4th"]
+
+
+def test_ordinal_many_numpy() -> None:
+    """Ordinals of NumPy arrays."""
+    numpy = pytest.importorskip("numpy")
+
+    result = numbers.ordinal_many(numpy.arange(10, 14))
+
+    assert result == ["10th", "11th", "12th", "13th"]
+
+
 @pytest.mark.parametrize(
     "params, expected",
     [
@@ -28,6 +51,13 @@ def test_ordinal(params: int, expected: str) -> None:
         (1000, "1,000"),  # number with comma
         (1000000, "1,000,000"),  # number with two commas
         (1234567.1234567, "1,234,567.1234567"),  # number with commas and dot
+        (-1234567, "-1,234,567"),  # negative number
+        ("00012345", "00,012,345"),  # string with leading zeros
+        ("-1234.5", "-1,234.5"),  # negative string with dot
+        ("1,234", "1,234"),  # string already with commas
+        (Decimal("1234567.890"), "1,234,567.890"),  # decimal
+        (1e20, "1e+20"),  # float in exponent notation
+        (float("inf"), "inf"),  # float infinity
     ],
 )
 def test_int_comma(params: int, expected: str) -> None:
@@ -35,6 +65,21 @@ def test_int_comma(params: int, expected: str) -> None:
     assert numbers.int_comma(params) == expected
 
 
+def test_int_comma_many() -> None:
+    """Int comma of many values."""
+    values: list[str | float | Decimal] = [
+        100,
+        1000,
+        -1234567,
+        "1234.5",
+        Decimal("1000000"),
+    ]
+
+    result = numbers.int_comma_many(values)
+
+    assert result == ["100", "1,000", "-1,234,567", "1,234.5", "1,000,000"]
+
+
 @pytest.mark.parametrize(
     "params, expected",
     [
@@ -59,6 +104,60 @@ def test_int_word_formatted() -> None:
     assert numbers.int_word(1230000, "0.2f") == expected
 
 
+@pytest.mark.parametrize(
+    "value, formatting, expected",
+    [
+        (999_950_000, ".1f", "1.0 billion"),  # half rounded to even
+        (999_949_999, ".1f", "999.9 million"),
+        (999_500_000, ".0f", "1 billion"),
+        (1_000_000_000, ".3g", "1 billion"),
+        (999_999_999, ".2e", "1.00e+0 billion"),
+        (1000 * 10**33, ".1f", "0.0 googol"),  # rounded up past decillion
+        (1001 * 10**33, ".1f", "1001.0 decillion"),
+        (10**33 + 1, ".33f", "1.000000000000000000000000000000001 decillion"),
+        (7**50, ".20f", "1798465042.64741214662028034057 decillion"),
+    ],
+)
+def test_int_word_exact(value: int, formatting: str, expected: str) -> None:
+    """Exact mode divides integers without float rounding."""
+    assert numbers.int_word(value, formatting, exact=True) == expected
+
+
+@pytest.mark.parametrize(
+    "value", [999_950_000, 999_949_999, 123_455_913, 1000 * 10**33, 10**40]
+)
+@pytest.mark.parametrize("formatting", [".1f", ".0f", ".3g", ".2e"])
+def test_int_word_rounding(value: int, formatting: str) -> None:
+    """Values shown as 1000 of a unit move to the next unit, as before."""
+    for number in (value - 1, value, value + 1, float(value)):
+        result = numbers.int_word(number, formatting)
+        chopped = result.split()[0]
+        assert float(chopped) != 1000 or result.endswith("googol")
+
+
+def test_int_word_many() -> None:
+    """Int word of many numbers."""
+    values = [100, 1200000, 999999999, 10**101, 10**33 + 1]
+
+    assert numbers.int_word_many(values) == [
+        numbers.int_word(value) for value in values
+    ]
+    assert numbers.int_word_many(iter(values), ".33f", exact=True)[-1] == (
+        "1.000000000000000000000000000000001 decillion"
+    )
+
+
+def test_int_word_many_numpy() -> None:
+    """Int word of NumPy arrays."""
+    numpy = pytest.importorskip("numpy")
+
+    result = numbers.int_word_many(
+        numpy.array([100, 1200000, 999999999]), exact=True
+    )
+
+    assert result == ["100", "1.2 million", "1.0 billion"]
+
+
 @pytest.mark.parametrize(
     "params, expected",
     [
@@ -80,6 +179,11 @@ def test_ap_number(params: int, expected: str) -> None:
         (5 / 6.0, "5/6"),  # simple fraction
         (8.9, "8 9/10"),  # compound fraction
         ("8.9", "8 9/10"),  # string fraction
+        (-1.3, "-1 -3/10"),  # negative compound fraction
+        (0.9999999, "1/1"),  # rounded up to a whole number
+        (0.0004, "0/1"),  # rounded down to zero
+        (0.75, "3/4"),  # fraction above one half
+        (1e20, "100000000000000000000"),  # float without fraction
     ],
 )
 def test_fractional(params: int, expected: str) -> None:
@@ -87,6 +191,30 @@ def test_fractional(params: int, expected: str) -> None:
     assert numbers.fractional(params) == expected
 
 
+def test_fractional_same_as_limit_denominator() -> None:
+    """Fractions are the ones Fraction.limit_denominator finds."""
+    random = Random(0)
+    values = [random.uniform(-1, 1) for _ in range(10_000)]
+    # around fractions of large denominators, where neighbours are closest
+    values += [n / 997 + e for n in range(-997, 998) for e in (-1e-9, 0, 1e-9)]
+
+    for value in values:
+        fraction = Fraction(value).limit_denominator(1000)
+        assert numbers._limit_denominator(value) == (
+            fraction.numerator,
+            fraction.denominator,
+        )
+
+
+def test_fractional_many() -> None:
+    """Fractional of many numbers."""
+    values: list[str | float] = [1, 2.0, 5 / 6.0, "8.9", -0.25]
+
+    assert numbers.fractional_many(values) == [
+        numbers.fractional(value) for value in values
+    ]
+
+
 @pytest.mark.parametrize(
     "params, expected",
     [
@@ -98,6 +226,16 @@ def test_fractional(params: int, expected: str) -> None:
         (5781651000, "5.78 x 10⁹"),  # smaller precision
         (10**30, "1.00 x 10³⁰"),  # big number
         (-(10**30), "1.00 x 10⁻³⁰"),  # big negative number
+        (-0.3, "3.00 x 10⁻⁻¹"),  # negative number between 0 and 1
+        (1e-5, "1.00 x 10⁻⁵"),  # float written with an exponent
+        (1.2345e-5, "1.23 x 10⁻⁵"),
+        (-1e-5, "1.00 x 10⁻⁵"),
+        (1e-4, "1.00 x 10⁻⁴"),  # smallest float written without exponent
+        (0.0, "0.00 x 10⁰"),  # zero
+        (-0.0, "0.00 x 10⁻⁰"),  # negative zero
+        (1e100, "1.00 x 10¹⁰⁰"),  # three digits exponent
+        (True, "1.00 x 10⁰"),  # bool
+        ("-1e-7", "1.00 x 10⁻⁷"),  # string with exponent
     ],
 )
 def test_scientific_notation(params: float | str, expected: str) -> None:
@@ -136,3 +274,22 @@ def test_scientific_notation_with_precision(
 ) -> None:
     """Scientific notation tests with specified precision."""
     assert numbers.scientific_notation(*params) == expected
+
+
+def test_scientific_notation_many() -> None:
+    """Scientific notation of many numbers."""
+    values: list[float | str] = [1000, "1000", -1000, 0.3, -0.3, 1e-5, 10**30]
+
+    assert numbers.scientific_notation_many(values, 1) == [
+        numbers.scientific_notation(value, 1) for value in values
+    ]
+
+
+def test_scientific_notation_many_numpy() -> None:
+    """Scientific notation of NumPy arrays."""
+    numpy = pytest.importorskip("numpy")
+    values = [1000.0, -1000.0, 0.3, -0.3, 1e-5, 5781651000.0]
+
+    result = numbers.scientific_notation_many(numpy.array(values), 4)
+
+    assert result == [numbers.scientific_notation(v, 4) for v in values]
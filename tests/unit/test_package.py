@@ -0,0 +1,44 @@
+"""Tests for package lazy imports."""
+
+import subprocess
+import sys
+
+import pytest
+
+import human_readable
+
+
+def test_dir() -> None:
+    """Public names are listed before being imported."""
+    names = dir(human_readable)
+
+    assert set(human_readable.__all__) <= set(names)
+    assert "times" in names
+
+
+def test_unknown_attribute() -> None:
+    """Unknown names raise AttributeError."""
+    with pytest.raises(AttributeError, match="has no attribute 'nothing'"):
+        human_readable.nothing  # type: ignore[attr-defined]  # noqa: B018
+
+
+def test_submodule_attribute(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Submodules are reachable as attributes before being imported."""
+    import human_readable.times as times
+
+    monkeypatch.delattr(human_readable, "times")
+
+    assert human_readable.times is times
+
+
+def test_import_is_lazy() -> None:
+    """Importing the package does not import its submodules."""
+    code = (
+        "import sys, human_readable\n"
+        "assert not [m for m in sys.modules if m.startswith('human_readable.')]\n"
+        "human_readable.file_size(1)\n"
+        "assert 'human_readable.times' not in sys.modules\n"
+        "assert 'decimal' not in sys.modules\n"
+    )
+
+    subprocess.run([sys.executable, "-c", code], check=True)  # noqa: S603
@@ -0,0 +1,165 @@
+"""Tests for live relative time labels."""
+
+from __future__ import annotations
+
+import datetime as dt
+
+import freezegun
+import pytest
+
+import human_readable.times as times
+from human_readable.ticker import RelativeTimeTicker
+
+
+NOW = dt.datetime(2020, 2, 2, 12, 0, 0)
+
+
+def test_add() -> None:
+    """It returns and keeps the label of the registered datetime."""
+    ticker = RelativeTimeTicker()
+
+    label = ticker.add("a", NOW - dt.timedelta(minutes=5), now=NOW)
+
+    assert label == "5 minutes ago"
+    assert ticker["a"] == "5 minutes ago"
+    assert "a" in ticker
+    assert len(ticker) == 1
+
+
+def test_add_replaces() -> None:
+    """Adding a key again replaces its datetime."""
+    ticker = RelativeTimeTicker()
+    ticker.add("a", NOW - dt.timedelta(minutes=5), now=NOW)
+
+    ticker.add("a", NOW - dt.timedelta(days=3), now=NOW)
+
+    assert ticker["a"] == "3 days ago"
+    assert ticker.tick(NOW + dt.timedelta(hours=1)) == []
+    assert len(ticker) == 1
+
+
+def test_tick_only_changed() -> None:
+    """Only labels whose text changed are returned."""
+    ticker = RelativeTimeTicker()
+    ticker.add("seconds", NOW - dt.timedelta(seconds=30), now=NOW)
+    ticker.add("minutes", NOW - dt.timedelta(minutes=5, seconds=10), now=NOW)
+    ticker.add("future", NOW + dt.timedelta(hours=3, minutes=10), now=NOW)
+    ticker.add("years", NOW - dt.timedelta(days=900), now=NOW)
+
+    assert ticker.tick(NOW + dt.timedelta(microseconds=999_999)) == []
+    assert ticker.tick(NOW + dt.timedelta(seconds=1)) == [
+        ("seconds", "31 seconds ago")
+    ]
+    assert ticker.tick(NOW + dt.timedelta(seconds=50)) == [
+        ("seconds", "a minute ago"),
+        ("minutes", "6 minutes ago"),
+    ]
+    assert ticker.tick(NOW + dt.timedelta(minutes=11)) == [
+        ("seconds", "11 minutes ago"),
+        ("minutes", "16 minutes ago"),
+        ("future", "2 hours from now"),
+    ]
+    assert ticker["years"] == "2 years ago"
+
+
+def test_tick_matches_date_time() -> None:
+    """Labels stay equal to date_time at every tick."""
+    ticker = RelativeTimeTicker()
+    values = {i: NOW - dt.timedelta(seconds=7**i) for i in range(-3, 12)}
+    values.update({-i: NOW + dt.timedelta(seconds=5**i) for i in range(1, 12)})
+    for key, value in values.items():
+        ticker.add(key, value, now=NOW)
+
+    for step in range(60):
+        now = NOW + dt.timedelta(seconds=1.5**step)
+        ticker.tick(now)
+        for key, value in values.items():
+            assert ticker[key] == times.date_time(value, when=now)
+
+
+def test_remove() -> None:
+    """Removed keys are not returned by tick."""
+    ticker = RelativeTimeTicker()
+    ticker.add("a", NOW - dt.timedelta(seconds=30), now=NOW)
+    ticker.add("b", NOW - dt.timedelta(seconds=30), now=NOW)
+
+    ticker.remove("a")
+
+    assert "a" not in ticker
+    assert ticker.tick(NOW + dt.timedelta(seconds=1)) == [
+        ("b", "31 seconds ago")
+    ]
+    with pytest.raises(KeyError):
+        ticker.remove("a")
+
+
+def test_remove_compacts() -> None:
+    """Stale heap items of removed keys are dropped."""
+    ticker = RelativeTimeTicker()
+    for i in range(1000):
+        ticker.add(i, NOW - dt.timedelta(seconds=i), now=NOW)
+
+    for i in range(900):
+        ticker.remove(i)
+
+    assert len(ticker._heap) < 300
+    assert sorted(ticker.tick(NOW + dt.timedelta(days=1))) == [
+        (i, "a day ago") for i in range(900, 1000)
+    ]
+
+
+def test_add_compacts() -> None:
+    """Stale heap items of replaced keys are dropped."""
+    ticker = RelativeTimeTicker()
+    value = NOW - dt.timedelta(days=800)
+
+    for _ in range(1000):
+        ticker.add("a", value, now=NOW)
+
+    assert len(ticker) == 1
+    assert len(ticker._heap) < 100
+    assert ticker.next_tick() is not None
+
+
+def test_next_tick() -> None:
+    """It returns the instant of the next change of a label."""
+    ticker = RelativeTimeTicker()
+    assert ticker.next_tick() is None
+
+    ticker.add("a", NOW - dt.timedelta(minutes=5, seconds=10), now=NOW)
+    ticker.add("b", NOW - dt.timedelta(seconds=30), now=NOW)
+    assert ticker.next_tick() == NOW + dt.timedelta(seconds=1)
+
+    ticker.remove("b")
+    assert ticker.next_tick() == NOW + dt.timedelta(seconds=50)
+
+    ticker.remove("a")
+    assert ticker.next_tick() is None
+
+
+def test_options() -> None:
+    """Labels use the options of the ticker."""
+    ticker = RelativeTimeTicker(use_months=False, minimum_unit="milliseconds")
+
+    assert ticker.add("a", NOW - dt.timedelta(days=65), now=NOW) == (
+        "65 days ago"
+    )
+    assert ticker.add("b", NOW - dt.timedelta(milliseconds=5), now=NOW) == (
+        "5 milliseconds ago"
+    )
+
+
+def test_minimum_unit_not_supported() -> None:
+    """It raises ValueError."""
+    with pytest.raises(ValueError):
+        RelativeTimeTicker(minimum_unit="years")
+
+
+@freezegun.freeze_time("2020-02-02 12:00:00")
+def test_current_time() -> None:
+    """It defaults to the current time."""
+    ticker = RelativeTimeTicker()
+    ticker.add("a", NOW - dt.timedelta(seconds=59, microseconds=500_000))
+
+    with freezegun.freeze_time("2020-02-02 12:00:01"):
+        assert ticker.tick() == [("a", "a minute ago")]
@@ -127,6 +127,17 @@ def test_timing_informal(time: dt.time, expected: str) -> None:
     assert result == expected
 
 
+def test_timing_clock_words_built_once() -> None:
+    """Tests timing reuses the clock words of the active catalog."""
+    times._clock_words.cache_clear()
+
+    times.timing(dt.time(1, 5, 0))
+    times.timing(dt.time(22, 40, 0), formal=False)
+
+    info = times._clock_words.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+
+
 @pytest.mark.parametrize(
     "value, expected",
     [
@@ -254,6 +265,229 @@ def test_time_delta_high_minimum_unit() -> None:
         times.time_delta(1, minimum_unit="years")
 
 
+@pytest.mark.parametrize("use_months", [True, False])
+@pytest.mark.parametrize(
+    "minimum_unit", ["seconds", "milliseconds", "microseconds"]
+)
+@pytest.mark.parametrize(
+    "microseconds",
+    [
+        sign * 7**i + offset
+        for i in range(19)
+        for sign in (1, -1)
+        for offset in (-1, 0, 1)
+    ],
+)
+def test_date_time_and_next_change(
+    microseconds: int, use_months: bool, minimum_unit: str
+) -> None:
+    """The text is kept until the returned datetime, which changes it."""
+    value = NOW - dt.timedelta(microseconds=microseconds)
+
+    text, change = times.date_time_and_next_change(
+        value, use_months, minimum_unit, when=NOW
+    )
+
+    assert change > NOW
+    assert text == times.date_time(
+        value, use_months=use_months, minimum_unit=minimum_unit, when=NOW
+    )
+    before = change - dt.timedelta(microseconds=1)
+    assert text == times.date_time(
+        value, use_months=use_months, minimum_unit=minimum_unit, when=before
+    )
+    assert text != times.date_time(
+        value, use_months=use_months, minimum_unit=minimum_unit, when=change
+    )
+
+
+@freezegun.freeze_time("2020-02-02")
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        (NOW, ("now", NOW + dt.timedelta(seconds=1))),
+        (
+            NOW + dt.timedelta(milliseconds=300),
+            ("now", NOW + dt.timedelta(seconds=1, milliseconds=300)),
+        ),
+        (
+            NOW - dt.timedelta(minutes=5, seconds=10),
+            ("5 minutes ago", NOW + dt.timedelta(seconds=50)),
+        ),
+        (
+            NOW + dt.timedelta(hours=3, minutes=10),
+            (
+                "3 hours from now",
+                NOW + dt.timedelta(minutes=10, microseconds=1),
+            ),
+        ),
+    ],
+)
+def test_date_time_and_next_change_now(
+    value: dt.datetime, expected: tuple[str, dt.datetime]
+) -> None:
+    """It defaults to the current time."""
+    assert times.date_time_and_next_change(value) == expected
+
+
+def test_frozen_now() -> None:
+    """Functions use the snapshot instead of the clock inside the block."""
+    snapshot = dt.datetime(2020, 2, 2, 12, 0, 0)
+
+    with times.frozen_now(snapshot) as now:
+        assert now == snapshot
+        assert times.date_time(snapshot - dt.timedelta(minutes=2)) == (
+            "2 minutes ago"
+        )
+        assert times.time_delta(snapshot + dt.timedelta(days=3)) == "3 days"
+        assert times.day(dt.date(2020, 2, 3)) == "tomorrow"
+        assert times.date(dt.date(2020, 1, 15)) == "Jan 15"
+        assert times.year(dt.date(2021, 1, 1)) == "next year"
+
+    assert times._FROZEN_NOW.get() is None
+
+
+def test_frozen_now_nested() -> None:
+    """Nested blocks keep the outer snapshot unless given one."""
+    outer = dt.datetime(2020, 2, 2, 12, 0, 0)
+    inner = dt.datetime(2021, 2, 2, 12, 0, 0)
+
+    with times.frozen_now(outer):
+        with times.frozen_now() as now:
+            assert now == outer
+        with times.frozen_now(inner) as now:
+            assert times._now() == inner
+        assert times._now() == outer
+
+
+@freezegun.freeze_time("2020-02-02")
+def test_frozen_now_current_time() -> None:
+    """The snapshot defaults to the current time."""
+    with times.frozen_now() as now:
+        assert now == NOW
+        assert times.day(dt.date(2020, 2, 1)) == "yesterday"
+
+
+def test_time_delta_cache() -> None:
+    """Values in the same bucket share one cached text."""
+    times.time_delta_cache_clear()
+
+    times.time_delta(dt.timedelta(minutes=5, seconds=1))
+    times.time_delta(dt.timedelta(minutes=5, seconds=59))
+    times.time_delta(dt.timedelta(days=-3))
+    times.date_time(dt.timedelta(minutes=5, seconds=30))
+
+    info = times.time_delta_cache_info()
+    assert (info.hits, info.misses, info.currsize) == (2, 2, 2)
+
+    times.time_delta_cache_clear()
+
+    info = times.time_delta_cache_info()
+    assert (info.hits, info.misses, info.currsize) == (0, 0, 0)
+
+
+DELTAS = [
+    dt.timedelta(microseconds=sign * 13**i)
+    for i in range(15)
+    for sign in (1, -1)
+] + [0, 1, -1, 59, 3600, -86400, 86400 * 400, 86400 * 800]
+
+
+@pytest.mark.parametrize("use_months", [True, False])
+@pytest.mark.parametrize("minimum_unit", ["seconds", "microseconds"])
+def test_time_delta_many(use_months: bool, minimum_unit: str) -> None:
+    """Time delta of many values matches time_delta of each one."""
+    expected = [
+        times.time_delta(value, use_months, minimum_unit) for value in DELTAS
+    ]
+
+    assert times.time_delta_many(DELTAS, use_months, minimum_unit) == expected
+
+
+@freezegun.freeze_time("2020-02-02")
+def test_time_delta_many_datetimes() -> None:
+    """Datetimes are compared to the same point in time."""
+    values = [NOW - dt.timedelta(days=3), NOW + dt.timedelta(minutes=2)]
+
+    assert times.time_delta_many(values) == ["3 days", "2 minutes"]
+    assert times.time_delta_many(values, when=NOW + dt.timedelta(days=3)) == [
+        "6 days",
+        "2 days",
+    ]
+
+
+@pytest.mark.parametrize("use_months", [True, False])
+@pytest.mark.parametrize("minimum_unit", ["seconds", "microseconds"])
+def test_time_delta_many_numpy_timedelta64(
+    use_months: bool, minimum_unit: str
+) -> None:
+    """Time delta of many values from a NumPy timedelta64 array."""
+    numpy = pytest.importorskip("numpy")
+    deltas = [value for value in DELTAS if isinstance(value, dt.timedelta)]
+    expected = [
+        times.time_delta(value, use_months, minimum_unit) for value in deltas
+    ]
+
+    result = times.time_delta_many(
+        numpy.array(deltas, dtype="timedelta64[us]"), use_months, minimum_unit
+    )
+
+    assert result == expected
+
+
+def test_time_delta_many_numpy_seconds() -> None:
+    """Time delta of many values from a NumPy array of seconds."""
+    numpy = pytest.importorskip("numpy")
+    seconds = [0, 1, -1, 59, 3600, -86400, 86400 * 400, 86400 * 800]
+
+    result = times.time_delta_many(numpy.array(seconds, dtype="int64"))
+
+    assert result == [times.time_delta(value) for value in seconds]
+
+
+def test_time_delta_many_numpy_float_seconds() -> None:
+    """Fractions of seconds of a NumPy float array are not truncated."""
+    numpy = pytest.importorskip("numpy")
+    seconds = [0.5, 1.25, -59.9999996, 3600.75]
+    deltas = [dt.timedelta(seconds=value) for value in seconds]
+
+    result = times.time_delta_many(
+        numpy.array(seconds), minimum_unit="milliseconds"
+    )
+
+    assert result == [
+        times.time_delta(value, minimum_unit="milliseconds") for value in deltas
+    ]
+
+
+@freezegun.freeze_time("2020-02-02")
+def test_time_delta_many_numpy_datetime64() -> None:
+    """Datetimes of a NumPy array are compared to the same point in time."""
+    numpy = pytest.importorskip("numpy")
+    values = [NOW - dt.timedelta(days=3), NOW + dt.timedelta(minutes=2)]
+    array = numpy.array(values, dtype="datetime64[s]")
+
+    assert times.time_delta_many(array) == times.time_delta_many(values)
+    assert times.time_delta_many(array, when=NOW + dt.timedelta(days=3)) == [
+        "6 days",
+        "2 days",
+    ]
+
+
+def test_time_delta_many_numpy_unsupported() -> None:
+    """Arrays of anything else raise TypeError."""
+    numpy = pytest.importorskip("numpy")
+
+    with pytest.raises(TypeError, match="unsupported array of <U"):
+        times.time_delta_many(numpy.array(["1 day"]))
+
+
+def test_time_delta_many_high_minimum_unit() -> None:
+    """It raises ValueError."""
+    with pytest.raises(ValueError):
+        times.time_delta_many([1], minimum_unit="years")
+
+
 @freezegun.freeze_time("2020-02-02")
 @pytest.mark.parametrize(
     "value, expected",
@@ -670,6 +904,89 @@ def test_precise_delta_suppress_minimum_unit() -> None:
         times.precise_delta(1, minimum_unit="years", suppress=["years"])
 
 
+def test_precise_delta_plan_reused() -> None:
+    """It parses the same options only once."""
+    times._precise_delta_plan.cache_clear()
+    delta = dt.timedelta(days=2, seconds=3633)
+
+    assert (
+        times.precise_delta(delta, suppress=["days"])
+        == "49 hours and 33 seconds"
+    )
+    assert times.precise_delta(delta * 2, suppress=["days"]) == (
+        "98 hours, 1 minute and 6 seconds"
+    )
+
+    info = times._precise_delta_plan.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("a moment", dt.timedelta()),
+        ("an hour", dt.timedelta(hours=1)),
+        ("42 seconds", dt.timedelta(seconds=42)),
+        (" 1 second\n", dt.timedelta(seconds=1)),
+        ("3 months", dt.timedelta(days=91.5)),
+        ("1 year, 1 month", dt.timedelta(days=395.5)),
+        ("1 year, 4 days", dt.timedelta(days=369)),
+        ("1 year, 3 hours", dt.timedelta(days=365, hours=3)),
+        ("2 years", dt.timedelta(days=730)),
+        ("1.50 minutes", dt.timedelta(seconds=90)),
+        ("49 hours and 33 seconds", dt.timedelta(hours=49, seconds=33)),
+        (
+            "2 days, 1 hour, 33 seconds and 123 milliseconds",
+            dt.timedelta(days=2, seconds=3633, milliseconds=123),
+        ),
+        ("5 microseconds", dt.timedelta(microseconds=5)),
+    ],
+)
+def test_parse_delta(value: str, expected: dt.timedelta) -> None:
+    """It reads texts of precise_delta and time_delta."""
+    assert times.parse_delta(value) == expected
+
+
+@pytest.mark.parametrize(
+    "seconds", [0, 1, 59, 61, 3600, 3633, 86399, 86400, 2 * 86400 + 3633]
+)
+@pytest.mark.parametrize("minimum_unit", ["seconds", "microseconds"])
+def test_parse_delta_round_trip(seconds: int, minimum_unit: str) -> None:
+    """Texts of precise_delta under a month are read back."""
+    delta = dt.timedelta(seconds=seconds, milliseconds=seconds % 7)
+
+    text = times.precise_delta(delta, minimum_unit=minimum_unit)
+
+    # seconds are written with two decimals
+    assert abs(times.parse_delta(text) - delta) <= dt.timedelta(milliseconds=5)
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "",
+        "seconds",
+        "2 days 1 hour",
+        "2 days and",
+        "about 2 days",
+        "2 days, 1 hour, ",
+        "2 fortnights",
+        "2 dayss",
+        "2 days and 3 days",
+        "1 second and 2 minutes",
+        "1 year, 3 days and 2 years",
+        "an hour and 5 seconds",
+        "5 seconds and an hour",
+        "1 seconds",
+        "3 day",
+    ],
+)
+def test_parse_delta_invalid(value: str) -> None:
+    """It raises ValueError for anything else."""
+    with pytest.raises(ValueError, match="invalid time delta"):
+        times.parse_delta(value)
+
+
 def test_unit_lt() -> None:
     """It compares two units."""
     years, minutes = times.Unit["YEARS"], times.Unit["MINUTES"]